@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# 진료내역 SSE(/api/services/stream)는 스레드를 점유하지 않도록 Django 밖에서 처리
+from iamdt_api.stream import ServiceStreamApp  # noqa: E402 (앱 로딩 이후)
+
+application = ServiceStreamApp(django_application)
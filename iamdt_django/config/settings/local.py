@@ -47,6 +47,10 @@ ALLOWED_HOSTS = ["*"]
 
 AUTH_USER_MODEL = "iamdt.User"
 
+# 세션 유저 조회는 프로세스별 LRU 유저 캐시(iamdt_util.auth)
+AUTHENTICATION_BACKENDS = ["iamdt_util.auth.CachedModelBackend"]
+AUTH_USER_CACHE_SIZE = 1000
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -68,6 +72,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "iamdt_util.metrics.MetricsMiddleware",  # 요청 지표(/metrics), 가장 바깥쪽
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -76,6 +81,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "silk.middleware.SilkyMiddleware",  # django-silk
+    "iamdt_util.query_budget.QueryBudgetMiddleware",  # N+1/쿼리 예산, silk 안쪽
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -163,6 +169,8 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         # 'rest_framework.authentication.BasicAuthentication',
         "rest_framework.authentication.SessionAuthentication",
+        # Authorization: Bearer <access> (세션/유저 조회 없는 서명 토큰)
+        "iamdt_api.authentication.SignedTokenAuthentication",
         # 'rest_framework.authentication.TokenAuthentication',
     ],
     "DEFAULT_RENDERER_CLASSES": [
@@ -184,6 +192,13 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# 서명 토큰 인증(iamdt_api.authentication)
+API_TOKEN = {
+    "ACCESS_LIFETIME": 300,
+    "REFRESH_LIFETIME": 86400,
+    "DENYLIST_SIZE": 10000,
+}
+
 # drf-spectacular
 SPECTACULAR_SETTINGS = {
     "TITLE": "IAMDT_TEST",
@@ -203,6 +218,66 @@ SPECTACULAR_SETTINGS = {
         "displayOperationId": True,
     },
 }
+# 미리 생성한 스키마(manage.py build_schema, iamdt_api.schema)
+# 생성된 스키마가 있으면 /api/doc/scheme 은 요청마다 생성하지 않고 파일을 응답한다.(DEBUG 제외)
+API_SCHEMA = {
+    "DIR": ROOT_DIR / "schema",
+    "MAX_AGE": 60 * 60 * 24 * 365,
+    "KEEP": 3,
+}
+# 진료내역 내보내기 스트리밍(/api/exports/services, iamdt_api.export)
+SERVICE_EXPORT = {
+    "CHUNK_SIZE": 2000,  # QuerySet.iterator 한번에 읽는 행 수
+    "FLUSH_ROWS": 100,  # 모아서 응답에 쓰는 행 수
+}
+
+# 캐시
+# "api": 리스트 API 응답 캐시(iamdt_api.cache)
+# 여러 프로세스로 실행하는 경우 파일 캐시를 사용해야 무효화(모델 버전)가 공유된다.(production 설정)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "api": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "iamdt-api",
+        "TIMEOUT": 600,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+}
+API_CACHE_ALIAS = "api"
+
+# 세션은 캐시에서 읽고 저장시 캐시와 DB에 함께 쓴다(iamdt_util.session)
+# 여러 프로세스로 실행하는 경우 SESSION_CACHE_ALIAS 는 공유 캐시를 사용해야
+# 로그아웃/유저 변경이 다른 프로세스에도 반영된다.
+SESSION_ENGINE = "iamdt_util.session"
+SESSION_CACHE_ALIAS = "default"
+
+# 고객/환자/스태프 검색 백엔드
+# "fts5": SQLite FTS5 n-gram 검색 인덱스, "icontains": 기존 LIKE 검색
+SEARCH_BACKEND = "fts5"
+
+# 직원 알림 메신저 발송 설정(iamdt_util.messenger)
+# 메신저 종류(User.MessengerType): {"TOKEN", "ENDPOINT", "CONCURRENCY", "RETRIES", "BACKOFF", "TIMEOUT"}
+# 설정되지 않은 메신저는 발송하지 않고 로그만 남긴다.
+MESSENGER_DISPATCHERS = CONFIG_OBJ.get("MESSENGER_DISPATCHERS", {})
+
+# 요청 지표(iamdt_util.metrics)
+# 여러 worker로 실행하는 경우 DIR(METRICS_DIR 환경변수)을 지정하고 서버 시작 전에 비운다.
+# 리버스 프록시 뒤에서는 ALLOWED_IPS 가 적용되지 않으므로 수집기는 TOKEN(METRICS_TOKEN 환경변수)을 사용한다.
+METRICS = {
+    "DIR": os.environ.get("METRICS_DIR"),
+    "ALLOWED_IPS": ["127.0.0.1", "::1"],
+    "TOKEN": os.environ.get("METRICS_TOKEN"),
+}
+
+# N+1 쿼리 탐지/뷰별 쿼리 예산(iamdt_util.query_budget)
+# 위반은 WARNING 로그. 테스트(QueryBudgetTestRunner)에서는 예외로 테스트가 실패한다.
+QUERY_BUDGET = {
+    "REPEAT_THRESHOLD": 3,
+    "RAISE": False,
+}
+TEST_RUNNER = "iamdt_util.query_budget.QueryBudgetTestRunner"
 
 # django-silk
 SILKY_PYTHON_PROFILER = True
@@ -244,6 +319,10 @@ LOGGING = {
         "iamdt_util.notification": {
             "handlers": ["console", "notification_file"],
             "level": "INFO",
-        }
+        },
+        "iamdt_util.query_budget": {
+            "handlers": ["console"],
+            "level": "WARNING",
+        },
     },
 }
@@ -0,0 +1,88 @@
+"""
+운영 환경 설정
+
+local 설정을 기본으로 운영에 필요한 부분만 변경한다.
+DJANGO_SETTINGS_MODULE=config.settings.production 으로 실행한다.
+
+- DEBUG 비활성화
+- HTTPS(리다이렉트, HSTS, secure 쿠키)
+- 템플릿 캐시 로더
+- DB 커넥션 유지(CONN_MAX_AGE)
+- worker 프로세스가 공유하는 파일 캐시(API 응답/모델 버전, 세션/유저 수정 시각)
+- silk(모든 요청 cProfile) 대신 샘플링 프로파일러(iamdt_util.profiling)
+- 개발용 앱(silk, django_extensions) 제외(시작 비용은 manage.py importtime_report 로 확인)
+"""
+
+import copy
+
+from .local import *
+
+DEBUG = False
+
+ALLOWED_HOSTS = CONFIG_OBJ.get("ALLOWED_HOSTS", ["localhost", "127.0.0.1"])
+
+# HTTPS
+# 리버스 프록시(nginx)에서 TLS를 처리하고 X-Forwarded-Proto 헤더를 설정해야 한다.
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+SECURE_SSL_REDIRECT = True
+SECURE_HSTS_SECONDS = CONFIG_OBJ.get("SECURE_HSTS_SECONDS", 60 * 60 * 24 * 30)
+SECURE_HSTS_INCLUDE_SUBDOMAINS = True
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
+
+# 개발용 앱 제외
+# drf_spectacular 는 문서 화면 템플릿(app 디렉토리)을 사용하므로 유지한다.(ready 에서 checks만 import)
+DEV_APPS = ["silk", "django_extensions"]
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in DEV_APPS]
+MIDDLEWARE = [
+    # 전체 처리시간을 측정하도록 가장 바깥쪽
+    "iamdt_util.profiling.SamplingProfilerMiddleware",
+] + [middleware for middleware in MIDDLEWARE if not middleware.startswith("silk.")]
+
+# 템플릿 캐시 로더(loaders 지정시 APP_DIRS는 사용할 수 없다)
+# local 설정 객체가 변경되지 않도록 복사 후 수정
+TEMPLATES = copy.deepcopy(TEMPLATES)
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
+
+# 요청마다 DB 연결하지 않고 60초간 유지
+DATABASES = copy.deepcopy(DATABASES)
+DATABASES["default"]["CONN_MAX_AGE"] = 60
+
+# 캐시
+# worker 프로세스마다 LocMemCache 를 사용하면 다른 worker 의 저장/삭제(모델 버전 증가)가
+# 반영되지 않으므로 API 응답 캐시는 같은 디렉토리의 파일 캐시를 공유한다.
+CACHE_DIR = Path(CONFIG_OBJ.get("CACHE_DIR", BASE_DIR / "cache"))
+CACHES = copy.deepcopy(CACHES)
+CACHES["api"] = {
+    "BACKEND": "iamdt_util.cache.LRUFileBasedCache",
+    "LOCATION": CACHE_DIR / "api",
+    "TIMEOUT": 600,
+    "OPTIONS": {"MAX_ENTRIES": 1000},
+}
+# 세션과 유저 수정 시각(iamdt_util.auth)도 공유해야 로그아웃/유저 수정이 모든 worker 에 반영된다.
+# 세션 캐시 만료는 세션 만료를 따르고 밀려난 세션은 DB(django_session)에서 다시 읽는다.
+CACHES["sessions"] = {
+    "BACKEND": "iamdt_util.cache.LRUFileBasedCache",
+    "LOCATION": CACHE_DIR / "sessions",
+    "OPTIONS": {"MAX_ENTRIES": 10000},
+}
+SESSION_CACHE_ALIAS = "sessions"
+
+# 샘플링 프로파일러
+# 요청의 RATE 비율과 SLOW_MS 이상 걸린 요청의 스택 샘플을 BUFFER_SIZE 만큼 보관한다.
+SAMPLING_PROFILER = {
+    "RATE": 0.01,
+    "SLOW_MS": 500,
+    "INTERVAL": 0.005,
+    "BUFFER_SIZE": 100,
+    "TOP": 20,
+}
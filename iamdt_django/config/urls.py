@@ -13,16 +13,20 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+
 from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
 from iamdt import views
+from iamdt_util.metrics import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API
     path("api/", include("iamdt_api.urls")),
+    # 요청 지표(Prometheus)
+    path("metrics", metrics_view, name="metrics"),
     # index
     path("", views.index, name="index"),
 ]
@@ -10,6 +10,10 @@ from iamdt.models import (
     MedicalRegister,
     MedicalService,
     MedicalStaff,
+    StaffNotification,
+    ChangeLog,
+    StaffAssignment,
+    StaffWorkload,
 )
 
 
@@ -101,3 +105,31 @@ class MedicalServiceAdmin(admin.ModelAdmin):
 class MedicalStaffAdmin(admin.ModelAdmin):
     list_display = ("detail", "staff", "created_at")
     readonly_fields = ("created_at",)
+
+
+@admin.register(StaffNotification)
+class StaffNotificationAdmin(admin.ModelAdmin):
+    list_display = ("service", "staff", "action", "created_at", "sent_at", "attempts")
+    list_select_related = ("staff", "service__register__patient__companion")
+    readonly_fields = ("created_at",)
+
+
+@admin.register(ChangeLog)
+class ChangeLogAdmin(admin.ModelAdmin):
+    list_display = ("id", "model", "object_id", "action", "created_at")
+    list_filter = ("model", "action")
+    readonly_fields = ("created_at",)
+
+
+@admin.register(StaffAssignment)
+class StaffAssignmentAdmin(admin.ModelAdmin):
+    list_display = ("staff", "register", "last_assigned_at", "active")
+    list_filter = ("active",)
+    list_select_related = ("staff", "register__patient__companion")
+
+
+@admin.register(StaffWorkload)
+class StaffWorkloadAdmin(admin.ModelAdmin):
+    list_display = ("staff", "stage", "waiting")
+    list_filter = ("stage",)
+    list_select_related = ("staff",)
@@ -0,0 +1,49 @@
+"""
+고객/스태프 연락처(숫자) 백필 커맨드
+
+phone_digits 필드 추가 이전에 등록된 데이터를 채운다.
+저장시와 같은 normalize_phone 으로 변환하고 값이 다른 행만 batch 단위로 갱신한다.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from iamdt.models import Customer, User
+from iamdt_util.validators import normalize_phone
+
+
+class Command(BaseCommand):
+    help = "고객/스태프의 연락처에서 숫자만 추출해 phone_digits를 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한번에 갱신하는 행 수"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size 는 1 이상이어야 합니다.")
+
+        with transaction.atomic():
+            for model in (Customer, User):
+                count = self.backfill(model, batch_size)
+                self.stdout.write(f"{model._meta.verbose_name}: {count}건")
+
+        self.stdout.write(self.style.SUCCESS("연락처(숫자)를 갱신했습니다."))
+
+    def backfill(self, model, batch_size: int) -> int:
+        count = 0
+        changed = []
+        rows = model.objects.only("id", "phone", "phone_digits").order_by("id")
+        for row in rows.iterator(chunk_size=batch_size):
+            digits = normalize_phone(row.phone)
+            if row.phone_digits != digits:
+                row.phone_digits = digits
+                changed.append(row)
+            if len(changed) >= batch_size:
+                count += model.objects.bulk_update(changed, ["phone_digits"])
+                changed = []
+        if changed:
+            count += model.objects.bulk_update(changed, ["phone_digits"])
+        return count
@@ -0,0 +1,36 @@
+"""
+진료접수번호(MedicalRegister)의 현재 단계 비정규화 필드 백필 커맨드
+
+기존 데이터 마이그레이션 후 혹은 데이터가 어긋난 경우 실행한다.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from iamdt.models import MedicalRegister, MedicalService
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
+
+
+class Command(BaseCommand):
+    help = "진료접수번호의 최근 진료내역/단계/상태를 진료내역 기준으로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        last = MedicalService.objects.filter(register=OuterRef("pk")).order_by("-id")
+
+        with transaction.atomic():
+            count = MedicalRegister.objects.update(
+                last_service=Subquery(last.values("id")[:1]),
+                last_stage=Coalesce(
+                    Subquery(last.values("stage")[:1]), Value(MedicalStage.REGISTER)
+                ),
+                last_status=Coalesce(
+                    Subquery(last.values("status")[:1]),
+                    Value(MedicalStageStatus.WAIT),
+                ),
+                updated_at=timezone.now(),
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"{count}건의 진료접수번호를 갱신했습니다."))
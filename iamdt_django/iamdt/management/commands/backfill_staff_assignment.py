@@ -0,0 +1,43 @@
+"""
+스태프 담당 진료접수(StaffAssignment) 비정규화 테이블 백필 커맨드
+
+기존 데이터 마이그레이션 후 혹은 데이터가 어긋난 경우 실행한다.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from iamdt.models import MedicalStaff, StaffAssignment
+
+
+class Command(BaseCommand):
+    help = "스태프 담당 진료접수를 진료내역 담당자 기준으로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        rows = (
+            MedicalStaff.objects.values("staff", "detail__register")
+            .annotate(last_assigned_at=Max("created_at"))
+            .order_by()
+        )
+
+        with transaction.atomic():
+            StaffAssignment.objects.all().delete()
+            created = StaffAssignment.objects.bulk_create(
+                (
+                    StaffAssignment(
+                        staff_id=row["staff"],
+                        register_id=row["detail__register"],
+                        last_assigned_at=row["last_assigned_at"],
+                    )
+                    for row in rows.iterator()
+                ),
+                batch_size=1000,
+            )
+            StaffAssignment.sync_active()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(created)}건의 스태프 담당 진료접수를 생성했습니다."
+            )
+        )
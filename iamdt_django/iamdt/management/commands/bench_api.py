@@ -0,0 +1,332 @@
+"""
+API 부하 벤치마크 커맨드
+
+이름이 있는 API 라우트(api:*)의 GET 요청을 Django test client로 동시에 실행하고
+라우트별 응답시간 p50/p95/p99와 요청당 쿼리 수를 JSON 리포트로 저장한다.
+커밋별 리포트를 --compare 로 비교한다.
+
+    python manage.py gen_clinic_data --customers 100000 --visits 3
+    python manage.py bench_api --concurrency 4 --requests 200 --output bench.json
+    python manage.py bench_api --compare bench.json --output bench_new.json
+
+- 요청마다 최근 등록된 객체 100개 중 하나를 경로 파라미터(<int:id>)로 사용한다.
+- 로그아웃(세션 삭제), 문서(스키마 생성)는 제외한다. --route 로 지정하면 실행한다.
+- 고객 발신번호 조회는 최근 고객의 연락처로 요청한다.
+- 응답 캐시 적용 라우트는 캐시 hit 비율(X-Cache)도 기록한다.
+  --no-cache 는 요청마다 쿼리 파라미터를 바꿔 캐시 없이 측정한다.
+- silk가 켜진 설정(local)은 요청마다 silk 기록이 포함되므로
+  DJANGO_SETTINGS_MODULE=config.settings.production 으로 실행한다.
+"""
+
+import itertools
+import json
+import math
+import random
+import subprocess
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.urls import (
+    NoReverseMatch,
+    URLPattern,
+    URLResolver,
+    get_resolver,
+    reverse,
+)
+from django.utils import timezone
+
+from iamdt.models import Customer, MedicalService, Patient
+from iamdt_util.query_budget import QueryInspector
+
+# 기본 실행에서 제외하는 라우트(내보내기는 전체 데이터 스트리밍)
+EXCLUDED_ROUTES = {
+    "api:auth:logout",
+    "api:export:services",
+    "api:doc:scheme",
+    "api:doc:scheme_version",
+    "api:doc:swagger",
+    "api:doc:redoc",
+}
+
+# 경로 파라미터 id 에 사용할 모델(라우트 namespace)
+ROUTE_MODELS = {
+    "customer": Customer.objects.all(),
+    "patient": Patient.objects.all(),
+    "service": MedicalService.objects.all(),
+    "staff": get_user_model().objects.filter(is_staff=True),
+}
+
+SAMPLE_SIZE = 100
+PERCENTILES = (50, 95, 99)
+
+
+def api_routes(patterns=None, namespace="") -> list:
+    """[(라우트 이름, 뷰 클래스), ...]"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    routes = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            prefix = (
+                f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            )
+            routes += api_routes(pattern.url_patterns, prefix)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            name = f"{namespace}{pattern.name}"
+            view_class = getattr(pattern.callback, "view_class", None)
+            if name.startswith("api:") and view_class and hasattr(view_class, "get"):
+                routes.append((name, view_class))
+    return routes
+
+
+def percentile(values: list, p: float) -> float:
+    """nearest-rank 백분위"""
+    values = sorted(values)
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def summarize(values: list) -> dict:
+    return {
+        **{f"p{p}": round(percentile(values, p), 3) for p in PERCENTILES},
+        "mean": round(sum(values) / len(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def clear_silk() -> None:
+    """silk는 다음 요청 전까지 수집 상태를 유지하므로 요청 밖의 쿼리까지 기록한다"""
+    if "silk" in settings.INSTALLED_APPS:
+        from silk.collector import DataCollector
+
+        DataCollector().clear()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+class Command(BaseCommand):
+    help = "API 라우트별 응답시간(p50/p95/p99)과 쿼리 수를 측정해 JSON 리포트로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+        parser.add_argument(
+            "--requests", type=int, default=100, help="라우트별 측정 요청 수"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="라우트별 측정 전 요청 수"
+        )
+        parser.add_argument(
+            "--route",
+            action="append",
+            dest="routes",
+            help="실행할 라우트 이름(여러번 지정 가능). 없으면 전체",
+        )
+        parser.add_argument("--user", help="요청 유저(username). 없으면 첫 슈퍼유저")
+        parser.add_argument("--output", default="bench.json", help="리포트 파일")
+        parser.add_argument("--compare", help="비교할 이전 리포트 파일")
+        parser.add_argument(
+            "--no-cache", action="store_true", help="응답 캐시를 사용하지 않음"
+        )
+        parser.add_argument("--seed", type=int, help="난수 시드")
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency, --requests 는 1 이상이어야 합니다.")
+        if "silk" in settings.INSTALLED_APPS:
+            self.stdout.write(
+                self.style.WARNING(
+                    "silk 기록이 응답시간에 포함됩니다. "
+                    "config.settings.production 설정으로 실행하세요."
+                )
+            )
+
+        routes = dict(api_routes())
+        if options["routes"]:
+            unknown = set(options["routes"]) - routes.keys()
+            if unknown:
+                raise CommandError(f"없는 라우트입니다: {', '.join(sorted(unknown))}")
+            routes = {name: routes[name] for name in options["routes"]}
+        else:
+            routes = {k: v for k, v in routes.items() if k not in EXCLUDED_ROUTES}
+
+        user = self.get_user(options["user"])
+        self.serial = itertools.count()
+        rng = random.Random(options["seed"])
+
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "created_at": timezone.now().isoformat(),
+                "settings": settings.SETTINGS_MODULE,
+                "database": connection.vendor,
+                "concurrency": options["concurrency"],
+                "requests": options["requests"],
+                "rows": {
+                    key: queryset.count() for key, queryset in ROUTE_MODELS.items()
+                },
+            },
+            "routes": {},
+        }
+        # test client 요청의 Host(testserver) 허용
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name in routes:
+                paths = self.sample_paths(name, rng)
+                if not paths:
+                    self.stdout.write(f"{name}: 경로 파라미터로 사용할 데이터 없음")
+                    continue
+                self.run(user, paths, options["warmup"], options)
+                results = self.run(user, paths, options["requests"], options)
+                report["routes"][name] = self.summary(paths[0], results, routes[name])
+                self.write_route(name, report["routes"][name])
+
+        with open(options["output"], "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"리포트 저장: {options['output']}"))
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as f:
+                self.compare(json.load(f), report)
+
+    def get_user(self, username):
+        users = get_user_model().objects.filter(is_active=True)
+        if username:
+            user = users.filter(username=username).first()
+        else:
+            user = users.filter(is_superuser=True).order_by("id").first()
+        if user is None or not user.is_staff:
+            raise CommandError("요청에 사용할 스태프 유저가 없습니다.")
+        return user
+
+    def sample_paths(self, name, rng) -> list:
+        """요청할 경로 목록(경로 파라미터가 있으면 최근 객체 id)"""
+        if name == "api:customer:lookup":
+            phones = Customer.objects.order_by("-id").values_list(
+                "phone_digits", flat=True
+            )[:SAMPLE_SIZE]
+            return [f"{reverse(name)}?phone={phone}" for phone in phones]
+        try:
+            return [reverse(name)]
+        except NoReverseMatch:
+            pass
+
+        queryset = ROUTE_MODELS.get(name.split(":")[1])
+        if queryset is None:
+            return []
+        ids = list(queryset.order_by("-id").values_list("id", flat=True)[:SAMPLE_SIZE])
+        rng.shuffle(ids)
+        return [reverse(name, kwargs={"id": pk}) for pk in ids]
+
+    def run(self, user, paths, count, options) -> list:
+        """count 번 요청. [(응답시간 ms, 쿼리 수, 상태코드, 캐시 여부), ...]"""
+        tasks = [paths[index % len(paths)] for index in range(count)]
+        if options["no_cache"]:
+            # 캐시 키(경로+쿼리)가 요청마다 다르도록(준비 요청 포함)
+            tasks = [
+                f"{path}{'&' if '?' in path else '?'}nocache={next(self.serial)}"
+                for path in tasks
+            ]
+        results = []
+        lock = threading.Lock()
+
+        def worker(chunk, close=True):
+            client = Client(raise_request_exception=False)
+            client.force_login(user)
+            try:
+                for path in chunk:
+                    with QueryInspector() as inspector:
+                        started = time.perf_counter()
+                        response = client.get(path, secure=True)
+                        elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        results.append(
+                            (
+                                elapsed,
+                                inspector.count,
+                                response.status_code,
+                                response.get("X-Cache"),
+                            )
+                        )
+            finally:
+                clear_silk()
+                if close:
+                    connections.close_all()
+
+        concurrency = min(options["concurrency"], len(tasks))
+        chunks = [tasks[index::concurrency] for index in range(concurrency)]
+        if concurrency == 1:
+            worker(chunks[0], close=False)  # 현재 스레드(연결 유지)
+            return results
+
+        threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def summary(self, path, results, view_class) -> dict:
+        latencies = [row[0] for row in results]
+        queries = [row[1] for row in results]
+        caches = Counter(row[3] for row in results if row[3])
+        return {
+            "path": path,
+            "requests": len(results),
+            "status": {
+                str(code): count
+                for code, count in sorted(Counter(row[2] for row in results).items())
+            },
+            "latency_ms": summarize(latencies),
+            "queries": {
+                "p50": percentile(queries, 50),
+                "max": max(queries),
+                "budget": getattr(view_class, "query_budget", None),
+            },
+            "cache_hit_ratio": (
+                round(caches["HIT"] / sum(caches.values()), 3) if caches else None
+            ),
+        }
+
+    def write_route(self, name, row) -> None:
+        latency = row["latency_ms"]
+        self.stdout.write(
+            f"{name:28} p50 {latency['p50']:8.1f}ms  p95 {latency['p95']:8.1f}ms  "
+            f"p99 {latency['p99']:8.1f}ms  queries {row['queries']['max']:3}  "
+            f"status {row['status']}"
+        )
+
+    def compare(self, before, after) -> None:
+        """라우트별 p95/쿼리 수 변화"""
+        self.stdout.write(
+            f"\n비교: {before['meta'].get('commit') or '-'} → "
+            f"{after['meta'].get('commit') or '-'}"
+        )
+        for name, row in after["routes"].items():
+            old = before["routes"].get(name)
+            if old is None:
+                self.stdout.write(f"{name:28} (신규)")
+                continue
+            old_p95, new_p95 = old["latency_ms"]["p95"], row["latency_ms"]["p95"]
+            change = (new_p95 - old_p95) / old_p95 * 100 if old_p95 else 0.0
+            style = self.style.ERROR if change > 10 else self.style.SUCCESS
+            self.stdout.write(
+                style(
+                    f"{name:28} p95 {old_p95:8.1f} → {new_p95:8.1f}ms ({change:+.1f}%)  "
+                    f"queries {old['queries']['max']} → {row['queries']['max']}"
+                )
+            )
@@ -0,0 +1,341 @@
+"""
+시리얼라이저 마이크로 벤치마크 커맨드
+
+iamdt_api 시리얼라이저의 to_representation(응답)과 is_valid(요청 검증)를
+메모리에 올려둔 1~10000건 배치로 실행해
+초당 처리 건수(ops/s), tracemalloc 최대 할당 메모리, 실행된 쿼리 수를 측정한다.
+결과를 JSON 기준(baseline) 파일로 저장하고 --compare 로 이전 결과와 비교한다.
+
+    python manage.py bench_serializers --output bench_serializers.json
+    python manage.py bench_serializers --compare bench_serializers.json --output new.json
+
+- 객체는 DB에서 최근 SAMPLE_SIZE 건을 읽어 배치 크기만큼 반복 사용한다.(gen_clinic_data)
+- 응답은 목록 API처럼 many=True, 요청 검증은 API 요청처럼 1건씩 검증한다.
+- 수정 요청 검증은 기존 객체에 현재 값을 그대로 입력한다.(고유 조건 검증 쿼리 포함)
+- 진료내역 담당자는 미리 읽어둔다(prefetch_related).
+- SimpleStaffField는 담당자 목록 응답/입력(pk 목록) 변환을 따로 측정한다.
+- 쿼리 수, 할당 메모리는 배치 1회 실행 기준
+"""
+
+import json
+import math
+import platform
+import time
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from iamdt.management.commands.bench_api import git_commit
+from iamdt.models import Customer, MedicalRegister, MedicalService, Patient
+from iamdt.models.choices import MedicalStage, MedicalStageStatus, POSSIBLE_STAGES
+from iamdt_api.serializers import (
+    CustomerInfoSerializer,
+    PatientInfoSerializer,
+    SimpleStaffField,
+    StaffInfoSerializer,
+)
+from iamdt_api.serializers.medical_register import MedicalRegisterInfoSerializer
+from iamdt_api.serializers.medical_service import (
+    MedicalServiceAddSerializer,
+    MedicalServiceInfoSerializer,
+)
+from iamdt_util.query_budget import QueryInspector
+
+SAMPLE_SIZE = 100
+DEFAULT_SIZES = "1,100,1000,10000"
+# 기준 대비 ops/s 감소율(%)이 이보다 크면 회귀로 표시
+REGRESSION = 10
+
+
+def cycle(items: list, size: int) -> list:
+    """items 를 반복해 size 건"""
+    return [items[index % len(items)] for index in range(size)]
+
+
+def sample(queryset) -> list:
+    return list(queryset.order_by("-id")[:SAMPLE_SIZE])
+
+
+def represent(serializer_class):
+    """목록 응답(many=True)"""
+
+    def run(batch):
+        return serializer_class(batch, many=True).data
+
+    return run
+
+
+def validate(serializer_class, **kwargs):
+    """(객체, 입력) 1건씩 검증. 검증 통과 건수 반환"""
+
+    def run(batch):
+        return sum(
+            serializer_class(instance, data=data, **kwargs).is_valid()
+            for instance, data in batch
+        )
+
+    return run
+
+
+def staff_sample() -> list:
+    return sample(get_user_model().objects.filter(is_staff=True))
+
+
+def service_add_inputs() -> list:
+    """환자별 마지막 단계에서 이행 가능한 다음 단계 등록 입력"""
+    last = MedicalService.objects.filter(patient=OuterRef("pk")).order_by("-id")
+    patients = sample(
+        Patient.objects.annotate(last_stage=Subquery(last.values("stage")[:1]))
+    )
+    staff = [user.pk for user in staff_sample()[:2]]
+    inputs = []
+    for patient in patients:
+        if patient.last_stage in (None, MedicalStage.DISCHARGE):
+            stage = MedicalStage.REGISTER
+        else:
+            stage = POSSIBLE_STAGES[patient.last_stage][0]
+        inputs.append((None, {"patient": patient.pk, "stage": stage, "staff": staff}))
+    return inputs
+
+
+def service_info_inputs() -> list:
+    """대기중인 진료내역 담당자 변경(현재 담당자 그대로) 입력"""
+    services = sample(
+        MedicalService.objects.filter(status=MedicalStageStatus.WAIT).prefetch_related(
+            "staff"
+        )
+    )
+    return [
+        (service, {"staff": [user.pk for user in service.staff.all()]})
+        for service in services
+    ]
+
+
+def scenarios() -> dict:
+    """{시나리오: {작업: (샘플 로더, 배치 실행 함수)}}"""
+    staff_field = SimpleStaffField(many=True, queryset=get_user_model().objects.all())
+    return {
+        "customer": {
+            "to_representation": (
+                lambda: sample(Customer.objects),
+                represent(CustomerInfoSerializer),
+            ),
+            "is_valid": (
+                lambda: [
+                    (customer, {"name": customer.name, "phone": customer.phone})
+                    for customer in sample(Customer.objects)
+                ],
+                validate(CustomerInfoSerializer),
+            ),
+        },
+        "patient": {
+            "to_representation": (
+                lambda: sample(Patient.objects),
+                represent(PatientInfoSerializer),
+            ),
+            "is_valid": (
+                lambda: [
+                    (patient, {"name": patient.name, "companion": patient.companion_id})
+                    for patient in sample(Patient.objects)
+                ],
+                validate(PatientInfoSerializer),
+            ),
+        },
+        "staff": {
+            "to_representation": (staff_sample, represent(StaffInfoSerializer)),
+            "is_valid": (
+                lambda: [
+                    (
+                        user,
+                        {
+                            "first_name": user.first_name,
+                            "last_name": user.last_name,
+                            "role": user.role,
+                            "phone": user.phone,
+                        },
+                    )
+                    for user in staff_sample()
+                ],
+                validate(StaffInfoSerializer, partial=True),
+            ),
+        },
+        "service_info": {
+            "to_representation": (
+                lambda: sample(MedicalService.objects.prefetch_related("staff")),
+                represent(MedicalServiceInfoSerializer),
+            ),
+            "is_valid": (
+                service_info_inputs,
+                validate(MedicalServiceInfoSerializer, partial=True),
+            ),
+        },
+        "service_add": {
+            "is_valid": (service_add_inputs, validate(MedicalServiceAddSerializer)),
+        },
+        "register": {
+            "to_representation": (
+                lambda: sample(
+                    MedicalRegister.objects.select_related("patient__companion")
+                ),
+                represent(MedicalRegisterInfoSerializer),
+            ),
+        },
+        "simple_staff_field": {
+            "to_representation": (staff_sample, staff_field.to_representation),
+            "is_valid": (
+                lambda: [user.pk for user in staff_sample()],
+                lambda batch: len(staff_field.run_validation(batch)),
+            ),
+        },
+    }
+
+
+def elapsed_per_batch(run, batch, repeat: int, min_time: float) -> float:
+    """배치 1회 실행 시간(초). min_time 이상 반복 실행을 repeat 번 해서 가장 빠른 값"""
+    best = math.inf
+    for _ in range(repeat):
+        number, started = 0, time.perf_counter()
+        while True:
+            run(batch)
+            number += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / number)
+    return best
+
+
+def allocated(run, batch) -> int:
+    """배치 1회 실행 중 최대 할당 메모리(byte)"""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        run(batch)
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+class Command(BaseCommand):
+    help = "시리얼라이저 응답/검증 처리량(ops/s), 할당 메모리, 쿼리 수를 측정해 기준 파일로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default=DEFAULT_SIZES, help="배치 크기 목록(쉼표 구분)"
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="실행할 시나리오(여러번 지정 가능). 없으면 전체",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수")
+        parser.add_argument(
+            "--min-time",
+            type=float,
+            default=0.2,
+            help="측정 1회 최소 실행 시간(초). 작은 배치는 여러번 실행",
+        )
+        parser.add_argument(
+            "--output", default="bench_serializers.json", help="결과(기준) 파일"
+        )
+        parser.add_argument("--compare", help="비교할 기준 파일")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",")]
+        except ValueError:
+            raise CommandError("--sizes 는 쉼표로 구분한 숫자입니다.")
+        if min(sizes) < 1 or options["repeat"] < 1:
+            raise CommandError("--sizes, --repeat 는 1 이상이어야 합니다.")
+
+        targets = scenarios()
+        if options["scenarios"]:
+            unknown = set(options["scenarios"]) - targets.keys()
+            if unknown:
+                raise CommandError(f"없는 시나리오입니다: {', '.join(sorted(unknown))}")
+            targets = {name: targets[name] for name in options["scenarios"]}
+
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "sizes": sizes,
+                "repeat": options["repeat"],
+            },
+            "scenarios": {},
+        }
+        for name, operations in targets.items():
+            for operation, (load, run) in operations.items():
+                items = load()
+                if not items:
+                    self.stdout.write(f"{name}.{operation}: 측정에 사용할 데이터 없음")
+                    continue
+                rows = report["scenarios"].setdefault(name, {})[operation] = {}
+                for size in sizes:
+                    rows[str(size)] = self.measure(run, cycle(items, size), options)
+                    self.write_row(name, operation, size, rows[str(size)])
+
+        with open(options["output"], "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as f:
+                self.compare(json.load(f), report)
+
+    def measure(self, run, batch, options) -> dict:
+        run(batch)  # 준비 실행(지연 초기화, 캐시)
+        with QueryInspector() as inspector:
+            result = run(batch)
+        peak = allocated(run, batch)
+        elapsed = elapsed_per_batch(run, batch, options["repeat"], options["min_time"])
+        row = {
+            "ops_per_sec": round(len(batch) / elapsed),
+            "batch_ms": round(elapsed * 1000, 3),
+            "queries": inspector.count,
+            "alloc_peak_kb": round(peak / 1024, 1),
+        }
+        if isinstance(result, int):
+            row["valid"] = result  # 검증 통과 건수
+        return row
+
+    def write_row(self, name, operation, size, row) -> None:
+        self.stdout.write(
+            f"{name + '.' + operation:38} {size:>6}건  {row['ops_per_sec']:>9} ops/s  "
+            f"queries {row['queries']:>6}  alloc {row['alloc_peak_kb']:>9.1f}KB"
+        )
+
+    def compare(self, before, after) -> None:
+        """ops/s, 쿼리 수 변화. 처리량 감소/쿼리 증가는 회귀로 표시"""
+        self.stdout.write(
+            f"\n비교: {before['meta'].get('commit') or '-'} → "
+            f"{after['meta'].get('commit') or '-'}"
+        )
+        for name, operations in after["scenarios"].items():
+            for operation, rows in operations.items():
+                old_rows = before["scenarios"].get(name, {}).get(operation, {})
+                for size, row in rows.items():
+                    label = f"{name + '.' + operation:38} {size:>6}건"
+                    old = old_rows.get(size)
+                    if old is None:
+                        self.stdout.write(f"{label}  (신규)")
+                        continue
+                    change = (
+                        (row["ops_per_sec"] / old["ops_per_sec"] - 1) * 100
+                        if old["ops_per_sec"]
+                        else 0.0
+                    )
+                    regressed = change < -REGRESSION or row["queries"] > old["queries"]
+                    style = self.style.ERROR if regressed else self.style.SUCCESS
+                    self.stdout.write(
+                        style(
+                            f"{label}  {old['ops_per_sec']:>9} → "
+                            f"{row['ops_per_sec']:>9} ops/s ({change:+.1f}%)  "
+                            f"queries {old['queries']} → {row['queries']}"
+                        )
+                    )
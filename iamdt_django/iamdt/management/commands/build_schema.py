@@ -0,0 +1,39 @@
+"""
+OpenAPI 스키마 생성 커맨드
+
+스키마를 한번 생성해 버전(내용 해시)이 붙은 yaml/json 파일로 저장하고 현재 버전으로 지정한다.
+API 문서(/api/doc/scheme)는 요청마다 생성하지 않고 이 파일을 응답한다.(iamdt_api.schema)
+배포시 코드 변경 후 실행한다. 내용이 같으면 버전도 같다.
+
+    python manage.py build_schema
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from iamdt_api.schema import generate_schema, get_options, write_schema
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마를 생성해 버전 파일로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", help="저장 디렉토리. 없으면 API_SCHEMA['DIR']")
+        parser.add_argument("--keep", type=int, help="보관할 이전 버전 수")
+
+    def handle(self, *args, **options):
+        directory = options["dir"] or get_options()["DIR"]
+        if not directory:
+            raise CommandError(
+                "저장 디렉토리(API_SCHEMA['DIR'] 혹은 --dir)가 없습니다."
+            )
+
+        started = time.perf_counter()
+        version = write_schema(generate_schema(), directory, keep=options["keep"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"스키마 버전 {version} 저장: {directory} "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+        )
@@ -0,0 +1,274 @@
+"""
+대량 테스트 데이터 생성 커맨드
+
+고객 N명, 고객별 환자 1~--patients 명, 환자별 방문(진료접수) --visits 회를 bulk insert 한다.
+방문마다 접수부터 POSSIBLE_STAGES를 따라 퇴원까지 진료내역을 만들고 담당자를 1~2명 지정한다.
+일부 환자(--active-ratio)는 마지막 방문이 진행중(마지막 진료내역 대기)이다.
+
+    python manage.py gen_clinic_data --customers 100000 --visits 3
+
+시그널을 거치지 않으므로 시그널에서 갱신하는 데이터를 직접 채운다.
+
+- 고객 연락처 숫자(phone_digits), 고객/환자 검색 인덱스
+- 환자 진료 단계 버전, 진료접수 현재 단계(last_*)
+- 스태프 담당 진료접수(StaffAssignment), 스태프 업무량(StaffWorkload)
+
+변경 이력(ChangeLog)과 담당자 알림은 만들지 않는다.(변경 피드는 since 없이 처음부터 조회)
+"""
+
+import random
+import time
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from iamdt.models import (
+    Customer,
+    MedicalRegister,
+    MedicalService,
+    MedicalStaff,
+    Patient,
+    StaffAssignment,
+    StaffWorkload,
+)
+from iamdt.models.choices import MedicalStage, MedicalStageStatus, POSSIBLE_STAGES
+from iamdt_util.search import bulk_add_search_index
+from iamdt_util.validators import normalize_phone
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = "민서지현수준영하윤도우재은예진성호연아"
+PET_NAMES = [
+    "초코",
+    "보리",
+    "콩이",
+    "두부",
+    "몽이",
+    "코코",
+    "마루",
+    "구름",
+    "별이",
+    "탄이",
+]
+
+# 다음 단계 선택 가중치(접수 → 진료, 상담 → 수납이 퇴원보다 많도록)
+STAGE_WEIGHTS = {
+    MedicalStage.REGISTER: 0,  # 같은 접수번호에서 다시 접수하지 않는다
+    MedicalStage.EXAMINATION: 3,
+    MedicalStage.DIAGNOSYS: 2,
+    MedicalStage.TREATMENT: 2,
+    MedicalStage.COUNSELING: 2,
+    MedicalStage.PAYMENT: 3,
+    MedicalStage.DISCHARGE: 1,
+}
+# 최대 길이에 도달하면 퇴원에 가까운 단계부터 선택
+FINISH_ORDER = [MedicalStage.DISCHARGE, MedicalStage.PAYMENT, MedicalStage.COUNSELING]
+
+
+def stage_chain(rng, max_length: int = 8) -> list:
+    """접수부터 퇴원까지 POSSIBLE_STAGES를 따르는 단계 목록"""
+    stages = [MedicalStage.REGISTER]
+    while stages[-1] != MedicalStage.DISCHARGE:
+        possible = POSSIBLE_STAGES[stages[-1]]
+        if len(stages) >= max_length:
+            stage = next(stage for stage in FINISH_ORDER if stage in possible)
+        else:
+            weights = [STAGE_WEIGHTS[stage] for stage in possible]
+            stage = rng.choices(possible, weights=weights)[0]
+        stages.append(stage)
+    return stages
+
+
+class Command(BaseCommand):
+    help = "고객/환자/진료접수/진료내역/담당자 대량 테스트 데이터를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--customers", type=int, default=1000, help="고객 수")
+        parser.add_argument("--visits", type=int, default=3, help="환자별 방문 수")
+        parser.add_argument(
+            "--patients", type=int, default=2, help="고객별 최대 환자 수"
+        )
+        parser.add_argument(
+            "--staff", type=int, default=20, help="스태프 수(부족하면 생성)"
+        )
+        parser.add_argument(
+            "--active-ratio",
+            type=float,
+            default=0.2,
+            help="마지막 방문이 진행중인 환자 비율",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="트랜잭션별 고객 수"
+        )
+        parser.add_argument("--seed", type=int, help="난수 시드")
+
+    def handle(self, *args, **options):
+        if options["customers"] < 1 or options["visits"] < 1:
+            raise CommandError("--customers, --visits 는 1 이상이어야 합니다.")
+
+        rng = random.Random(options["seed"])
+        staff = self.ensure_staff(options["staff"])
+        # 연락처 중복(이름+연락처 unique)을 피하도록 기존 고객 id 이후 번호 사용
+        serial = (Customer.objects.aggregate(value=Max("id"))["value"] or 0) + 1
+
+        totals = Counter()
+        started = time.perf_counter()
+        remains = options["customers"]
+        while remains > 0:
+            size = min(remains, options["batch_size"])
+            with transaction.atomic():
+                totals += self.create_batch(rng, size, serial, staff, options)
+            serial += size
+            remains -= size
+            self.stdout.write(
+                f"고객 {totals['customers']}명, 진료내역 {totals['services']}건 "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+
+        elapsed = time.perf_counter() - started
+        summary = ", ".join(f"{key} {value}" for key, value in totals.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{summary} 생성 ({elapsed:.1f}s, "
+                f"진료내역 {totals['services'] / elapsed:.0f}건/s)"
+            )
+        )
+
+    def ensure_staff(self, count: int) -> list:
+        """활성 스태프 id 목록. 부족하면 수의사/간호사 스태프를 생성한다"""
+        user_model = get_user_model()
+        staff = list(
+            user_model.objects.filter(is_staff=True, is_active=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        roles = [user_model.UserType.DOCTOR, user_model.UserType.NURSE]
+        for index in range(len(staff), count):
+            user = user_model(
+                username=f"gen_staff{index + 1}",
+                role=roles[index % 2],
+                phone=f"010-0000-{index + 1:04d}",
+                is_staff=True,
+            )
+            user.set_unusable_password()
+            user.save()
+            staff.append(user.pk)
+        return staff
+
+    def create_batch(self, rng, size, serial, staff, options) -> Counter:
+        """고객 size 명의 데이터 생성. 생성 건수를 반환"""
+        customers = []
+        for index in range(size):
+            number = serial + index
+            phone = f"010-{number // 10000 % 10000:04d}-{number % 10000:04d}"
+            customers.append(
+                Customer(
+                    name=rng.choice(SURNAMES) + "".join(rng.sample(GIVEN_NAMES, 2)),
+                    phone=phone,
+                    phone_digits=normalize_phone(phone),
+                )
+            )
+        Customer.objects.bulk_create(customers)
+
+        # 환자별 방문 단계 목록
+        patients, visits = [], []
+        for customer in customers:
+            for _ in range(rng.randint(1, options["patients"])):
+                chains = [stage_chain(rng) for _ in range(options["visits"])]
+                if rng.random() < options["active_ratio"]:
+                    last = chains[-1]
+                    chains[-1] = last[: rng.randint(1, len(last) - 1)]
+                patient = Patient(
+                    companion=customer,
+                    name=rng.choice(PET_NAMES),
+                    service_version=sum(len(chain) for chain in chains),
+                )
+                patients.append(patient)
+                visits.append(chains)
+        Patient.objects.bulk_create(patients)
+
+        registers = []
+        for patient, chains in zip(patients, visits):
+            for chain in chains:
+                status = (
+                    MedicalStageStatus.COMPLETE
+                    if chain[-1] == MedicalStage.DISCHARGE
+                    else MedicalStageStatus.WAIT
+                )
+                registers.append(
+                    MedicalRegister(
+                        patient=patient, last_stage=chain[-1], last_status=status
+                    )
+                )
+        MedicalRegister.objects.bulk_create(registers)
+
+        services, chains = [], [chain for patient in visits for chain in patient]
+        for register, chain in zip(registers, chains):
+            for stage in chain:
+                services.append(
+                    MedicalService(
+                        patient_id=register.patient_id,
+                        register=register,
+                        stage=stage,
+                        status=MedicalStageStatus.COMPLETE,
+                        creator_id=rng.choice(staff),
+                    )
+                )
+            # 진행중인 방문의 마지막 단계만 대기
+            services[-1].status = register.last_status
+        MedicalService.objects.bulk_create(services, batch_size=1000)
+
+        last_services = {service.register_id: service for service in services}
+        for register in registers:
+            register.last_service = last_services[register.pk]
+        MedicalRegister.objects.bulk_update(
+            registers, ["last_service"], batch_size=1000
+        )
+
+        staffs = [
+            MedicalStaff(detail=service, staff_id=staff_id)
+            for service in services
+            for staff_id in rng.sample(staff, min(len(staff), rng.randint(1, 2)))
+        ]
+        MedicalStaff.objects.bulk_create(staffs, batch_size=1000)
+        self.update_staff_data(registers, staffs)
+
+        bulk_add_search_index(customers)
+        bulk_add_search_index(patients)
+        return Counter(
+            customers=len(customers),
+            patients=len(patients),
+            registers=len(registers),
+            services=len(services),
+            staffs=len(staffs),
+        )
+
+    def update_staff_data(self, registers, staffs) -> None:
+        """스태프 담당 진료접수, 업무량(대기 진료내역 수)"""
+        active = {
+            register.pk: register.last_stage != MedicalStage.DISCHARGE
+            for register in registers
+        }
+        assigned_at = {}
+        workload = Counter()
+        for row in staffs:
+            key = (row.staff_id, row.detail.register_id)
+            assigned_at[key] = row.created_at
+            if row.detail.status == MedicalStageStatus.WAIT:
+                workload[(row.staff_id, row.detail.stage)] += 1
+
+        StaffAssignment.objects.bulk_create(
+            [
+                StaffAssignment(
+                    staff_id=staff_id,
+                    register_id=register_id,
+                    last_assigned_at=created_at,
+                    active=active[register_id],
+                )
+                for (staff_id, register_id), created_at in assigned_at.items()
+            ],
+            batch_size=1000,
+        )
+        StaffWorkload.adjust(dict(workload))
@@ -0,0 +1,315 @@
+"""
+시작(import) 비용 측정 커맨드
+
+설정 프로필(DJANGO_SETTINGS_MODULE)별로 새 파이썬 프로세스(worker 시작과 같은 상태)에서
+django.setup(), URL 설정 import, URL resolve 를 실행하고
+모듈별 import 시간(python -X importtime), 단계별 시작 시간, 최대 RSS를 측정한다.
+
+    python manage.py importtime_report
+    python manage.py importtime_report --profile config.settings.local \\
+        --profile config.settings.production --output importtime.json
+    python manage.py importtime_report --compare importtime.json
+
+- import 시간은 -X importtime 실행 1회, 시작 시간/RSS는 --runs 회 실행의 중앙값
+  (importtime 출력 비용이 포함되지 않도록 따로 실행한다)
+- 모듈별 self(자기 코드) 시간과 처음 import 한 모듈(importer), 단계(setup/urls/resolve)를 기록한다.
+- 프로필이 여러개면 첫 프로필 대비 시작 시간, RSS, 모듈 수, 빠진 패키지를 출력한다.
+- --compare 로 이전 결과(코드 변경 전)와 프로필별로 비교한다.
+"""
+
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from iamdt.management.commands.bench_api import git_commit
+
+DEFAULT_PATHS = ["/api/services"]
+PHASES = ["setup", "urls", "resolve"]
+PHASE_MARK = "importtime_report:"
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# 측정 대상 프로세스에서 실행하는 코드. 단계 시작을 stderr 에 표시해 importtime 출력을 나눈다
+CHILD = f"""
+import json, resource, sys, time
+
+def phase(name):
+    sys.stderr.write("{PHASE_MARK}" + name + "\\n")
+    sys.stderr.flush()
+    return time.perf_counter()
+
+started = phase("setup")
+import django
+django.setup()
+urls = phase("urls")
+from django.urls import Resolver404, get_resolver, resolve
+get_resolver().url_patterns
+resolving = phase("resolve")
+views = {{}}
+for path in json.loads(sys.argv[1]):
+    try:
+        views[path] = resolve(path).view_name
+    except Resolver404:
+        views[path] = None
+finished = time.perf_counter()
+print(json.dumps({{
+    "setup_ms": (urls - started) * 1000,
+    "urls_ms": (resolving - urls) * 1000,
+    "resolve_ms": (finished - resolving) * 1000,
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+    "views": views,
+}}))
+"""
+
+
+def parse_importtime(lines) -> list:
+    """-X importtime 출력을 모듈별 행(import 순서)으로 변환
+
+    자식 모듈이 부모보다 먼저 출력되므로 역순으로 읽으며 importer(부모)를 찾는다.
+    최상위(들여쓰기 없음) 모듈의 importer 는 None(단계 코드에서 import)
+    """
+    entries = []
+    phase = PHASES[0]
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith(PHASE_MARK):
+            phase = line[len(PHASE_MARK) :]
+            continue
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append(
+                {
+                    "module": name,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                    "depth": len(indent) // 2,
+                    "phase": phase,
+                }
+            )
+
+    stack = []
+    for entry in reversed(entries):
+        while stack and (
+            stack[-1]["depth"] >= entry["depth"] or stack[-1]["phase"] != entry["phase"]
+        ):
+            stack.pop()
+        entry["importer"] = stack[-1]["module"] if stack else None
+        stack.append(entry)
+    return entries
+
+
+def summarize_packages(entries) -> dict:
+    """최상위 패키지별 모듈 수, self 시간 합계, 단계별 시간"""
+    packages = defaultdict(
+        lambda: {"modules": 0, "self_ms": 0.0, "phases": defaultdict(float)}
+    )
+    for entry in entries:
+        package = packages[entry["module"].split(".")[0]]
+        package["modules"] += 1
+        package["self_ms"] += entry["self_us"] / 1000
+        package["phases"][entry["phase"]] += entry["self_us"] / 1000
+    return {
+        name: {
+            "modules": package["modules"],
+            "self_ms": round(package["self_ms"], 2),
+            "phases": {phase: round(ms, 2) for phase, ms in package["phases"].items()},
+        }
+        for name, package in sorted(
+            packages.items(), key=lambda item: item[1]["self_ms"], reverse=True
+        )
+    }
+
+
+def run_child(profile: str, paths: list, importtime: bool = False) -> tuple:
+    """(측정 결과, stderr, 전체 실행 시간 ms)"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", CHILD, json.dumps(paths)]
+
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": profile}
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    started = time.perf_counter()
+    result = subprocess.run(
+        command, capture_output=True, text=True, cwd=settings.BASE_DIR, env=env
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise CommandError(
+            f"{profile} 실행 실패:\n" + "\n".join(result.stderr.splitlines()[-20:])
+        )
+    return json.loads(result.stdout.splitlines()[-1]), result.stderr, elapsed
+
+
+def measure(profile: str, paths: list, runs: int, top: int) -> dict:
+    _, stderr, _ = run_child(profile, paths, importtime=True)
+    entries = parse_importtime(stderr.splitlines())
+
+    samples = [run_child(profile, paths) for _ in range(runs)]
+    startup = {
+        f"{phase}_ms": round(
+            statistics.median(s[f"{phase}_ms"] for s, _, _ in samples), 1
+        )
+        for phase in PHASES
+    }
+    startup["total_ms"] = round(statistics.median(e for _, _, e in samples), 1)
+    return {
+        "startup": startup,
+        "maxrss_kb": statistics.median(s["maxrss_kb"] for s, _, _ in samples),
+        "modules": samples[0][0]["modules"],
+        "views": samples[0][0]["views"],
+        "import_ms": round(sum(e["self_us"] for e in entries) / 1000, 1),
+        "packages": summarize_packages(entries),
+        "top": [
+            {
+                "module": entry["module"],
+                "self_ms": round(entry["self_us"] / 1000, 2),
+                "cumulative_ms": round(entry["cumulative_us"] / 1000, 2),
+                "importer": entry["importer"],
+                "phase": entry["phase"],
+            }
+            for entry in sorted(entries, key=lambda e: e["self_us"], reverse=True)[:top]
+        ],
+        "imported": sorted(entry["module"] for entry in entries),
+    }
+
+
+class Command(BaseCommand):
+    help = "설정 프로필별 시작 시간, RSS, 모듈별 import 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            action="append",
+            dest="profiles",
+            help="설정 모듈(여러번 지정 가능). 없으면 현재 DJANGO_SETTINGS_MODULE",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help=f"resolve 할 URL(여러번 지정 가능). 기본 {', '.join(DEFAULT_PATHS)}",
+        )
+        parser.add_argument(
+            "--runs", type=int, default=5, help="시작 시간/RSS 측정 반복 횟수"
+        )
+        parser.add_argument("--top", type=int, default=20, help="출력할 모듈 수")
+        parser.add_argument("--output", help="결과 파일(JSON)")
+        parser.add_argument("--compare", help="비교할 이전 결과 파일")
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1 or options["top"] < 1:
+            raise CommandError("--runs, --top 은 1 이상이어야 합니다.")
+        profiles = options["profiles"] or [
+            os.environ.get("DJANGO_SETTINGS_MODULE") or settings.SETTINGS_MODULE
+        ]
+        paths = options["paths"] or DEFAULT_PATHS
+
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "paths": paths,
+                "runs": options["runs"],
+            },
+            "profiles": {},
+        }
+        for profile in profiles:
+            result = measure(profile, paths, options["runs"], options["top"])
+            report["profiles"][profile] = result
+            self.write_profile(profile, result, options["top"])
+
+        if len(profiles) > 1:
+            base = profiles[0]
+            for profile in profiles[1:]:
+                self.write_diff(
+                    base, report["profiles"][base], profile, report["profiles"][profile]
+                )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as f:
+                before = json.load(f)
+            self.stdout.write(
+                f"\n비교: {before['meta'].get('commit') or '-'} → "
+                f"{report['meta'].get('commit') or '-'}"
+            )
+            for profile, result in report["profiles"].items():
+                if profile in before["profiles"]:
+                    self.write_diff(
+                        profile, before["profiles"][profile], profile, result
+                    )
+                else:
+                    self.stdout.write(f"{profile}: 이전 결과 없음")
+
+    def write_profile(self, profile, result, top) -> None:
+        startup = result["startup"]
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n[{profile}]"))
+        self.stdout.write(
+            f"시작 {startup['total_ms']:.1f}ms "
+            f"(setup {startup['setup_ms']:.1f} / urls {startup['urls_ms']:.1f} / "
+            f"resolve {startup['resolve_ms']:.1f}), "
+            f"RSS {result['maxrss_kb'] / 1024:.1f}MB, 모듈 {result['modules']}개, "
+            f"import 합계 {result['import_ms']:.1f}ms"
+        )
+        for path, view in result["views"].items():
+            self.stdout.write(f"  {path} → {view or '(없음)'}")
+
+        self.stdout.write("\n패키지별 import(self 합계)")
+        for name, package in list(result["packages"].items())[:top]:
+            phases = ", ".join(
+                f"{phase} {ms:.1f}" for phase, ms in package["phases"].items()
+            )
+            self.stdout.write(
+                f"  {name:32} {package['self_ms']:>8.1f}ms  "
+                f"{package['modules']:>4}개  ({phases})"
+            )
+
+        self.stdout.write("\n모듈별 import(self)")
+        for row in result["top"]:
+            self.stdout.write(
+                f"  {row['module']:48} {row['self_ms']:>8.2f}ms  "
+                f"{row['phase']:7} ← {row['importer'] or '-'}"
+            )
+
+    def write_diff(self, base_name, base, name, result) -> None:
+        """시작 시간, RSS, 모듈 수 변화와 빠지거나 추가된 패키지"""
+
+        def change(before, after) -> str:
+            return f"{(after / before - 1) * 100:+.1f}%" if before else "-"
+
+        label = name if base_name == name else f"{base_name} → {name}"
+        before, after = base["startup"]["total_ms"], result["startup"]["total_ms"]
+        rss_before, rss_after = base["maxrss_kb"] / 1024, result["maxrss_kb"] / 1024
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n{label}"))
+        self.stdout.write(
+            f"  시작 {before:.1f} → {after:.1f}ms ({change(before, after)}), "
+            f"RSS {rss_before:.1f} → {rss_after:.1f}MB ({change(rss_before, rss_after)}), "
+            f"모듈 {base['modules']} → {result['modules']}"
+        )
+        removed = base["packages"].keys() - result["packages"].keys()
+        added = result["packages"].keys() - base["packages"].keys()
+        if removed:
+            self.stdout.write(
+                self.style.SUCCESS(f"  빠진 패키지: {', '.join(sorted(removed))}")
+            )
+        if added:
+            self.stdout.write(
+                self.style.WARNING(f"  추가된 패키지: {', '.join(sorted(added))}")
+            )
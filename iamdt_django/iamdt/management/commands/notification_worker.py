@@ -0,0 +1,125 @@
+"""
+담당자 변경 알림 outbox 발송 워커
+
+StaffNotification에 쌓인 미발송 알림을 batch 단위로 가져와 발송하고 발송일을 기록한다.
+웹 프로세스와 별도로 실행한다.
+
+    python manage.py notification_worker
+    python manage.py notification_worker --once  # 1회만 처리
+
+- 알림은 짧은 트랜잭션으로 가져오면서(claim) 시도 횟수와 발송 시작일을 기록하고
+  메신저 발송은 트랜잭션 밖에서 한다.(발송 동안 DB 쓰기 lock 을 잡지 않는다)
+- 발송에 성공한 알림만 발송일을 기록한다.
+  실패한 알림은 --retry-delay 초 후 다시 가져오며 --max-attempts 회 실패하면 더 발송하지 않는다.
+- 발송 도중 워커가 중단된 알림도 --retry-delay 초 후 다시 발송된다.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from iamdt.models import StaffNotification
+from iamdt_util.notification import medical_staff_notify
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "담당자 변경 알림(outbox)을 발송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100, help="1회 처리할 알림 수"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="발송할 알림이 없을때 대기 시간(초)",
+        )
+        parser.add_argument(
+            "--retry-delay",
+            type=float,
+            default=60.0,
+            help="발송 실패한 알림 재시도 대기 시간(초)",
+        )
+        parser.add_argument(
+            "--max-attempts", type=int, default=5, help="알림별 최대 발송 시도 횟수"
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="쌓인 알림을 모두 처리하고 종료"
+        )
+
+    def handle(self, *args, **options):
+        total = failed = 0
+        while True:
+            try:
+                count, errors = self.dispatch(
+                    options["batch_size"],
+                    max_attempts=options["max_attempts"],
+                    retry_delay=options["retry_delay"],
+                )
+            except Exception:
+                logger.exception("담당자 알림 발송 실패")
+                count = errors = 0
+                if options["once"]:
+                    raise
+
+            total += count
+            failed += errors
+            if count:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{total}건의 알림을 처리했습니다.(실패 {failed}건)")
+        )
+
+    def claim(self, batch_size: int, max_attempts: int, retry_delay: float) -> list:
+        """발송할 알림을 가져오고 시도 횟수, 발송 시작일을 기록한다"""
+        now = timezone.now()
+        with transaction.atomic():
+            notifications = list(
+                StaffNotification.objects.filter(
+                    Q(claimed_at__isnull=True)
+                    | Q(claimed_at__lte=now - timedelta(seconds=retry_delay)),
+                    sent_at__isnull=True,
+                    attempts__lt=max_attempts,
+                )
+                .select_related("staff", "service__register__patient__companion")
+                .select_for_update(skip_locked=True, of=("self",))
+                .order_by("id")[:batch_size]
+            )
+            StaffNotification.objects.filter(
+                id__in=[notification.id for notification in notifications]
+            ).update(claimed_at=now, attempts=F("attempts") + 1)
+        return notifications
+
+    def dispatch(
+        self, batch_size: int, max_attempts: int = 5, retry_delay: float = 60.0
+    ) -> tuple:
+        """미발송 알림 batch_size 만큼 발송
+
+        Returns
+        -------
+        tuple
+            (처리한 알림 수, 발송 실패한 알림 수)
+        """
+        notifications = self.claim(batch_size, max_attempts, retry_delay)
+        if not notifications:
+            return 0, 0
+
+        failed = medical_staff_notify(notifications)
+        StaffNotification.objects.filter(
+            id__in=[n.id for n in notifications if n.id not in failed]
+        ).update(sent_at=timezone.now())
+        if failed:
+            logger.warning(f"담당자 알림 {len(failed)}건 발송 실패(재시도 대기)")
+        return len(notifications), len(failed)
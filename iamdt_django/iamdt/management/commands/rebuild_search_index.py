@@ -0,0 +1,28 @@
+"""
+검색 인덱스(SQLite FTS5) 재생성 커맨드
+
+마이그레이션 이전에 등록된 데이터가 있거나 인덱스가 어긋난 경우 실행한다.
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from iamdt_util.search import SEARCH_INDEXES, search_enabled, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "고객/환자/스태프 검색 인덱스를 다시 생성합니다."
+
+    def handle(self, *args, **options):
+        if not search_enabled():
+            self.stdout.write(self.style.WARNING("검색 인덱스를 사용하지 않는 설정입니다."))
+            return
+
+        with transaction.atomic():
+            for label in SEARCH_INDEXES:
+                model = apps.get_model(label)
+                count = rebuild_search_index(model)
+                self.stdout.write(f"{model._meta.verbose_name}: {count}건")
+
+        self.stdout.write(self.style.SUCCESS("검색 인덱스를 재생성 했습니다."))
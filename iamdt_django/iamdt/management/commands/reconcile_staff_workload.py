@@ -0,0 +1,64 @@
+"""
+스태프 업무량(StaffWorkload) 집계 재계산 커맨드
+
+기존 데이터 마이그레이션 후 혹은 시그널 없이 변경된 데이터로 집계가 어긋난 경우 실행한다.
+
+    python manage.py reconcile_staff_workload --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from iamdt.models import StaffWorkload
+
+
+class Command(BaseCommand):
+    help = "스태프 업무량을 진료내역 담당자 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="어긋난 항목만 출력하고 수정하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            counts = StaffWorkload.counts()
+            current = {
+                (row.staff_id, row.stage): row
+                for row in StaffWorkload.objects.select_for_update()
+            }
+
+            waiting = {key: row.waiting for key, row in current.items()}
+            drifts = [
+                (key, waiting.get(key, 0), counts.get(key, 0))
+                for key in sorted({*counts, *waiting})
+                if waiting.get(key, 0) != counts.get(key, 0)
+            ]
+            for (staff, stage), before, after in drifts:
+                self.stdout.write(f"staff {staff} / {stage}: {before} -> {after}")
+
+            if not options["dry_run"]:
+                self.apply(counts, current)
+
+        style = self.style.SUCCESS if not drifts else self.style.WARNING
+        action = "확인" if options["dry_run"] else "수정"
+        self.stdout.write(style(f"{len(drifts)}건의 어긋난 업무량을 {action}했습니다."))
+
+    def apply(self, counts, current) -> None:
+        """집계가 0인 항목은 삭제하고 나머지는 등록/수정"""
+        StaffWorkload.objects.filter(
+            pk__in=[row.pk for key, row in current.items() if not counts.get(key)]
+        ).delete()
+
+        changed = []
+        for key, waiting in counts.items():
+            row = current.get(key) or StaffWorkload(staff_id=key[0], stage=key[1])
+            if row.pk is None or row.waiting != waiting:
+                row.waiting = waiting
+                changed.append(row)
+        StaffWorkload.objects.bulk_create([row for row in changed if row.pk is None])
+        StaffWorkload.objects.bulk_update(
+            [row for row in changed if row.pk is not None], ["waiting"], batch_size=1000
+        )
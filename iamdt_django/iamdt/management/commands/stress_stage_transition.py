@@ -0,0 +1,141 @@
+"""
+진료 단계 동시 등록 부하 테스트 커맨드
+
+여러 스레드가 같은 환자의 다음 진료 단계를 동시에 등록(MedicalServiceAddSerializer)하고
+접수번호 분기(fork) 여부와 경합 상황의 처리량을 출력한다.
+테스트용 고객/환자를 만들어 사용하고 종료시 삭제한다.(운영 DB에서 실행하지 말 것)
+
+    python manage.py stress_stage_transition --threads 8 --rounds 20
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+
+from iamdt.models import Customer, MedicalRegister, MedicalService, Patient
+from iamdt.models.choices import MedicalStage, MedicalStageStatus, POSSIBLE_STAGES
+from iamdt_api.exceptions import Conflict
+from iamdt_api.serializers.medical_service import MedicalServiceAddSerializer
+
+
+class Command(BaseCommand):
+    help = "같은 환자에 진료 단계를 동시에 등록해 접수번호 분기 여부와 처리량을 확인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=8, help="동시 실행 스레드 수"
+        )
+        parser.add_argument(
+            "--rounds", type=int, default=20, help="스레드별 등록 시도 횟수"
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="테스트 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        creator = get_user_model().objects.filter(is_staff=True, is_active=True).first()
+        if creator is None:
+            raise CommandError("등록자로 사용할 스태프가 없습니다.")
+
+        customer = Customer.objects.create(
+            name="부하테스트", phone=f"010{time.time_ns() % 10**8:08d}"
+        )
+        patient = Patient.objects.create(companion=customer, name="부하테스트")
+        try:
+            results, elapsed = self.run(patient.pk, creator, options)
+            self.report(patient, results, elapsed, options)
+        finally:
+            if not options["keep"]:
+                self.cleanup(customer, patient)
+
+    def run(self, patient_id, creator, options):
+        results = Counter()
+        lock = threading.Lock()
+        barrier = threading.Barrier(options["threads"])
+
+        def worker():
+            try:
+                barrier.wait()
+                for _ in range(options["rounds"]):
+                    result = self.transition(patient_id, creator)
+                    with lock:
+                        results[result] += 1
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, time.perf_counter() - started
+
+    def transition(self, patient_id, creator) -> str:
+        """현재 단계에서 가능한 다음 단계 등록 시도. 결과 구분을 반환"""
+        try:
+            last = (
+                MedicalService.objects.filter(patient=patient_id)
+                .order_by("id")
+                .values("stage")
+                .last()
+            )
+            possible = POSSIBLE_STAGES[last["stage"]] if last else []
+            stage = random.choice(possible) if possible else MedicalStage.REGISTER
+
+            serializer = MedicalServiceAddSerializer(
+                data={"patient": patient_id, "stage": stage, "staff": [creator.pk]}
+            )
+            if not serializer.is_valid():
+                return "invalid"  # 조회 이후 단계가 바뀜
+            serializer.save(creator=creator)
+        except Conflict:
+            return "conflict"
+        except OperationalError:
+            # SQLite 잠금 대기 시간 초과(테스트의 공유 메모리 DB는 대기 없이 실패)
+            return "locked"
+        return "success"
+
+    def count_forks(self, patient) -> int:
+        """단계 이행 규칙을 벗어난 연속 진료내역 수"""
+        services = list(
+            MedicalService.objects.filter(patient=patient)
+            .order_by("id")
+            .values("register", "stage", "status")
+        )
+        forks = 0
+        for prev, current in zip(services, services[1:]):
+            if prev["status"] != MedicalStageStatus.COMPLETE:
+                forks += 1  # 이전 단계가 완료되지 않았는데 다음 단계 등록
+            elif prev["register"] == current["register"]:
+                forks += current["stage"] not in POSSIBLE_STAGES[prev["stage"]]
+            else:
+                forks += prev["stage"] != MedicalStage.DISCHARGE  # 퇴원 전 새 접수
+        return forks
+
+    def report(self, patient, results, elapsed, options) -> None:
+        attempts = sum(results.values())
+        created = MedicalService.objects.filter(patient=patient).count()
+        forks = self.count_forks(patient)
+
+        self.stdout.write(
+            f"threads {options['threads']}, rounds {options['rounds']}, "
+            f"attempts {attempts}, created {created}\n"
+            f"success {results['success']}, conflict {results['conflict']}, "
+            f"invalid {results['invalid']}, locked {results['locked']}\n"
+            f"elapsed {elapsed:.2f}s, {results['success'] / elapsed:.1f} success/s, "
+            f"{attempts / elapsed:.1f} attempts/s"
+        )
+        style = self.style.SUCCESS if forks == 0 else self.style.ERROR
+        self.stdout.write(style(f"forks {forks}"))
+
+    def cleanup(self, customer, patient) -> None:
+        MedicalService.objects.filter(patient=patient).delete()
+        MedicalRegister.objects.filter(patient=patient).delete()
+        patient.delete()
+        customer.delete()
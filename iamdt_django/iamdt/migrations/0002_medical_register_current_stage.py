@@ -0,0 +1,119 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:22
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="medicalregister",
+            options={
+                "ordering": ["id"],
+                "verbose_name": "진료번호",
+                "verbose_name_plural": "진료번호 리스트",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="medicalservice",
+            options={
+                "verbose_name": "진료내역",
+                "verbose_name_plural": "진료내역 리스트",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="medicalstaff",
+            options={
+                "ordering": ["id"],
+                "verbose_name": "진료내역별 담당자",
+                "verbose_name_plural": "진료내역별 담당자 리스트",
+            },
+        ),
+        migrations.AddField(
+            model_name="medicalregister",
+            name="last_service",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="iamdt.medicalservice",
+                verbose_name="최근 진료내역",
+            ),
+        ),
+        migrations.AddField(
+            model_name="medicalregister",
+            name="last_stage",
+            field=models.CharField(
+                choices=[
+                    ("register", "접수"),
+                    ("examination", "진료"),
+                    ("diagnosys", "진단"),
+                    ("treatment", "처치"),
+                    ("counseling", "결과 설명/상담"),
+                    ("payment", "수납"),
+                    ("discharge", "퇴원"),
+                ],
+                default="register",
+                editable=False,
+                max_length=15,
+                verbose_name="현재 단계",
+            ),
+        ),
+        migrations.AddField(
+            model_name="medicalregister",
+            name="last_status",
+            field=models.CharField(
+                choices=[("wait", "대기"), ("complete", "완료")],
+                default="wait",
+                editable=False,
+                max_length=15,
+                verbose_name="현재 상태",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="medicalservice",
+            name="patient",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="services",
+                to="iamdt.patient",
+                verbose_name="환자",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="medicalservice",
+            name="register",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="details",
+                to="iamdt.medicalregister",
+                verbose_name="접수번호",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="medicalstaff",
+            name="detail",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="iamdt.medicalservice",
+                verbose_name="진료단계",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="medicalstaff",
+            name="staff",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.RESTRICT,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="담당자",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:24
+
+from django.db import migrations
+
+# (테이블, 검색 필드) - iamdt_util.search.SEARCH_INDEXES
+SEARCH_TABLES = [
+    ("iamdt_customer_search", ["name", "phone"]),
+    ("iamdt_patient_search", ["name"]),
+    ("iamdt_user_search", ["username", "phone"]),
+]
+
+
+def create_search_tables(apps, schema_editor):
+    """SQLite FTS5 검색 인덱스 테이블 생성(SQLite가 아니면 생성하지 않는다)"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for table, fields in SEARCH_TABLES:
+        columns = ", ".join(f"{field}_grams, {field}_chars" for field in fields)
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5({columns})"
+        )
+
+
+def drop_search_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for table, fields in SEARCH_TABLES:
+        schema_editor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0002_medical_register_current_stage"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_tables, drop_search_tables),
+    ]
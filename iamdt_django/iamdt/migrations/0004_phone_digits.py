@@ -0,0 +1,37 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0003_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="phone_digits",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="발신번호 조회용. 저장시 연락처에서 숫자만 추출된다",
+                max_length=11,
+                verbose_name="연락처(숫자)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="phone_digits",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="발신번호 조회용. 저장시 연락처에서 숫자만 추출된다",
+                max_length=11,
+                verbose_name="연락처(숫자)",
+            ),
+        ),
+    ]
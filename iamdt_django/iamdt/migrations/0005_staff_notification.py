@@ -0,0 +1,76 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0004_phone_digits"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StaffNotification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[("add", "등록"), ("remove", "제외")],
+                        max_length=10,
+                        verbose_name="구분",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="등록일"),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="발송일"),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notifications",
+                        to="iamdt.medicalservice",
+                        verbose_name="진료내역",
+                    ),
+                ),
+                (
+                    "staff",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notifications",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="담당자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "담당자 알림",
+                "verbose_name_plural": "담당자 알림 리스트",
+                "ordering": ["id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="staffnotification",
+            index=models.Index(
+                condition=models.Q(("sent_at__isnull", True)),
+                fields=["id"],
+                name="notification_pending_idx",
+            ),
+        ),
+    ]
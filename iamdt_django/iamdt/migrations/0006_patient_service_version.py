@@ -0,0 +1,20 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0005_staff_notification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="patient",
+            name="service_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="진료 단계 버전"
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0006_patient_service_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=30, verbose_name="모델")),
+                ("object_id", models.PositiveBigIntegerField(verbose_name="객체 id")),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("create", "등록"),
+                            ("update", "수정"),
+                            ("delete", "삭제"),
+                        ],
+                        max_length=10,
+                        verbose_name="구분",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="등록일"),
+                ),
+            ],
+            options={
+                "verbose_name": "변경 이력",
+                "verbose_name_plural": "변경 이력 리스트",
+                "ordering": ["id"],
+            },
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.0.6 on 2026-10-18 11:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0007_change_log"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StaffAssignment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_assigned_at",
+                    models.DateTimeField(verbose_name="최근 담당 등록일"),
+                ),
+                (
+                    "active",
+                    models.BooleanField(
+                        default=True,
+                        help_text="퇴원 전 진료접수",
+                        verbose_name="진행중",
+                    ),
+                ),
+                (
+                    "register",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="staff_assignments",
+                        to="iamdt.medicalregister",
+                        verbose_name="진료접수",
+                    ),
+                ),
+                (
+                    "staff",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assignments",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="담당자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "스태프 담당 진료접수",
+                "verbose_name_plural": "스태프 담당 진료접수 리스트",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="staffassignment",
+            index=models.Index(
+                condition=models.Q(("active", True)),
+                fields=["staff", "register"],
+                name="staff_assignment_active_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="staffassignment",
+            constraint=models.UniqueConstraint(
+                fields=("staff", "register"), name="staff_assignment_unique"
+            ),
+        ),
+    ]
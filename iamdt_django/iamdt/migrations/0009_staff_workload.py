@@ -0,0 +1,65 @@
+# Generated by Django 4.0.6 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0008_staff_assignment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StaffWorkload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("register", "접수"),
+                            ("examination", "진료"),
+                            ("diagnosys", "진단"),
+                            ("treatment", "처치"),
+                            ("counseling", "결과 설명/상담"),
+                            ("payment", "수납"),
+                            ("discharge", "퇴원"),
+                        ],
+                        max_length=15,
+                        verbose_name="단계",
+                    ),
+                ),
+                ("waiting", models.IntegerField(default=0, verbose_name="대기 건수")),
+                (
+                    "staff",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="workloads",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="담당자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "스태프 업무량",
+                "verbose_name_plural": "스태프 업무량 리스트",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="staffworkload",
+            constraint=models.UniqueConstraint(
+                fields=("staff", "stage"), name="staff_workload_unique"
+            ),
+        ),
+    ]
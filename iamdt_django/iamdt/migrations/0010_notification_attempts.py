@@ -0,0 +1,28 @@
+# Generated by Django 4.0.6 on 2026-10-18 12:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iamdt", "0009_staff_workload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="staffnotification",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="발송 시도"),
+        ),
+        migrations.AddField(
+            model_name="staffnotification",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="워커가 마지막으로 가져간 시각. 실패시 재시도 대기 기준",
+                null=True,
+                verbose_name="발송 시작일",
+            ),
+        ),
+    ]
@@ -3,3 +3,7 @@ from .customer import *
 from .patient import *
 from .medical_register import *
 from .medical_service import *
+from .notification import *
+from .change_log import *
+from .staff_assignment import *
+from .staff_workload import *
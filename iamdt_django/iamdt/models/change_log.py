@@ -0,0 +1,88 @@
+__all__ = [
+    "ChangeLog",
+    "change_saved",
+    "change_deleted",
+]
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from iamdt.models import Customer, Patient, MedicalRegister, MedicalService
+
+
+class ChangeLog(models.Model):
+    """변경 이력(append-only) 모델
+
+    태블릿 동기화용 변경 피드(/api/changes?since=)의 원본.
+    id가 단조 증가하는 시퀀스이며 since 토큰으로 사용된다.(PK 인덱스로 범위 조회)
+    행 데이터는 저장하지 않고 피드 조회시 현재 값을 읽는다. 삭제는 tombstone으로 남는다.
+
+    저장/삭제 시그널에서 변경과 같은 트랜잭션으로 기록되므로
+    변경이 롤백되면 이력도 남지 않는다.
+    SQLite는 쓰기가 직렬화되어 id 순서와 커밋 순서가 같다.
+    """
+
+    class Action(models.TextChoices):
+        """변경 구분"""
+
+        CREATE = "create", "등록"
+        UPDATE = "update", "수정"
+        DELETE = "delete", "삭제"
+
+    # 변경 이력을 남기는 모델(model_name)
+    TRACKED_MODELS = ["customer", "patient", "medicalregister", "medicalservice"]
+
+    model = models.CharField("모델", max_length=30)
+    object_id = models.PositiveBigIntegerField("객체 id")
+    action = models.CharField("구분", choices=Action.choices, max_length=10)
+
+    created_at = models.DateTimeField("등록일", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "변경 이력"
+        verbose_name_plural = "변경 이력 리스트"
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{self.id}: {self.model}/{self.object_id}({self.get_action_display()})"
+
+    @classmethod
+    def record(cls, entries, using=None) -> list:
+        """(모델명, 객체 id, 구분) 목록을 INSERT 1회로 기록한다
+
+        시그널이 발생하지 않는 bulk_create/update 후에는 직접 호출한다.
+        """
+        return cls.objects.using(using).bulk_create(
+            [
+                cls(model=model, object_id=object_id, action=action)
+                for model, object_id, action in entries
+            ]
+        )
+
+
+def _entries(sender, instance, action) -> list:
+    entries = [(sender._meta.model_name, instance.pk, action)]
+    if sender is MedicalService and instance.register_id:
+        # 접수번호의 현재 단계(last_*)는 시그널 없이 UPDATE 되므로 함께 기록
+        register = ("medicalregister", instance.register_id, ChangeLog.Action.UPDATE)
+        entries.append(register)
+    return entries
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_save, sender=Patient)
+@receiver(post_save, sender=MedicalRegister)
+def change_saved(sender, instance, created, using, **kwargs):
+    """등록/수정 이력(진료내역은 record_service_changes 에서 기록)"""
+    action = ChangeLog.Action.CREATE if created else ChangeLog.Action.UPDATE
+    ChangeLog.record(_entries(sender, instance, action), using=using)
+
+
+@receiver(post_delete, sender=Customer)
+@receiver(post_delete, sender=Patient)
+@receiver(post_delete, sender=MedicalRegister)
+@receiver(post_delete, sender=MedicalService)
+def change_deleted(sender, instance, using, **kwargs):
+    """삭제 이력(tombstone)"""
+    ChangeLog.record(_entries(sender, instance, ChangeLog.Action.DELETE), using=using)
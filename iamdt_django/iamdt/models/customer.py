@@ -1,8 +1,16 @@
-__all__ = ["Customer"]
+__all__ = [
+    "Customer",
+    "customer_phone_normalize",
+    "customer_saved",
+    "customer_deleted",
+]
 
 from django.db import models
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
 
-from iamdt_util.validators import phone_validator
+from iamdt_util.search import update_search_index, delete_search_index
+from iamdt_util.validators import phone_validator, normalize_phone
 
 
 class Customer(models.Model):
@@ -15,6 +23,14 @@ class Customer(models.Model):
         validators=[phone_validator],
         help_text="SMS 수신이 가능한 연락처",
     )
+    phone_digits = models.CharField(
+        "연락처(숫자)",
+        max_length=11,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="발신번호 조회용. 저장시 연락처에서 숫자만 추출된다",
+    )
 
     created_at = models.DateTimeField("등록일", auto_now_add=True)
     updated_at = models.DateTimeField("수정일", auto_now=True)
@@ -29,3 +45,28 @@ class Customer(models.Model):
 
     def __str__(self) -> str:
         return f"{self.name}({self.phone})"
+
+    def save(self, *args, **kwargs):
+        # 연락처를 update_fields로 저장할 때 pre_save에서 채운 phone_digits도 함께 저장
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "phone" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "phone_digits"}
+        super().save(*args, **kwargs)
+
+
+@receiver(pre_save, sender=Customer)
+def customer_phone_normalize(sender, instance, **kwargs):
+    """연락처를 숫자만 남겨 phone_digits에 저장"""
+    instance.phone_digits = normalize_phone(instance.phone)
+
+
+@receiver(post_save, sender=Customer)
+def customer_saved(sender, instance, using, update_fields, **kwargs):
+    """고객정보 검색 인덱스 갱신"""
+    update_search_index(instance, using=using, update_fields=update_fields)
+
+
+@receiver(post_delete, sender=Customer)
+def customer_deleted(sender, instance, using, **kwargs):
+    """고객정보 검색 인덱스 삭제"""
+    delete_search_index(instance, using=using)
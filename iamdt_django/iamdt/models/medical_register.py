@@ -1,8 +1,14 @@
 __all__ = ["MedicalRegister"]
 
+from functools import reduce
+from operator import or_
+
 from django.db import models
+from django.db.models import Case, Q, Value, When
+from django.utils import timezone
 
 from iamdt.models import Patient
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
 
 
 class MedicalRegister(models.Model):
@@ -15,6 +21,32 @@ class MedicalRegister(models.Model):
         on_delete=models.PROTECT,
     )
 
+    # 최근 진료내역 비정규화 필드
+    # 진료내역(MedicalService) 저장/삭제 시그널에서 갱신된다
+    last_service = models.ForeignKey(
+        "MedicalService",
+        related_name="+",
+        verbose_name="최근 진료내역",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+    )
+    last_stage = models.CharField(
+        "현재 단계",
+        choices=MedicalStage.choices,
+        default=MedicalStage.REGISTER,
+        max_length=15,
+        editable=False,
+    )
+    last_status = models.CharField(
+        "현재 상태",
+        choices=MedicalStageStatus.choices,
+        default=MedicalStageStatus.WAIT,
+        max_length=15,
+        editable=False,
+    )
+
     created_at = models.DateTimeField("등록일", auto_now_add=True)
     updated_at = models.DateTimeField("수정일", auto_now=True)
 
@@ -28,5 +60,86 @@ class MedicalRegister(models.Model):
 
     @property
     def current_stage(self) -> str:
-        """진료 접수의 현재 상태 반환"""
-        return str(self.details.last())
+        """진료 접수의 현재 상태 반환
+
+        비정규화된 last_* 필드를 사용하므로 진료내역 조회 쿼리가 없다.
+        목록 조회시에는 patient__companion을 select_related 할 것.
+        """
+        if self.last_service_id is None:
+            return str(None)
+        return (
+            f"{self} / {self.get_last_stage_display()}"
+            f"({self.get_last_status_display()})"
+        )
+
+    @classmethod
+    def update_current_stages(cls, services, using=None) -> int:
+        """진료내역 저장시 접수번호의 현재 단계를 갱신한다
+
+        접수번호별로 가장 최근(id가 큰) 진료내역을 반영하며
+        같은 접수번호에서 더 최근 진료내역이 이미 반영되어 있다면 무시한다.
+        조회 없이 UPDATE 1회로 처리된다.
+        """
+        latest = {}
+        for service in services:
+            current = latest.get(service.register_id)
+            if current is None or current.id < service.id:
+                latest[service.register_id] = service
+        if not latest:
+            return 0
+
+        def current(field, output_field):
+            return Case(
+                *(
+                    When(id=register, then=Value(getattr(service, field)))
+                    for register, service in latest.items()
+                ),
+                output_field=output_field,
+            )
+
+        return (
+            cls.objects.using(using)
+            .filter(
+                reduce(
+                    or_,
+                    (
+                        Q(id=register)
+                        & (
+                            Q(last_service__isnull=True)
+                            | Q(last_service__lte=service.id)
+                        )
+                        for register, service in latest.items()
+                    ),
+                )
+            )
+            .update(
+                last_service=current("id", models.BigIntegerField()),
+                last_stage=current("stage", models.CharField()),
+                last_status=current("status", models.CharField()),
+                updated_at=timezone.now(),
+            )
+        )
+
+    @classmethod
+    def refresh_current_stage(cls, register_id) -> int:
+        """진료내역 기준으로 접수번호의 현재 단계를 다시 계산한다(삭제시)"""
+        from iamdt.models import MedicalService
+
+        last = (
+            MedicalService.objects.filter(register=register_id)
+            .order_by("id")
+            .values("id", "stage", "status")
+            .last()
+        )
+        if last is None:
+            last = {
+                "id": None,
+                "stage": MedicalStage.REGISTER,
+                "status": MedicalStageStatus.WAIT,
+            }
+        return cls.objects.filter(id=register_id).update(
+            last_service=last["id"],
+            last_stage=last["stage"],
+            last_status=last["status"],
+            updated_at=timezone.now(),
+        )
@@ -1,13 +1,33 @@
-__all__ = ["MedicalService", "MedicalStaff", "medical_staff_changed"]
+__all__ = [
+    "MedicalService",
+    "MedicalStaff",
+    "services_changed",
+    "record_service_changes",
+    "collect_service_changes",
+    "medical_staff_changed",
+    "medical_staff_touched",
+    "medical_staff_saving",
+    "medical_staff_saved",
+    "medical_staff_deleted",
+    "medical_service_saved",
+    "medical_service_deleted",
+]
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import reduce
+from operator import or_
 
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models.signals import m2m_changed
-from django.dispatch import receiver
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, pre_save, post_save, post_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
 
 from iamdt.models import Patient, MedicalRegister
 from iamdt.models.choices import MedicalStage, MedicalStageStatus
-from iamdt_util.notification import medical_staff_change_signal
 
 
 class MedicalService(models.Model):
@@ -66,6 +86,15 @@ class MedicalService(models.Model):
             f"{self.register} / {self.get_stage_display()}({self.get_status_display()})"
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 전 (단계, 상태). 상태 변경시 스태프 업무량 증감에 사용
+        loaded = instance.__dict__
+        if "stage" in loaded and "status" in loaded:
+            instance._saved_state = (loaded["stage"], loaded["status"])
+        return instance
+
 
 class MedicalStaff(models.Model):
     """
@@ -97,6 +126,341 @@ class MedicalStaff(models.Model):
         return f"{self.staff}/{self.detail}"
 
 
+# record_service_changes 로 진료내역 파생 데이터를 갱신한 후 발생(sender=MedicalService, ids, using)
+# 응답 캐시 무효화, 실시간 스트림 발행(iamdt_api)이 수신한다.
+services_changed = Signal()
+
+# collect_service_changes 블록에서 모으는 record_service_changes 인자와
+# 담당 제외된 진료내역 id. 스레드별
+_collected = threading.local()
+
+
+def record_service_changes(
+    saved=(), staff_added=(), staff_removed=(), using=None
+) -> None:
+    """진료내역 등록/수정, 담당자 등록/삭제에 따른 파생 데이터를 갱신한다
+
+    단건 저장(post_save, m2m_changed 수신자)과 일괄 등록(bulk_create 후 직접 호출)이
+    모두 이 함수를 사용한다. 파생 데이터를 추가할 때는 여기에 추가해야 일괄 등록에도 반영된다.
+    항목 수와 관계없이 쿼리 수가 일정하다.
+    collect_service_changes 블록 안에서는 호출을 모아서 블록이 끝날 때 한번 실행한다.
+
+    - 접수번호 현재 단계(last_*), 스태프 담당 진료접수 진행중 여부
+    - 스태프 업무량(대기 건수)
+    - 담당자 알림 outbox, 스태프 담당 진료접수(등록/삭제)
+    - 담당자가 등록된 진료내역 수정일(조건부 GET의 ETag)
+    - 변경 피드 이력
+    - services_changed 시그널
+
+    Parameters
+    ----------
+    saved : list
+        [(진료내역, 신규 여부)]. 저장 전 (단계, 상태)는 진료내역의 _saved_state
+    staff_added : list
+        [(진료내역, 담당자 id)]
+    staff_removed : list
+        [(담당자 id, 진료내역 id)]. 삭제된 담당자(MedicalStaff). 진료내역은 남아있어야 한다
+    """
+    collected = getattr(_collected, "changes", None)
+    if collected is not None:
+        collected[0].extend(saved)
+        collected[1].extend(staff_added)
+        collected[2].extend(staff_removed)
+        return
+
+    from iamdt.models.change_log import ChangeLog
+    from iamdt.models.notification import StaffNotification
+    from iamdt.models.staff_assignment import StaffAssignment
+    from iamdt.models.staff_workload import StaffWorkload
+
+    Action = ChangeLog.Action
+    entries = []
+    workload = Counter()
+
+    if saved:
+        services = [service for service, _ in saved]
+        # 단계/상태가 그대로인 수정(담당자만 수정)은 접수번호 현재 단계가 바뀌지 않는다
+        moved = [
+            service
+            for service, created in saved
+            if created
+            or getattr(service, "_saved_state", None) != (service.stage, service.status)
+        ]
+        # 담당 진행중 여부는 접수번호 현재 단계가 퇴원인지로 정해지므로
+        # 퇴원 단계가 등록되거나 퇴원 단계에서 바뀐 경우만 다시 계산한다(저장 전 단계를 모르면 계산)
+        staged = set()
+        for service, created in saved:
+            before = getattr(service, "_saved_state", (None,))[0]
+            if created:
+                discharge = service.stage == MedicalStage.DISCHARGE
+            else:
+                discharge = before is None or (
+                    before != service.stage
+                    and MedicalStage.DISCHARGE in (before, service.stage)
+                )
+            if discharge:
+                staged.add(service.register_id)
+        if MedicalRegister.update_current_stages(moved, using=using) and staged:
+            StaffAssignment.sync_active(staged, using=using)
+
+        # 신규 진료내역은 담당자가 아직 없다(담당자 등록에서 증가)
+        workload.update(
+            StaffWorkload.transition(
+                [(s, getattr(s, "_saved_state", None)) for s in services], using=using
+            )
+        )
+        for service, created in saved:
+            service._saved_state = (service.stage, service.status)
+            action = Action.CREATE if created else Action.UPDATE
+            # 접수번호의 현재 단계(last_*)는 시그널 없이 UPDATE 되므로 함께 기록
+            entries += [
+                ("medicalservice", service.pk, action),
+                ("medicalregister", service.register_id, Action.UPDATE),
+            ]
+
+    if staff_added:
+        StaffNotification.bulk_enqueue(
+            [(service.pk, staff) for service, staff in staff_added],
+            StaffNotification.Action.ADD,
+            using=using,
+        )
+        StaffAssignment.assign(
+            [(staff, service.register_id) for service, staff in staff_added],
+            using=using,
+        )
+        workload.update(
+            (staff, service.stage)
+            for service, staff in staff_added
+            if service.status == MedicalStageStatus.WAIT
+        )
+
+        # m2m 변경은 updated_at(auto_now)을 바꾸지 않으므로 조건부 GET의 ETag가 바뀌도록 직접 갱신
+        # (함께 저장된 진료내역은 이미 갱신됨)
+        ids = sorted({service.pk for service, _ in staff_added})
+        touched = set(ids) - {service.pk for service, _ in saved}
+        if touched:
+            MedicalService.objects.using(using).filter(pk__in=touched).update(
+                updated_at=timezone.now()
+            )
+        entries += [("medicalservice", pk, Action.UPDATE) for pk in ids]
+
+    if staff_removed:
+        # 남은 담당이 없는 스태프 담당 진료접수 삭제, 대기 진료내역이었다면 업무량 감소
+        StaffAssignment.prune(
+            reduce(
+                or_,
+                (
+                    Q(staff=staff, register__details=detail)
+                    for staff, detail in staff_removed
+                ),
+            ),
+            using=using,
+        )
+        waiting = dict(
+            MedicalService.objects.using(using)
+            .filter(
+                pk__in={detail for _, detail in staff_removed},
+                status=MedicalStageStatus.WAIT,
+            )
+            .values_list("pk", "stage")
+        )
+        for staff, detail in staff_removed:
+            if detail in waiting:
+                workload[(staff, waiting[detail])] -= 1
+
+    # 상태 변경과 담당자 등록/삭제의 업무량 증감을 한번에 반영
+    StaffWorkload.adjust(workload, using=using)
+
+    # 같은 객체는 처음 구분으로 한번만 기록
+    actions = {}
+    for model, pk, action in entries:
+        actions.setdefault((model, pk), action)
+    if not actions:  # 담당자 삭제만 있는 경우(이력, 캐시 무효화는 m2m_changed 수신자)
+        return
+    ChangeLog.record(
+        [(model, pk, action) for (model, pk), action in actions.items()], using=using
+    )
+
+    services_changed.send(
+        sender=MedicalService,
+        ids=sorted({pk for model, pk in actions if model == "medicalservice"}),
+        using=using,
+    )
+
+
+def _touch_services(ids, using=None) -> None:
+    """담당자가 제외된 진료내역 수정일 갱신, 수정 이력 기록"""
+    from iamdt.models.change_log import ChangeLog
+
+    if not ids:
+        return
+    MedicalService.objects.using(using).filter(pk__in=ids).update(
+        updated_at=timezone.now()
+    )
+    ChangeLog.record(
+        [("medicalservice", pk, ChangeLog.Action.UPDATE) for pk in sorted(ids)],
+        using=using,
+    )
+
+
+@contextmanager
+def collect_service_changes(using=None):
+    """블록 안의 record_service_changes 호출을 모아서 블록이 끝날 때 한번 실행한다
+
+    진료내역 등록과 담당자 등록, 이전 단계 완료처럼 한 요청에서 여러번 저장하는 경우
+    접수번호 현재 단계, 업무량, 변경 피드 이력 쓰기가 저장 횟수 만큼 반복되지 않는다.
+    블록에서 예외가 발생하면 실행하지 않는다.(트랜잭션과 함께 사용)
+    중첩된 블록은 가장 바깥 블록에서 실행한다.
+    담당자 삭제는 블록이 끝날 때 진료내역 상태를 조회하므로 블록 안에서 진료내역을 삭제하지 않는다.
+    """
+    if getattr(_collected, "changes", None) is not None:
+        yield
+        return
+
+    saved, staff_added, staff_removed, touched = _collected.changes = ([], [], [], [])
+    try:
+        yield
+    finally:
+        _collected.changes = None
+
+    # 같은 진료내역을 여러번 저장한 경우 한번으로(처음 저장이 신규였다면 신규)
+    services = {}
+    for service, created in saved:
+        created = created or services.get(service.pk, (None, False))[1]
+        services[service.pk] = (service, created)
+    # 담당 제외된 진료내역(함께 저장된 진료내역은 이미 갱신, 기록됨)
+    _touch_services(set(touched) - set(services), using=using)
+    record_service_changes(
+        list(services.values()), staff_added, staff_removed, using=using
+    )
+
+
 @receiver(m2m_changed, sender=MedicalService.staff.through)
 def medical_staff_changed(sender, **kwargs):
-    medical_staff_change_signal(kwargs)
+    """담당자 등록은 record_service_changes 로 파생 데이터 갱신
+
+    담당 제외 알림은 outbox에 등록한다.
+    (스태프 담당 진료접수, 업무량은 담당자(MedicalStaff) post_delete 시그널에서 처리)
+    """
+    from iamdt.models.notification import StaffNotification
+
+    if kwargs["action"] != "post_add" or not kwargs["pk_set"]:
+        StaffNotification.enqueue(kwargs)
+        return
+
+    instance, pk_set, using = kwargs["instance"], kwargs["pk_set"], kwargs["using"]
+    if kwargs["reverse"]:  # staff.schedule.add(service)
+        services = (
+            MedicalService.objects.using(using)
+            .filter(pk__in=pk_set)
+            .only("id", "register", "stage", "status")
+            .order_by("id")
+        )
+        pairs = [(service, instance.pk) for service in services]
+    else:  # service.staff.add(staff)
+        pairs = [(instance, pk) for pk in sorted(pk_set)]
+    record_service_changes(staff_added=pairs, using=using)
+
+
+@receiver(m2m_changed, sender=MedicalService.staff.through)
+def medical_staff_touched(sender, instance, action, reverse, pk_set, using, **kwargs):
+    """담당자 제외시 진료내역 수정일 갱신, 수정 이력 기록(등록은 record_service_changes)
+
+    m2m 변경은 updated_at(auto_now)을 바꾸지 않으므로 조건부 GET의 ETag가 바뀌도록 직접 갱신한다.
+    collect_service_changes 블록 안에서는 블록이 끝날 때 한번 처리한다.
+    """
+    if action == "post_remove" and pk_set:
+        ids = sorted(pk_set) if reverse else [instance.pk]
+    elif action == "post_clear" and not reverse:
+        ids = [instance.pk]
+    elif action == "pre_clear" and reverse:
+        # 비우기 전 담당내역
+        ids = list(
+            MedicalService.objects.using(using)
+            .filter(staff=instance)
+            .values_list("pk", flat=True)
+        )
+    else:
+        return
+
+    collected = getattr(_collected, "changes", None)
+    if collected is not None:
+        collected[3].extend(ids)
+    else:
+        _touch_services(ids, using=using)
+
+
+@receiver(pre_save, sender=MedicalStaff)
+def medical_staff_saving(sender, instance, using, **kwargs):
+    """담당자 수정(admin)시 저장 전 (담당자 id, 진료내역 id)를 _saved_state 에 기록"""
+    instance._saved_state = None
+    if instance.pk is not None:
+        instance._saved_state = (
+            MedicalStaff.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("staff", "detail")
+            .first()
+        )
+
+
+@receiver(post_save, sender=MedicalStaff)
+def medical_staff_saved(sender, instance, created, using, **kwargs):
+    """담당자 직접 등록/수정(admin, fixture)시 스태프 담당 진료접수, 업무량 갱신
+
+    m2m add는 bulk_create로 저장되어 이 시그널 대신 m2m_changed에서 처리된다.
+    담당자/진료내역이 바뀌지 않은 수정은 무시하고, 바뀐 경우는 이전 담당을 제외하고 새로 등록한다.
+    """
+    from iamdt.models.staff_assignment import StaffAssignment
+    from iamdt.models.staff_workload import StaffWorkload
+
+    current = (instance.staff_id, instance.detail_id)
+    previous = getattr(instance, "_saved_state", None)
+    if not created and (previous is None or previous == current):
+        return
+
+    pairs = [current] if created else [previous, current]
+    services = {
+        pk: (register_id, stage, status)
+        for pk, register_id, stage, status in MedicalService.objects.using(using)
+        .filter(pk__in={detail for _, detail in pairs})
+        .values_list("pk", "register", "stage", "status")
+    }
+
+    workload = Counter()
+    for (staff, detail), delta in zip(pairs, [1] if created else [-1, 1]):
+        _, stage, status = services[detail]
+        if status == MedicalStageStatus.WAIT:
+            workload[(staff, stage)] += delta
+    if not created:
+        staff, detail = previous
+        StaffAssignment.prune(using=using, staff=staff, register__details=detail)
+    StaffAssignment.assign(
+        [(instance.staff_id, services[instance.detail_id][0])], using=using
+    )
+    StaffWorkload.adjust(workload, using=using)
+
+
+@receiver(post_delete, sender=MedicalStaff)
+def medical_staff_deleted(sender, instance, using, **kwargs):
+    """담당 제외/비우기, 진료내역 삭제(CASCADE)시 남은 담당이 없으면 스태프 담당 진료접수 삭제
+
+    대기 진료내역이었다면 업무량 감소(CASCADE에서도 진료내역은 담당자보다 나중에 삭제된다)
+    """
+    record_service_changes(
+        staff_removed=[(instance.staff_id, instance.detail_id)], using=using
+    )
+
+
+@receiver(post_save, sender=MedicalService)
+def medical_service_saved(sender, instance, created, using, **kwargs):
+    """진료내역 등록/수정시 파생 데이터 갱신(record_service_changes)"""
+    record_service_changes(saved=[(instance, created)], using=using)
+
+
+@receiver(post_delete, sender=MedicalService)
+def medical_service_deleted(sender, instance, **kwargs):
+    """진료내역 삭제시 접수번호의 현재 단계와 담당 진행중 여부 재계산"""
+    from iamdt.models.staff_assignment import StaffAssignment
+
+    MedicalRegister.refresh_current_stage(instance.register_id)
+    StaffAssignment.sync_active([instance.register_id])
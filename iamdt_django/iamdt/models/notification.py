@@ -0,0 +1,96 @@
+__all__ = ["StaffNotification"]
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import Q
+
+from iamdt.models import MedicalService
+
+
+class StaffNotification(models.Model):
+    """진료내역 담당자 변경 알림 outbox 모델
+
+    담당자 변경 시그널에서 요청과 같은 트랜잭션으로 등록되고
+    notification_worker 커맨드가 모아서 발송한다.
+    발송에 실패한 알림은 발송일 없이 남아 재시도 대기 후 다시 발송된다.(attempts 회 까지)
+    """
+
+    class Action(models.TextChoices):
+        """담당자 등록/제외"""
+
+        ADD = "add", "등록"
+        REMOVE = "remove", "제외"
+
+    # m2m_changed action: 알림 종류
+    SIGNAL_ACTIONS = {"post_add": Action.ADD, "post_remove": Action.REMOVE}
+
+    service = models.ForeignKey(
+        MedicalService,
+        related_name="notifications",
+        verbose_name="진료내역",
+        on_delete=models.CASCADE,
+    )
+    staff = models.ForeignKey(
+        get_user_model(),
+        related_name="notifications",
+        verbose_name="담당자",
+        on_delete=models.CASCADE,
+    )
+    action = models.CharField("구분", choices=Action.choices, max_length=10)
+
+    created_at = models.DateTimeField("등록일", auto_now_add=True)
+    sent_at = models.DateTimeField("발송일", null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField("발송 시도", default=0)
+    claimed_at = models.DateTimeField(
+        "발송 시작일",
+        null=True,
+        blank=True,
+        help_text="워커가 마지막으로 가져간 시각. 실패시 재시도 대기 기준",
+    )
+
+    class Meta:
+        verbose_name = "담당자 알림"
+        verbose_name_plural = "담당자 알림 리스트"
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=Q(sent_at__isnull=True),
+                name="notification_pending_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.staff_id}/{self.service_id}({self.get_action_display()})"
+
+    @classmethod
+    def enqueue(cls, info) -> list:
+        """m2m_changed 시그널 정보로 알림을 등록한다
+
+        유저 조회 없이 INSERT 1회로 처리된다.
+        pre_* 액션과 clear는 무시한다.
+        """
+        action = cls.SIGNAL_ACTIONS.get(info["action"])
+        if action is None or not info["pk_set"]:
+            return []
+
+        instance_id = info["instance"].pk
+        if info["reverse"]:  # staff.schedule.add(service)
+            pairs = [(pk, instance_id) for pk in info["pk_set"]]
+        else:  # service.staff.add(staff)
+            pairs = [(instance_id, pk) for pk in info["pk_set"]]
+
+        return cls.bulk_enqueue(pairs, action, using=info["using"])
+
+    @classmethod
+    def bulk_enqueue(cls, pairs, action, using=None) -> list:
+        """(진료내역 id, 담당자 id) 목록으로 알림을 등록한다
+
+        시그널이 발생하지 않는 bulk_create 담당자 등록에서 직접 호출한다.
+        """
+        return cls.objects.using(using).bulk_create(
+            [
+                cls(service_id=service_id, staff_id=staff_id, action=action)
+                for service_id, staff_id in sorted(pairs)
+            ]
+        )
@@ -1,8 +1,11 @@
-__all__ = ["Patient"]
+__all__ = ["Patient", "patient_saved", "patient_deleted"]
 
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 from iamdt.models import Customer
+from iamdt_util.search import update_search_index, delete_search_index
 
 
 class Patient(models.Model):
@@ -18,6 +21,12 @@ class Patient(models.Model):
 
     name = models.CharField("이름", max_length=100)
 
+    # 진료 단계 이행 버전(낙관적 잠금)
+    # 진료내역 등록(MedicalServiceAddSerializer)시 조회한 버전과 같을 때만 1 증가시킨다.
+    service_version = models.PositiveIntegerField(
+        "진료 단계 버전", default=0, editable=False
+    )
+
     created_at = models.DateTimeField("등록일", auto_now_add=True)
     updated_at = models.DateTimeField("수정일", auto_now=True)
 
@@ -28,3 +37,15 @@ class Patient(models.Model):
 
     def __str__(self) -> str:
         return f"{self.companion}-{self.name}"
+
+
+@receiver(post_save, sender=Patient)
+def patient_saved(sender, instance, using, update_fields, **kwargs):
+    """환자정보 검색 인덱스 갱신"""
+    update_search_index(instance, using=using, update_fields=update_fields)
+
+
+@receiver(post_delete, sender=Patient)
+def patient_deleted(sender, instance, using, **kwargs):
+    """환자정보 검색 인덱스 삭제"""
+    delete_search_index(instance, using=using)
@@ -0,0 +1,113 @@
+__all__ = ["StaffAssignment"]
+
+from functools import reduce
+from operator import or_
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from iamdt.models import MedicalRegister
+from iamdt.models.choices import MedicalStage
+
+
+class StaffAssignment(models.Model):
+    """스태프별 담당 진료접수 비정규화 모델
+
+    스태프 스케쥴(/api/staffs/<id>/schedules) 조회용.
+    진료내역 담당자(MedicalStaff) → 진료내역 → 진료접수 서브쿼리 대신
+    (staff, register) 인덱스 범위 조회 1회로 담당 진료접수를 찾는다.
+
+    담당자 등록(record_service_changes), 담당자 삭제(MedicalStaff 삭제), 진료내역 저장에서 갱신된다.
+    어긋난 경우 backfill_staff_assignment 커맨드로 다시 계산한다.
+    """
+
+    staff = models.ForeignKey(
+        get_user_model(),
+        related_name="assignments",
+        verbose_name="담당자",
+        on_delete=models.CASCADE,
+    )
+    register = models.ForeignKey(
+        MedicalRegister,
+        related_name="staff_assignments",
+        verbose_name="진료접수",
+        on_delete=models.CASCADE,
+    )
+    last_assigned_at = models.DateTimeField("최근 담당 등록일")
+    active = models.BooleanField("진행중", default=True, help_text="퇴원 전 진료접수")
+
+    class Meta:
+        verbose_name = "스태프 담당 진료접수"
+        verbose_name_plural = "스태프 담당 진료접수 리스트"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["staff", "register"], name="staff_assignment_unique"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["staff", "register"],
+                condition=Q(active=True),
+                name="staff_assignment_active_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.staff_id}/{self.register_id}"
+
+    @staticmethod
+    def _active():
+        """진료접수가 퇴원 단계가 아니면 진행중"""
+        return ~Exists(
+            MedicalRegister.objects.filter(
+                pk=OuterRef("register"), last_stage=MedicalStage.DISCHARGE
+            )
+        )
+
+    @classmethod
+    def assign(cls, pairs, using=None) -> None:
+        """(담당자 id, 진료접수 id) 등록 또는 최근 담당 등록일 갱신"""
+        pairs = sorted(set(pairs))
+        if not pairs:
+            return
+
+        now = timezone.now()
+        manager = cls.objects.using(using)
+        manager.bulk_create(
+            [
+                cls(staff_id=staff, register_id=register, last_assigned_at=now)
+                for staff, register in pairs
+            ],
+            ignore_conflicts=True,
+        )
+        manager.filter(
+            reduce(
+                or_, (Q(staff=staff, register=register) for staff, register in pairs)
+            )
+        ).update(last_assigned_at=now, active=cls._active())
+
+    @classmethod
+    def prune(cls, *conditions, using=None, **filters) -> int:
+        """담당 진료내역이 남아있지 않은 항목 삭제(conditions, filters 로 대상 제한)"""
+        from iamdt.models import MedicalStaff
+
+        remains = MedicalStaff.objects.using(using).filter(
+            staff=OuterRef("staff"), detail__register=OuterRef("register")
+        )
+        deleted, _ = (
+            cls.objects.using(using)
+            .filter(*conditions, **filters)
+            .exclude(Exists(remains))
+            .delete()
+        )
+        return deleted
+
+    @classmethod
+    def sync_active(cls, register_ids=None, using=None) -> int:
+        """진료접수의 현재 단계로 진행중 여부 갱신(register_ids가 None이면 전체)"""
+        queryset = cls.objects.using(using)
+        if register_ids is not None:
+            queryset = queryset.filter(register__in=register_ids)
+        return queryset.update(active=cls._active())
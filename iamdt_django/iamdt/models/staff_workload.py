@@ -0,0 +1,107 @@
+__all__ = ["StaffWorkload"]
+
+from collections import Counter
+from functools import reduce
+from operator import or_
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import Case, F, Q, Value, When
+
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
+
+
+class StaffWorkload(models.Model):
+    """스태프별 진료단계 대기 건수 집계 모델
+
+    스태프 업무량(/api/staffs/workload) 조회용.
+    진료내역 담당자(MedicalStaff) ⨝ 대기 진료내역 집계 대신 (staff, stage)별 카운터를 읽는다.
+
+    담당자 등록, 진료내역 상태 변경(record_service_changes)과 담당자 저장/삭제 시그널에서
+    증감된다. 어긋난 경우 reconcile_staff_workload 커맨드로 다시 계산한다.
+    """
+
+    staff = models.ForeignKey(
+        get_user_model(),
+        related_name="workloads",
+        verbose_name="담당자",
+        on_delete=models.CASCADE,
+    )
+    stage = models.CharField("단계", choices=MedicalStage.choices, max_length=15)
+    waiting = models.IntegerField("대기 건수", default=0)
+
+    class Meta:
+        verbose_name = "스태프 업무량"
+        verbose_name_plural = "스태프 업무량 리스트"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["staff", "stage"], name="staff_workload_unique"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.staff_id}/{self.stage}: {self.waiting}"
+
+    @classmethod
+    def adjust(cls, deltas, using=None) -> None:
+        """{(담당자 id, 단계): 증감량} 만큼 대기 건수 증감(INSERT/UPDATE 각 1회)"""
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        manager = cls.objects.using(using)
+        manager.bulk_create(
+            [
+                cls(staff_id=staff, stage=stage)
+                for (staff, stage), delta in sorted(deltas.items())
+                if delta > 0
+            ],
+            ignore_conflicts=True,
+        )
+        conditions = {key: Q(staff=key[0], stage=key[1]) for key in sorted(deltas)}
+        manager.filter(reduce(or_, conditions.values())).update(
+            waiting=F("waiting")
+            + Case(
+                *(When(q, then=Value(deltas[key])) for key, q in conditions.items()),
+                default=Value(0),
+            )
+        )
+
+    @classmethod
+    def transition(cls, changes, using=None) -> Counter:
+        """[(진료내역, 저장 전 (단계, 상태))] 에서 바뀐 만큼의 담당자 대기 건수 증감량
+
+        저장 전 상태를 아는 진료내역이 있으면 담당자 조회 1회(쿼리 수가 상태 변경 여부와 무관).
+        저장 전 상태를 모르면(신규 등록) 무시한다. 반환한 증감량은 adjust 로 반영한다.
+        """
+        from iamdt.models import MedicalStaff
+
+        states = {
+            service.pk: (before, (service.stage, service.status))
+            for service, before in changes
+            if before is not None
+        }
+        deltas = Counter()
+        if not states:
+            return deltas
+
+        staff = MedicalStaff.objects.using(using).filter(detail__in=states)
+        for detail, pk in staff.values_list("detail", "staff"):
+            for (stage, status), delta in zip(states[detail], (-1, 1)):
+                if status == MedicalStageStatus.WAIT:
+                    deltas[(pk, stage)] += delta
+        return deltas
+
+    @classmethod
+    def counts(cls, using=None) -> dict:
+        """진료내역 담당자에서 다시 계산한 {(담당자 id, 단계): 대기 건수}"""
+        from iamdt.models import MedicalStaff
+
+        rows = (
+            MedicalStaff.objects.using(using)
+            .filter(detail__status=MedicalStageStatus.WAIT)
+            .values("staff", "detail__stage")
+            .annotate(waiting=models.Count("id"))
+            .order_by()
+        )
+        return {(row["staff"], row["detail__stage"]): row["waiting"] for row in rows}
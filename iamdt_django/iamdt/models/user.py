@@ -1,11 +1,18 @@
-__all__ = ["User"]
+__all__ = [
+    "User",
+    "user_phone_normalize",
+    "user_saved",
+    "user_deleted",
+]
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
 
 # Create your models here.
-from iamdt_util.validators import phone_validator
+from iamdt_util.search import update_search_index, delete_search_index
+from iamdt_util.validators import phone_validator, normalize_phone
 
 
 class User(AbstractUser):
@@ -41,6 +48,14 @@ class User(AbstractUser):
         validators=[phone_validator],
         help_text="SMS 수신이 가능한 연락처",
     )
+    phone_digits = models.CharField(
+        "연락처(숫자)",
+        max_length=11,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="발신번호 조회용. 저장시 연락처에서 숫자만 추출된다",
+    )
     messenger = models.CharField(
         "메신저",
         choices=MessengerType.choices,
@@ -57,3 +72,37 @@ class User(AbstractUser):
         verbose_name = "유저"
         verbose_name_plural = "유저 리스트"
         ordering = ["id"]
+
+    def save(self, *args, **kwargs):
+        # 연락처를 update_fields로 저장할 때 pre_save에서 채운 phone_digits도 함께 저장
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "phone" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "phone_digits"}
+        super().save(*args, **kwargs)
+
+
+@receiver(pre_save, sender=User)
+def user_phone_normalize(sender, instance, **kwargs):
+    """연락처를 숫자만 남겨 phone_digits에 저장"""
+    instance.phone_digits = normalize_phone(instance.phone)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, using, update_fields, **kwargs):
+    """스태프정보 검색 인덱스 갱신, 인증 유저 캐시 무효화"""
+    # ModelBackend는 모듈 로드시 유저 모델을 조회하므로 함수 안에서 import
+    from iamdt_util.auth import forget_user
+
+    update_search_index(instance, using=using, update_fields=update_fields)
+    # 로그인시 last_login만 저장하는 경우는 유저 캐시를 유지한다
+    if update_fields is None or not set(update_fields) <= {"last_login"}:
+        forget_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, using, **kwargs):
+    """스태프정보 검색 인덱스 삭제, 인증 유저 캐시 무효화"""
+    from iamdt_util.auth import forget_user
+
+    delete_search_index(instance, using=using)
+    forget_user(instance.pk)
@@ -4,3 +4,12 @@ from .patient_test import *
 from .medical_register_test import *
 from .medical_service_test import *
 from .medical_staff_test import *
+from .notification_test import *
+from .messenger_test import *
+from .change_log_test import *
+from .staff_assignment_test import *
+from .staff_workload_test import *
+from .gen_clinic_data_test import *
+from .bench_api_test import *
+from .bench_serializers_test import *
+from .importtime_report_test import *
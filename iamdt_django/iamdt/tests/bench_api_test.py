@@ -0,0 +1,102 @@
+__all__ = ["BenchApiTestCase"]
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from iamdt.management.commands.bench_api import api_routes, percentile
+from iamdt.models import MedicalService
+
+
+class BenchApiTestCase(TestCase):
+    """API 벤치마크 커맨드 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def bench(self, name, *args) -> tuple:
+        """(리포트, 출력)"""
+        output = os.path.join(self.directory.name, name)
+        out = StringIO()
+        call_command(
+            "bench_api",
+            "--concurrency=1",
+            "--requests=4",
+            "--warmup=1",
+            f"--output={output}",
+            *args,
+            stdout=out,
+        )
+        with open(output, encoding="utf-8") as f:
+            return json.load(f), out.getvalue()
+
+    def test_percentile(self) -> None:
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+
+    def test_routes(self) -> None:
+        """GET 가능한 api 라우트"""
+        routes = dict(api_routes())
+        self.assertIn("api:service:list", routes)
+        self.assertIn("api:staff:schedules", routes)
+        self.assertNotIn("api:auth:login", routes)  # POST 만
+        self.assertNotIn("api:service:bulk", routes)
+
+    def test_report(self) -> None:
+        """전체 라우트 리포트"""
+        report, _ = self.bench("bench.json")
+
+        self.assertEqual(report["meta"]["requests"], 4)
+        self.assertEqual(
+            report["meta"]["rows"]["service"], MedicalService.objects.count()
+        )
+        self.assertNotIn("api:auth:logout", report["routes"])
+
+        for name, row in report["routes"].items():
+            with self.subTest(route=name):
+                self.assertEqual(row["requests"], 4)
+                self.assertEqual(row["status"], {"200": 4})
+                latency = row["latency_ms"]
+                self.assertLessEqual(latency["p50"], latency["p95"])
+                self.assertLessEqual(latency["p95"], latency["p99"])
+
+        detail = report["routes"]["api:service:detail"]
+        self.assertRegex(detail["path"], r"^/api/services/\d+$")
+        self.assertGreater(detail["queries"]["max"], 0)
+
+    def test_cache(self) -> None:
+        """응답 캐시 hit 비율, --no-cache"""
+        route = "--route=api:customer:list"
+        report, _ = self.bench("cached.json", route)
+        self.assertEqual(report["routes"]["api:customer:list"]["cache_hit_ratio"], 1)
+
+        report, _ = self.bench("nocache.json", route, "--no-cache")
+        self.assertEqual(report["routes"]["api:customer:list"]["cache_hit_ratio"], 0)
+
+    def test_compare(self) -> None:
+        route = "--route=api:service:list"
+        self.bench("before.json", route)
+        before = os.path.join(self.directory.name, "before.json")
+        _, out = self.bench("after.json", route, f"--compare={before}")
+        self.assertIn("비교:", out)
+        self.assertRegex(out, r"api:service:list +p95")
+
+    def test_unknown_route(self) -> None:
+        with self.assertRaises(CommandError):
+            self.bench("bench.json", "--route=api:unknown")
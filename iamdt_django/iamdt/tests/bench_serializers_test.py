@@ -0,0 +1,87 @@
+__all__ = ["BenchSerializersTestCase"]
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from iamdt.management.commands.bench_serializers import cycle, scenarios
+
+
+class BenchSerializersTestCase(TestCase):
+    """시리얼라이저 벤치마크 커맨드 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def bench(self, name, *args) -> tuple:
+        """(결과, 출력)"""
+        output = os.path.join(self.directory.name, name)
+        out = StringIO()
+        call_command(
+            "bench_serializers",
+            "--sizes=1,7",
+            "--repeat=1",
+            "--min-time=0",
+            f"--output={output}",
+            *args,
+            stdout=out,
+        )
+        with open(output, encoding="utf-8") as f:
+            return json.load(f), out.getvalue()
+
+    def test_cycle(self) -> None:
+        self.assertEqual(cycle([1, 2, 3], 7), [1, 2, 3, 1, 2, 3, 1])
+
+    def test_report(self) -> None:
+        """전체 시나리오, 검증 입력은 모두 유효"""
+        report, _ = self.bench("bench.json")
+
+        self.assertEqual(report["meta"]["sizes"], [1, 7])
+        self.assertEqual(report["scenarios"].keys(), scenarios().keys())
+        for name, operations in report["scenarios"].items():
+            for operation, rows in operations.items():
+                with self.subTest(scenario=name, operation=operation):
+                    self.assertEqual(rows.keys(), {"1", "7"})
+                    self.assertGreater(rows["7"]["ops_per_sec"], 0)
+                    self.assertGreater(rows["7"]["alloc_peak_kb"], 0)
+                    if operation == "is_valid":
+                        self.assertEqual(rows["7"]["valid"], 7)
+
+        scenario = report["scenarios"]
+        self.assertEqual(scenario["customer"]["to_representation"]["7"]["queries"], 0)
+        # 목록 시리얼라이저는 건수와 관계없이 2회
+        self.assertEqual(scenario["register"]["to_representation"]["7"]["queries"], 2)
+        # 담당자 pk 입력은 건수와 관계없이 1회(SimpleStaffListField)
+        self.assertEqual(scenario["simple_staff_field"]["is_valid"]["7"]["queries"], 1)
+
+    def test_compare(self) -> None:
+        scenario = "--scenario=simple_staff_field"
+        self.bench("before.json", scenario)
+        before = os.path.join(self.directory.name, "before.json")
+        _, out = self.bench(
+            "after.json", scenario, "--scenario=patient", f"--compare={before}"
+        )
+
+        self.assertIn("비교:", out)
+        self.assertRegex(out, r"simple_staff_field\.is_valid +7건 +\d+ → +\d+ ops/s")
+        self.assertRegex(out, r"patient\.is_valid +7건  \(신규\)")
+
+    def test_invalid_options(self) -> None:
+        with self.assertRaises(CommandError):
+            self.bench("bench.json", "--scenario=unknown")
+        with self.assertRaises(CommandError):
+            self.bench("bench.json", "--sizes=0")
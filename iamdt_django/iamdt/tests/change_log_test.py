@@ -0,0 +1,69 @@
+__all__ = ["ChangeLogTestCase"]
+
+from django.db import transaction
+from django.test import TestCase
+
+from iamdt.models import ChangeLog, Customer, MedicalService
+
+
+class ChangeLogTestCase(TestCase):
+    """변경 이력 시그널 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.since = ChangeLog.objects.last().id
+
+    def entries(self) -> list:
+        return list(
+            ChangeLog.objects.filter(id__gt=self.since).values_list(
+                "model", "object_id", "action"
+            )
+        )
+
+    def test_save_delete(self) -> None:
+        """등록/수정/삭제(tombstone) 순서대로 기록"""
+        customer = Customer.objects.create(name="신규", phone="010-1111-2222")
+        customer.name = "변경"
+        customer.save()
+        pk = customer.pk
+        customer.delete()
+
+        self.assertEqual(
+            self.entries(),
+            [
+                ("customer", pk, "create"),
+                ("customer", pk, "update"),
+                ("customer", pk, "delete"),
+            ],
+        )
+
+    def test_service(self) -> None:
+        """진료내역 저장/담당자 변경은 접수번호 현재 단계와 함께 기록"""
+        service = MedicalService.objects.get(id=6)
+        service.status = "complete"
+        service.save()
+        service.staff.add(4)
+
+        self.assertEqual(
+            self.entries(),
+            [
+                ("medicalservice", 6, "update"),
+                ("medicalregister", 2, "update"),
+                ("medicalservice", 6, "update"),
+            ],
+        )
+
+    def test_rollback(self) -> None:
+        """변경이 롤백되면 이력도 남지 않는다"""
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            Customer.objects.create(name="신규", phone="010-1111-2222")
+            raise RuntimeError
+        self.assertEqual(self.entries(), [])
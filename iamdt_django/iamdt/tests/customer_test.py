@@ -1,9 +1,13 @@
 __all__ = ["CustomerModelTestCase"]
 
+from io import StringIO
+
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
-from iamdt.models import Customer
+from iamdt.models import Customer, User
+from iamdt_util.validators import normalize_phone
 
 
 class CustomerModelTestCase(TestCase):
@@ -84,3 +88,37 @@ class CustomerModelTestCase(TestCase):
         customer.phone = ""
         with self.assertRaises(ValidationError):
             customer.full_clean()
+
+    def test_phone_digits(self) -> None:
+        """저장시 연락처(숫자) 정규화"""
+        customer = Customer.objects.create(name="고객6", phone="010-2222-3333")
+        self.assertEqual(customer.phone_digits, "01022223333")
+
+        # fixture 로드시에도 채워진다
+        customer = Customer.objects.get(**self.customer1_info)
+        self.assertEqual(customer.phone_digits, "01011112222")
+
+        # 연락처만 저장(update_fields)해도 함께 갱신된다
+        customer.phone = "010-3333-4444"
+        customer.save(update_fields=["phone"])
+        customer.refresh_from_db()
+        self.assertEqual(customer.phone_digits, "01033334444")
+
+    def test_backfill_phone_digits(self) -> None:
+        """백필 커맨드는 저장시와 같은 정규화(공백, 괄호 제거)"""
+        customer = Customer.objects.get(**self.customer5_info)
+        Customer.objects.filter(id=customer.id).update(
+            phone="(010) 5555-6666", phone_digits=""
+        )
+        user = User.objects.first()
+        User.objects.filter(id=user.id).update(phone_digits="")
+
+        call_command("backfill_phone_digits", "--batch-size=1", stdout=StringIO())
+
+        customer.refresh_from_db()
+        user.refresh_from_db()
+        self.assertEqual(customer.phone_digits, "01055556666")
+        self.assertEqual(user.phone_digits, normalize_phone(user.phone))
+        self.assertFalse(
+            Customer.objects.exclude(phone_digits__regex=r"^\d+$").exists()
+        )
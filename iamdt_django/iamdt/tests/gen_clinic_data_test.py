@@ -0,0 +1,128 @@
+__all__ = ["GenClinicDataTestCase"]
+
+import random
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from iamdt.management.commands.gen_clinic_data import stage_chain
+from iamdt.models import (
+    Customer,
+    MedicalRegister,
+    MedicalService,
+    Patient,
+    StaffAssignment,
+    StaffWorkload,
+)
+from iamdt.models.choices import MedicalStage, MedicalStageStatus, POSSIBLE_STAGES
+from iamdt_util.search import search_sql
+
+
+class GenClinicDataTestCase(TestCase):
+    """대량 테스트 데이터 생성 커맨드 테스트"""
+
+    fixtures = ["user.json"]
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "gen_clinic_data",
+            "--customers=12",
+            "--visits=3",
+            "--staff=8",
+            "--batch-size=5",
+            "--active-ratio=0.5",
+            "--seed=1",
+            stdout=StringIO(),
+        )
+
+    def test_stage_chain(self) -> None:
+        """접수부터 퇴원까지 이행 가능한 단계"""
+        rng = random.Random(0)
+        for _ in range(100):
+            chain = stage_chain(rng, max_length=5)
+            self.assertEqual(chain[0], MedicalStage.REGISTER)
+            self.assertEqual(chain[-1], MedicalStage.DISCHARGE)
+            self.assertLessEqual(len(chain), 7)
+            for prev, stage in zip(chain, chain[1:]):
+                self.assertIn(stage, POSSIBLE_STAGES[prev])
+
+    def test_counts(self) -> None:
+        self.assertEqual(Customer.objects.count(), 12)
+        self.assertEqual(
+            get_user_model().objects.filter(is_staff=True, is_active=True).count(), 8
+        )
+        for patient in Patient.objects.all():
+            self.assertEqual(patient.registers.count(), 3)
+            self.assertEqual(patient.service_version, patient.services.count())
+
+    def test_registers(self) -> None:
+        """진료내역 단계/상태와 진료접수 현재 단계"""
+        for register in MedicalRegister.objects.all():
+            services = list(register.details.order_by("id"))
+            last = services[-1]
+            self.assertEqual(services[0].stage, MedicalStage.REGISTER)
+            for prev, service in zip(services, services[1:]):
+                self.assertIn(service.stage, POSSIBLE_STAGES[prev.stage])
+                self.assertEqual(prev.status, MedicalStageStatus.COMPLETE)
+            self.assertEqual(
+                (register.last_service_id, register.last_stage, register.last_status),
+                (last.id, last.stage, last.status),
+            )
+            # 퇴원하지 않은(진행중) 방문만 대기
+            self.assertEqual(
+                last.status == MedicalStageStatus.WAIT,
+                last.stage != MedicalStage.DISCHARGE,
+            )
+            self.assertTrue(last.staff.exists())
+
+        # 진행중인 방문은 환자의 마지막 방문
+        active = MedicalRegister.objects.exclude(last_stage=MedicalStage.DISCHARGE)
+        self.assertTrue(active.exists())
+        for register in active:
+            self.assertFalse(register.patient.registers.filter(id__gt=register.id))
+
+    def test_staff_data(self) -> None:
+        """스태프 담당 진료접수/업무량은 다시 계산한 값과 같다"""
+        generated = set(
+            StaffAssignment.objects.values_list("staff", "register", "active")
+        )
+        call_command("backfill_staff_assignment", stdout=StringIO())
+        self.assertEqual(
+            set(StaffAssignment.objects.values_list("staff", "register", "active")),
+            generated,
+        )
+
+        workload = {
+            (row.staff_id, row.stage): row.waiting
+            for row in StaffWorkload.objects.filter(waiting__gt=0)
+        }
+        self.assertEqual(workload, StaffWorkload.counts())
+        self.assertEqual(
+            sum(workload.values()),
+            MedicalService.objects.filter(status=MedicalStageStatus.WAIT)
+            .values("staff")
+            .count(),
+        )
+
+    def test_search_index(self) -> None:
+        """고객 검색 인덱스"""
+        customer = Customer.objects.last()
+        sql, params = search_sql(Customer, "name", customer.name)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            self.assertIn(customer.pk, [row[0] for row in cursor.fetchall()])
+
+    def test_append(self) -> None:
+        """다시 실행하면 이어서 생성(연락처 중복 없음)"""
+        call_command(
+            "gen_clinic_data", "--customers=3", "--visits=1", stdout=StringIO()
+        )
+        self.assertEqual(Customer.objects.count(), 15)
+        self.assertEqual(
+            Customer.objects.values("phone").distinct().count(),
+            Customer.objects.count(),
+        )
@@ -0,0 +1,94 @@
+__all__ = ["ImporttimeReportTestCase"]
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from iamdt.management.commands.importtime_report import (
+    parse_importtime,
+    summarize_packages,
+)
+
+
+class ImporttimeReportTestCase(SimpleTestCase):
+    """시작(import) 비용 측정 커맨드 테스트"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def report(self, *args) -> dict:
+        output = os.path.join(self.directory.name, "importtime.json")
+        call_command(
+            "importtime_report",
+            "--runs=1",
+            "--top=5",
+            f"--output={output}",
+            *args,
+            stdout=StringIO(),
+        )
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_parse(self) -> None:
+        """importer(부모 모듈)와 단계 구분"""
+        lines = [
+            "import time: self [us] | cumulative | imported package",
+            "importtime_report:setup",
+            "import time:        10 |         10 |     a.b.c",
+            "import time:        20 |         30 |   a.b",
+            "import time:         5 |          5 |   a.d",
+            "import time:       100 |        135 | a",
+            "importtime_report:urls",
+            "import time:         7 |          7 | e",
+        ]
+        entries = parse_importtime(lines)
+        self.assertEqual(
+            [(e["module"], e["importer"], e["phase"]) for e in entries],
+            [
+                ("a.b.c", "a.b", "setup"),
+                ("a.b", "a", "setup"),
+                ("a.d", "a", "setup"),
+                ("a", None, "setup"),
+                ("e", None, "urls"),
+            ],
+        )
+        packages = summarize_packages(entries)
+        self.assertEqual(list(packages), ["a", "e"])
+        self.assertEqual(packages["a"]["modules"], 4)
+        self.assertEqual(packages["a"]["self_ms"], 0.14)
+
+    def test_production(self) -> None:
+        """운영 프로필은 개발용 앱을 import 하지 않는다"""
+        report = self.report(
+            "--profile=config.settings.production", "--path=/api/services"
+        )
+        result = report["profiles"]["config.settings.production"]
+        self.assertEqual(result["views"], {"/api/services": "api:service:list"})
+        self.assertGreater(result["startup"]["total_ms"], 0)
+        self.assertGreater(result["maxrss_kb"], 0)
+        self.assertEqual(len(result["top"]), 5)
+        for package in ["silk", "django_extensions"]:
+            self.assertNotIn(package, result["packages"])
+
+    def test_doc(self) -> None:
+        """문서 URL 설정은 URL 로딩 단계에서 import"""
+        report = self.report(
+            "--profile=config.settings.production", "--path=/api/doc/swagger"
+        )
+        result = report["profiles"]["config.settings.production"]
+        self.assertEqual(result["views"], {"/api/doc/swagger": "api:doc:swagger"})
+        self.assertIn("iamdt_api.views.doc", result["imported"])
+        self.assertIn("urls", result["packages"]["drf_spectacular"]["phases"])
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(CommandError):
+            call_command("importtime_report", "--runs=0", stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command(
+                "importtime_report", "--profile=config.settings.none", stdout=StringIO()
+            )
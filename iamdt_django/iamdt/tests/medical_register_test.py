@@ -1,11 +1,14 @@
-__all__ = ["MedicalRegisterModelTestCase"]
+__all__ = ["MedicalRegisterModelTestCase", "MedicalRegisterCurrentStageTestCase"]
+
+from io import StringIO
 
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
-from iamdt.models import Patient
+from iamdt.models import Patient, MedicalService
 from iamdt.models.medical_register import MedicalRegister
-from iamdt.models.choices import MedicalStage
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
 
 
 class MedicalRegisterModelTestCase(TestCase):
@@ -46,3 +49,74 @@ class MedicalRegisterModelTestCase(TestCase):
 
         with self.assertRaises(ValueError):
             self.register.patient = 9999
+
+
+class MedicalRegisterCurrentStageTestCase(TestCase):
+    """진료 접수 현재 단계 비정규화 필드 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+    ]
+
+    def setUp(self) -> None:
+        # 접수2 의 마지막 진료내역 {"pk": 6, "stage": "examination", "status": "wait"}
+        self.register = MedicalRegister.objects.get(id=2)
+        self.service = MedicalService.objects.get(id=6)
+
+    def test_current_stage(self) -> None:
+        """진료내역 저장시 현재 단계가 반영되어 있는지"""
+        self.assertEqual(self.register.last_service_id, 6)
+        self.assertEqual(self.register.last_stage, MedicalStage.EXAMINATION)
+        self.assertEqual(self.register.last_status, MedicalStageStatus.WAIT)
+        self.assertEqual(self.register.current_stage, str(self.service))
+
+    def test_current_stage_no_query(self) -> None:
+        """현재 단계 조회시 진료내역 쿼리가 없어야 한다"""
+        register = MedicalRegister.objects.select_related("patient__companion").get(
+            id=2
+        )
+        with self.assertNumQueries(0):
+            register.current_stage
+
+    def test_update_status(self) -> None:
+        """상태 변경시 갱신"""
+        self.service.status = MedicalStageStatus.COMPLETE
+        self.service.save()
+
+        self.register.refresh_from_db()
+        self.assertEqual(self.register.last_status, MedicalStageStatus.COMPLETE)
+
+    def test_update_old_service(self) -> None:
+        """이전 진료내역이 저장되어도 현재 단계는 바뀌지 않는다"""
+        old = MedicalService.objects.get(id=5)
+        old.save()
+
+        self.register.refresh_from_db()
+        self.assertEqual(self.register.last_service_id, 6)
+
+    def test_delete_service(self) -> None:
+        """마지막 진료내역 삭제시 이전 진료내역으로 재계산"""
+        self.service.delete()
+
+        self.register.refresh_from_db()
+        self.assertEqual(self.register.last_service_id, 5)
+        self.assertEqual(self.register.last_stage, MedicalStage.REGISTER)
+        self.assertEqual(self.register.last_status, MedicalStageStatus.COMPLETE)
+
+    def test_backfill_command(self) -> None:
+        """백필 커맨드"""
+        MedicalRegister.objects.update(
+            last_service=None,
+            last_stage=MedicalStage.REGISTER,
+            last_status=MedicalStageStatus.WAIT,
+        )
+        call_command("backfill_register_stage", stdout=StringIO())
+
+        self.register.refresh_from_db()
+        self.assertEqual(self.register.last_service_id, 6)
+        self.assertEqual(self.register.last_stage, MedicalStage.EXAMINATION)
+        self.assertEqual(MedicalRegister.objects.get(id=1).last_service_id, 4)
@@ -0,0 +1,198 @@
+__all__ = ["MessengerDispatcherTestCase"]
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from iamdt.models import MedicalService, StaffNotification
+from iamdt_util.messenger import reset_dispatchers, send_messages
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """메신저 API 대신 요청을 기록하는 로컬 HTTP 서버 핸들러"""
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode()
+
+        with server.lock:
+            server.requests.append((self.path.split("?")[0], body))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            status = server.statuses.pop(0) if server.statuses else 200
+
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MessengerDispatcherTestCase(TestCase):
+    """메신저 발송기 테스트(로컬 stub 서버)"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.endpoint = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        self.server.requests = []
+        self.server.statuses = []
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.delay = 0
+
+        self.settings_override = override_settings(
+            MESSENGER_DISPATCHERS={
+                "kakaotalk": {
+                    "ENDPOINT": f"{self.endpoint}/kakaotalk",
+                    "CONCURRENCY": 2,
+                    "BACKOFF": 0.01,
+                },
+                "facebook": {"ENDPOINT": f"{self.endpoint}/facebook", "BACKOFF": 0.01},
+            }
+        )
+        self.settings_override.enable()
+        reset_dispatchers()
+
+        self.doctor1 = get_user_model().objects.get(id=2)  # kakaotalk
+        self.employee1 = get_user_model().objects.get(id=4)  # facebook
+        self.admin = get_user_model().objects.get(id=1)  # 메신저 없음
+
+    def tearDown(self) -> None:
+        self.settings_override.disable()
+        reset_dispatchers()
+
+    def test_send(self) -> None:
+        """메신저 종류별 요청 형식으로 발송, 메신저가 없으면 발송 안함"""
+        results = send_messages(
+            [(self.doctor1, "a"), (self.employee1, "b"), (self.admin, "c")]
+        )
+
+        self.assertEqual(results, [True, True, None])
+        requests = dict(self.server.requests)
+        self.assertIn("doc1", json.dumps(requests["/kakaotalk"]))
+        self.assertEqual(
+            json.loads(requests["/facebook"]),
+            {"recipient": {"id": "e1"}, "message": {"text": "b"}},
+        )
+
+    def test_concurrency(self) -> None:
+        """채널별 동시 발송 수 제한"""
+        self.server.delay = 0.05
+
+        results = send_messages([(self.doctor1, str(i)) for i in range(6)])
+
+        self.assertEqual(results, [True] * 6)
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertEqual(self.server.max_active, 2)
+
+    def test_retry(self) -> None:
+        """5xx 응답은 재시도, 4xx 응답은 실패 처리"""
+        self.server.statuses = [503, 500]
+        self.assertEqual(send_messages([(self.doctor1, "a")]), [True])
+        self.assertEqual(len(self.server.requests), 3)
+
+        self.server.requests = []
+        self.server.statuses = [400]
+        with self.assertLogs("iamdt_util.messenger", level="WARNING"):
+            self.assertEqual(send_messages([(self.doctor1, "a")]), [False])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_worker(self) -> None:
+        """알림 워커에서 outbox 배치를 메신저로 발송"""
+        service = MedicalService.objects.get(id=6)
+        service.staff.add(self.employee1)
+
+        with self.assertLogs("iamdt_util.notification", level="INFO"):
+            call_command("notification_worker", "--once", stdout=StringIO())
+
+        self.assertEqual([path for path, _ in self.server.requests], ["/facebook"])
+        self.assertFalse(StaffNotification.objects.filter(sent_at__isnull=True))
+
+    def test_worker_failure(self) -> None:
+        """발송 실패한 알림만 발송일 없이 남고 재시도 대기 후 다시 발송"""
+        service = MedicalService.objects.get(id=6)
+        service.staff.add(self.admin, self.employee1)  # 메신저 없음(발송 안함), 실패
+        self.server.statuses = [400]
+
+        with self.assertLogs(
+            "iamdt.management.commands.notification_worker", "WARNING"
+        ):
+            call_command("notification_worker", "--once", stdout=StringIO())
+
+        pending = StaffNotification.objects.get(sent_at__isnull=True)
+        self.assertEqual(pending.attempts, 1)
+        self.assertIsNotNone(pending.claimed_at)
+        self.assertEqual(
+            StaffNotification.objects.filter(sent_at__isnull=False).count(), 1
+        )
+
+        # 재시도 대기 중에는 다시 가져오지 않는다
+        self.server.requests = []
+        call_command("notification_worker", "--once", stdout=StringIO())
+        self.assertEqual(self.server.requests, [])
+
+        call_command(
+            "notification_worker", "--once", "--retry-delay=0", stdout=StringIO()
+        )
+        self.assertEqual(len(self.server.requests), 1)
+        pending.refresh_from_db()
+        self.assertIsNotNone(pending.sent_at)
+        self.assertEqual(pending.attempts, 2)
+
+    def test_worker_max_attempts(self) -> None:
+        """최대 시도 횟수 만큼 실패하면 더 발송하지 않는다"""
+        MedicalService.objects.get(id=6).staff.add(self.employee1)
+        self.server.statuses = [400, 400]
+
+        out = StringIO()
+        with self.assertLogs(
+            "iamdt.management.commands.notification_worker", "WARNING"
+        ):
+            for _ in range(3):
+                call_command(
+                    "notification_worker",
+                    "--once",
+                    "--retry-delay=0",
+                    "--max-attempts=2",
+                    stdout=out,
+                )
+
+        self.assertEqual(len(self.server.requests), 2)
+        notification = StaffNotification.objects.get()
+        self.assertIsNone(notification.sent_at)
+        self.assertEqual(notification.attempts, 2)
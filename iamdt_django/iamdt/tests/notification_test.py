@@ -0,0 +1,66 @@
+__all__ = ["StaffNotificationTestCase"]
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from iamdt.models import MedicalService, StaffNotification
+
+
+class StaffNotificationTestCase(TestCase):
+    """담당자 변경 알림 outbox 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.service = MedicalService.objects.get(id=6)
+        self.doctor1 = get_user_model().objects.get(id=2)
+        self.employee1 = get_user_model().objects.get(id=4)
+
+    def test_enqueue(self) -> None:
+        """담당자 변경시 outbox에 INSERT 1회로 등록"""
+        # 조회, m2m INSERT, outbox INSERT, 스태프 담당 진료접수 INSERT/UPDATE,
+        # 스태프 업무량 INSERT/UPDATE, 진료내역 수정일 UPDATE, 변경 이력 INSERT
+        with self.assertNumQueries(9):
+            self.service.staff.add(self.employee1, 5)
+
+        pending = StaffNotification.objects.filter(sent_at__isnull=True)
+        self.assertEqual(
+            list(pending.values_list("staff", "action")),
+            [(4, StaffNotification.Action.ADD), (5, StaffNotification.Action.ADD)],
+        )
+
+    def test_enqueue_reverse(self) -> None:
+        """스태프 쪽에서 변경해도 등록"""
+        self.employee1.schedule.remove(MedicalService.objects.get(id=1))
+
+        notification = StaffNotification.objects.get()
+        self.assertEqual(notification.service_id, 1)
+        self.assertEqual(notification.staff_id, 4)
+        self.assertEqual(notification.action, StaffNotification.Action.REMOVE)
+
+    def test_worker(self) -> None:
+        """워커가 중복을 제외하고 발송 후 발송일 기록"""
+        self.service.staff.add(self.employee1)
+        self.service.staff.remove(self.employee1)
+        self.service.staff.add(self.employee1)
+        StaffNotification.objects.create(
+            service=self.service,
+            staff=self.employee1,
+            action=StaffNotification.Action.ADD,
+        )
+
+        with self.assertLogs("iamdt_util.notification", level="INFO") as logs:
+            call_command("notification_worker", "--once", stdout=StringIO())
+
+        self.assertEqual(len(logs.output), 2)  # 등록 1 + 제외 1
+        self.assertFalse(StaffNotification.objects.filter(sent_at__isnull=True))
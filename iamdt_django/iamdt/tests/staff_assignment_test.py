@@ -0,0 +1,115 @@
+__all__ = ["StaffAssignmentTestCase"]
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from iamdt.models import MedicalService, MedicalStaff, StaffAssignment
+
+
+class StaffAssignmentTestCase(TestCase):
+    """스태프 담당 진료접수 비정규화 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def assignments(self, staff) -> dict:
+        """진료접수 id: 진행중 여부"""
+        return dict(
+            StaffAssignment.objects.filter(staff=staff).values_list(
+                "register", "active"
+            )
+        )
+
+    def test_fixture(self) -> None:
+        """담당자 직접 등록(fixture)도 반영. 퇴원한 진료접수는 진행중이 아니다"""
+        self.assertEqual(self.assignments(2), {1: False, 2: True})
+        self.assertEqual(self.assignments(3), {2: True})
+
+    def test_add_remove(self) -> None:
+        """담당 등록/제외. 같은 진료접수의 다른 담당이 남아있으면 유지"""
+        service = MedicalService.objects.get(id=6)
+        before = StaffAssignment.objects.get(staff=2, register=2).last_assigned_at
+
+        service.staff.add(5)
+        MedicalService.objects.get(id=5).staff.add(2)  # 같은 진료접수(2)
+        self.assertEqual(self.assignments(5), {2: True})
+        self.assertGreater(
+            StaffAssignment.objects.get(staff=2, register=2).last_assigned_at, before
+        )
+
+        service.staff.remove(2, 5)
+        self.assertEqual(self.assignments(5), {})
+        self.assertEqual(self.assignments(2), {1: False, 2: True})
+
+        service.staff.clear()
+        self.assertEqual(self.assignments(3), {})
+
+    def test_staff_change(self) -> None:
+        """담당자(MedicalStaff) 수정시 이전 스태프의 남은 담당이 없으면 삭제"""
+        staff = MedicalStaff.objects.get(detail=6, staff=3)
+        staff.save()
+        self.assertEqual(self.assignments(3), {2: True})
+
+        staff.staff_id = 5
+        staff.save()
+        self.assertEqual(self.assignments(3), {})
+        self.assertEqual(self.assignments(5), {2: True})
+
+        # 같은 진료접수의 다른 담당(진료내역 6)이 남아있으면 유지
+        staff = MedicalStaff.objects.create(detail_id=5, staff_id=5)
+        staff.detail_id = 1
+        staff.save()
+        self.assertEqual(self.assignments(5), {1: False, 2: True})
+
+    def test_reverse(self) -> None:
+        """스태프 기준 등록/비우기"""
+        staff = get_user_model().objects.get(id=5)
+        staff.schedule.add(7, 8)
+        self.assertEqual(self.assignments(5), {3: True, 4: True})
+
+        staff.schedule.clear()
+        self.assertEqual(self.assignments(5), {})
+
+    def test_active(self) -> None:
+        """퇴원 단계가 등록되면 진행중 해제, 삭제되면 복구"""
+        service = MedicalService.objects.create(
+            patient_id=1, register_id=2, stage="discharge", creator_id=2
+        )
+        self.assertEqual(self.assignments(3), {2: False})
+
+        service.delete()
+        self.assertEqual(self.assignments(3), {2: True})
+
+    def test_service_delete(self) -> None:
+        """진료내역 삭제(담당자 CASCADE)시 남은 담당이 없으면 삭제"""
+        MedicalService.objects.get(id=10).delete()
+        self.assertNotIn(6, self.assignments(4))
+
+    def test_backfill(self) -> None:
+        """백필 커맨드"""
+        expected = list(
+            StaffAssignment.objects.order_by("staff", "register").values_list(
+                "staff", "register", "active"
+            )
+        )
+        StaffAssignment.objects.all().delete()
+
+        call_command("backfill_staff_assignment", stdout=StringIO())
+
+        self.assertEqual(
+            list(
+                StaffAssignment.objects.order_by("staff", "register").values_list(
+                    "staff", "register", "active"
+                )
+            ),
+            expected,
+        )
@@ -0,0 +1,132 @@
+__all__ = ["StaffWorkloadTestCase"]
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from iamdt.models import MedicalService, MedicalStaff, StaffWorkload
+
+
+class StaffWorkloadTestCase(TestCase):
+    """스태프 업무량 집계 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def workload(self, staff) -> dict:
+        """대기 건수가 있는 단계: 건수"""
+        return dict(
+            StaffWorkload.objects.filter(staff=staff)
+            .exclude(waiting=0)
+            .values_list("stage", "waiting")
+        )
+
+    def assertReconciled(self) -> None:
+        counts = {
+            key: waiting for key, waiting in StaffWorkload.counts().items() if waiting
+        }
+        current = {
+            (row.staff_id, row.stage): row.waiting
+            for row in StaffWorkload.objects.exclude(waiting=0)
+        }
+        self.assertEqual(current, counts)
+
+    def test_fixture(self) -> None:
+        """담당자 직접 등록(fixture)도 반영. 완료된 진료내역은 세지 않는다"""
+        self.assertEqual(self.workload(2), {"examination": 1})
+        self.assertEqual(self.workload(3), {"examination": 1})
+        self.assertEqual(self.workload(4), {})
+
+    def test_add_remove(self) -> None:
+        """담당 등록/제외/비우기"""
+        service = MedicalService.objects.get(id=6)
+        service.staff.add(4, 5)
+        self.assertEqual(self.workload(4), {"examination": 1})
+
+        service.staff.remove(4)
+        self.assertEqual(self.workload(4), {})
+
+        service.staff.clear()
+        self.assertEqual(self.workload(2), {})
+        self.assertEqual(self.workload(5), {})
+        self.assertReconciled()
+
+    def test_reverse(self) -> None:
+        """스태프 기준 등록/비우기. 완료된 진료내역은 세지 않는다"""
+        staff = get_user_model().objects.get(id=5)
+        staff.schedule.add(5, 6)
+        self.assertEqual(self.workload(5), {"examination": 1})
+
+        staff.schedule.clear()
+        self.assertEqual(self.workload(5), {})
+        self.assertReconciled()
+
+    def test_status(self) -> None:
+        """상태 변경시 감소. 같은 객체를 다시 저장해도 중복 감소하지 않는다"""
+        service = MedicalService.objects.get(id=6)
+        service.status = "complete"
+        service.save()
+        service.save()
+        self.assertEqual(self.workload(2), {})
+        self.assertEqual(self.workload(3), {})
+
+        service.status = "wait"
+        service.save()
+        self.assertEqual(self.workload(2), {"examination": 1})
+        self.assertReconciled()
+
+    def test_staff_resave(self) -> None:
+        """담당자(MedicalStaff)를 바뀐 내용 없이 다시 저장하면 증가하지 않는다"""
+        staff = MedicalStaff.objects.get(detail=6, staff=3)
+        staff.save()
+        MedicalStaff.objects.get(pk=staff.pk).save()
+        self.assertEqual(self.workload(3), {"examination": 1})
+        self.assertReconciled()
+
+    def test_staff_change(self) -> None:
+        """담당자(MedicalStaff)의 스태프 변경시 이전 스태프 감소, 새 스태프 증가"""
+        staff = MedicalStaff.objects.get(detail=6, staff=3)
+        staff.staff_id = 4
+        staff.save()
+        self.assertEqual(self.workload(3), {})
+        self.assertEqual(self.workload(4), {"examination": 1})
+
+        # 완료된 진료내역으로 변경
+        staff.detail_id = 1
+        staff.save()
+        self.assertEqual(self.workload(4), {})
+        self.assertReconciled()
+
+    def test_service_delete(self) -> None:
+        """진료내역 삭제(담당자 CASCADE)시 감소"""
+        MedicalStaff.objects.create(detail_id=6, staff_id=4)
+        self.assertEqual(self.workload(4), {"examination": 1})
+
+        MedicalService.objects.get(id=6).delete()
+        self.assertEqual(self.workload(2), {})
+        self.assertEqual(self.workload(4), {})
+
+    def test_reconcile(self) -> None:
+        """재계산 커맨드"""
+        StaffWorkload.objects.filter(staff=2).update(waiting=5)
+        StaffWorkload.objects.create(staff_id=4, stage="payment", waiting=1)
+        StaffWorkload.objects.filter(staff=3).delete()
+
+        out = StringIO()
+        call_command("reconcile_staff_workload", "--dry-run", stdout=out)
+        self.assertIn("3건", out.getvalue())
+        self.assertEqual(self.workload(2), {"examination": 5})
+
+        call_command("reconcile_staff_workload", stdout=StringIO())
+        self.assertEqual(self.workload(2), {"examination": 1})
+        self.assertEqual(self.workload(3), {"examination": 1})
+        self.assertEqual(self.workload(4), {})
+        self.assertReconciled()
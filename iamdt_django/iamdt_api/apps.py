@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class IamdtApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "iamdt_api"
+
+    def ready(self):
+        from iamdt_api import cache, stream
+
+        # OpenAPI 인증 스키마(SignedTokenAuthentication) extension 등록
+        from iamdt_api.scheme import authentication  # noqa: F401
+
+        cache.connect_signals()
+        stream.connect_signals()
@@ -0,0 +1,170 @@
+"""
+서명 토큰(HMAC) 인증 모듈
+
+세션 인증은 요청마다 django_session, iamdt_user 를 조회한다.
+로그인시 유저 정보(id, 역할, is_staff)를 담은 짧은 만료의 access 토큰을 발급하고
+API는 서명만 검증해 DB 조회 없이 인증한다.
+
+    Authorization: Bearer <access>
+
+- 토큰은 django.core.signing(SECRET_KEY HMAC-SHA256)으로 서명한다.
+  access/refresh는 salt가 달라 서로 대신 사용할 수 없다.
+- access 만료 후 refresh 토큰으로 /api/auth/refresh 에서 새 토큰 쌍을 받는다.
+  refresh는 유저를 다시 조회하므로 역할/비활성화 변경은 다음 refresh에 반영된다.
+- 같이 발급된 access/refresh는 jti가 같다. 로그아웃/refresh시 jti를 denylist에 넣어 폐기한다.
+- denylist는 프로세스 메모리에 있다. 여러 프로세스로 실행하면 폐기는 해당 프로세스에만 적용되고
+  다른 프로세스에서는 access 만료까지 유효하다.
+
+    API_TOKEN = {
+        "ACCESS_LIFETIME": 300,  # access 토큰 유효시간(초)
+        "REFRESH_LIFETIME": 86400,  # refresh 토큰 유효시간(초)
+        "DENYLIST_SIZE": 10000,  # 폐기 목록 최대 갯수. 초과시 만료가 가장 빠른 것부터 삭제
+    }
+"""
+
+__all__ = [
+    "SignedTokenAuthentication",
+    "denylist",
+    "issue_tokens",
+    "revoke",
+    "token_user",
+    "verify_token",
+]
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+KEYWORD = "Bearer"
+
+DEFAULTS = {"ACCESS_LIFETIME": 300, "REFRESH_LIFETIME": 86400, "DENYLIST_SIZE": 10000}
+
+ACCESS, REFRESH = "access", "refresh"
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "API_TOKEN", {})}
+
+
+class Denylist:
+    """폐기된 토큰 jti: 만료 시각(프로세스 내)"""
+
+    def __init__(self):
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._expires[jti] = expires
+            # 만료된 토큰은 서명 검증에서 거절되므로 목록에서 뺀다
+            for key in [k for k, exp in self._expires.items() if exp <= now]:
+                del self._expires[key]
+            overflow = len(self._expires) - get_options()["DENYLIST_SIZE"]
+            if overflow > 0:
+                for key in sorted(self._expires, key=self._expires.get)[:overflow]:
+                    del self._expires[key]
+
+    def __contains__(self, jti) -> bool:
+        return jti in self._expires
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+
+
+denylist = Denylist()
+
+
+def _salt(kind: str) -> str:
+    return f"iamdt_api.token.{kind}"
+
+
+def issue_tokens(user) -> dict:
+    """access/refresh 토큰 쌍 발급"""
+    options = get_options()
+    now = int(time.time())
+    claims = {
+        "jti": uuid.uuid4().hex,
+        "user_id": user.pk,
+        "username": user.username,
+        "role": user.role,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
+    lifetime = {
+        ACCESS: options["ACCESS_LIFETIME"],
+        REFRESH: options["REFRESH_LIFETIME"],
+    }
+    tokens = {
+        kind: signing.dumps({**claims, "exp": now + seconds}, salt=_salt(kind))
+        for kind, seconds in lifetime.items()
+    }
+    return {**tokens, "token_type": KEYWORD, "expires_in": lifetime[ACCESS]}
+
+
+def verify_token(token: str, kind: str = ACCESS) -> dict:
+    """서명/만료/폐기 여부를 확인하고 토큰 정보를 반환한다"""
+    try:
+        payload = signing.loads(token, salt=_salt(kind))
+    except signing.BadSignature:
+        raise exceptions.AuthenticationFailed("잘못된 토큰입니다.", "invalid_token")
+    if payload["exp"] <= time.time():
+        raise exceptions.AuthenticationFailed("만료된 토큰입니다.", "token_expired")
+    if payload["jti"] in denylist:
+        raise exceptions.AuthenticationFailed("폐기된 토큰입니다.", "token_revoked")
+    return payload
+
+
+def revoke(payload: dict) -> None:
+    """토큰 쌍(jti) 폐기. 같이 발급된 refresh 토큰이 만료될 때까지 유지한다"""
+    denylist.add(payload["jti"], time.time() + get_options()["REFRESH_LIFETIME"])
+
+
+def token_user(payload: dict):
+    """토큰 정보로 만든 유저 객체(DB 조회 없음)
+
+    외래키 지정(creator=request.user), 권한 확인에 사용한다.
+    토큰에 없는 필드는 비어있으므로 저장하거나 직렬화하지 않는다.
+    """
+    user = get_user_model()(
+        id=payload["user_id"],
+        username=payload["username"],
+        role=payload["role"],
+        is_staff=payload["is_staff"],
+        is_superuser=payload["is_superuser"],
+        is_active=True,
+    )
+    user._state.adding = False
+    return user
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """Authorization: Bearer <access> 인증
+
+    SessionAuthentication 다음에 둔다.(인증 실패 응답 코드는 첫번째 인증 클래스 기준 403 유지)
+    """
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != KEYWORD.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed("잘못된 Authorization 헤더입니다.")
+
+        try:
+            token = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed("잘못된 토큰입니다.", "invalid_token")
+
+        payload = verify_token(token)
+        return token_user(payload), payload
+
+    def authenticate_header(self, request):
+        return f'{KEYWORD} realm="api"'
@@ -0,0 +1,198 @@
+"""
+API 응답 캐시 모듈
+
+읽기가 많은 리스트 API 응답을 settings.CACHES["api"] 에 저장한다.
+캐시 키는 (의존 모델 버전, 유저 역할, 경로+쿼리, 렌더러)로 만든다.
+JSON 응답만 캐시한다.(browsable API HTML 은 로그인 유저 이름 등 유저별 내용을 포함한다)
+
+모델 버전은 모델별 카운터로 저장/삭제/담당자 변경 시그널에서 증가시킨다.
+버전이 바뀌면 이전 키는 더이상 조회되지 않고 LRU로 삭제된다.
+트랜잭션 중 다른 요청이 이전 데이터를 캐시하지 않도록 커밋 후에도 한번 더 증가시킨다.
+"""
+
+__all__ = [
+    "CACHE_MODELS",
+    "CachedListMixin",
+    "bump_version",
+    "cache_stats",
+    "connect_signals",
+    "invalidate",
+]
+
+import hashlib
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from iamdt_util.cache import HitCounter
+
+# 버전 카운터를 관리하는 모델
+CACHE_MODELS = [
+    "iamdt.customer",
+    "iamdt.patient",
+    "iamdt.user",
+    "iamdt.medicalservice",
+    "iamdt.medicalstaff",
+]
+
+# 캐시 응답에 함께 저장할 헤더
+CACHED_HEADERS = ["Content-Type", "ETag", "Last-Modified", "Cache-Control"]
+
+# 프로세스별 hit/miss 카운터
+_counter = HitCounter("api")
+
+
+def get_cache():
+    return caches[getattr(settings, "API_CACHE_ALIAS", "api")]
+
+
+def _version_key(label: str) -> str:
+    return f"api:version:{label}"
+
+
+def bump_version(*labels) -> None:
+    """모델 버전 증가"""
+    cache = get_cache()
+    for label in labels:
+        key = _version_key(label)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 버전 키가 LRU로 삭제된 경우 이전 버전과 겹치지 않도록 시각으로 시작
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def get_versions(labels) -> list:
+    cache = get_cache()
+    keys = [_version_key(label) for label in labels]
+    versions = cache.get_many(keys)
+
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def cache_stats() -> dict:
+    """현재 프로세스의 캐시 hit/miss 카운터"""
+    return _counter.stats()
+
+
+def invalidate(*labels) -> None:
+    """모델 버전 증가(커밋 후 한번 더)"""
+    bump_version(*labels)
+    transaction.on_commit(lambda: bump_version(*labels))
+
+
+def model_saved(sender, instance, update_fields=None, **kwargs):
+    # 로그인시 last_login만 저장하는 경우는 응답이 바뀌지 않는다
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    invalidate(sender._meta.label_lower)
+
+
+def model_deleted(sender, **kwargs):
+    invalidate(sender._meta.label_lower)
+
+
+def services_changed(sender, **kwargs):
+    invalidate("iamdt.medicalservice", "iamdt.medicalstaff")
+
+
+def staff_changed(sender, action, **kwargs):
+    # 담당자 등록은 services_changed
+    if action in ("post_remove", "post_clear"):
+        invalidate("iamdt.medicalservice", "iamdt.medicalstaff")
+
+
+def connect_signals() -> None:
+    """IamdtApiConfig.ready 에서 호출
+
+    진료내역 등록/수정, 담당자 등록은 일괄 등록에도 발생하는 services_changed 로 처리한다.
+    """
+    from iamdt.models import MedicalService, services_changed as changed
+
+    for label in CACHE_MODELS:
+        model = apps.get_model(label)
+        if model is not MedicalService:
+            post_save.connect(
+                model_saved, sender=model, dispatch_uid=f"api-cache-{label}"
+            )
+        post_delete.connect(
+            model_deleted, sender=model, dispatch_uid=f"api-cache-{label}"
+        )
+
+    m2m_changed.connect(
+        staff_changed, sender=MedicalService.staff.through, dispatch_uid="api-cache-m2m"
+    )
+    changed.connect(services_changed, sender=MedicalService, dispatch_uid="api-cache")
+
+
+class CachedListMixin:
+    """리스트 응답 캐시
+
+    cache_models 에 응답/필터에 영향을 주는 모델 라벨을 지정한다.
+    cache_formats 에 없는 렌더러(browsable API 등) 응답은 캐시하지 않는다.
+    캐시된 응답은 시리얼라이저/DB 조회 없이 반환되며 X-Cache 헤더(HIT/MISS)가 붙는다.
+    """
+
+    cache_models = []
+    cache_formats = ["json"]  # 응답이 유저 역할까지만 다른 렌더러 형식
+    cache_timeout = None  # None이면 CACHES 설정의 TIMEOUT
+
+    def get_cache_key(self, request) -> str:
+        versions = get_versions(self.cache_models)
+        path = f"{request.get_full_path()}|{request.accepted_renderer.format}"
+        digest = hashlib.md5(path.encode()).hexdigest()
+        role = getattr(request.user, "role", "")
+        return f"api:response:{':'.join(map(str, versions))}:{role}:{digest}"
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format not in self.cache_formats:
+            return super().list(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_cache_key(request)
+
+        cached = cache.get(key)
+        _counter.count(cached is not None)
+        if cached is not None:
+            return self.cached_response(request, *cached)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.add_post_render_callback(
+                lambda rendered: self.store_response(cache, key, rendered)
+            )
+            response["X-Cache"] = "MISS"
+        return response
+
+    def store_response(self, cache, key, response) -> None:
+        headers = {
+            name: response[name] for name in CACHED_HEADERS if response.has_header(name)
+        }
+        kwargs = {} if self.cache_timeout is None else {"timeout": self.cache_timeout}
+        cache.set(key, (response.content, headers), **kwargs)
+
+    def cached_response(self, request, content, headers):
+        """캐시된 응답. 조건부 GET 헤더가 일치하면 304"""
+        response = get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=parse_http_date_safe(headers.get("Last-Modified")),
+        )
+        if response is None:
+            response = HttpResponse(content)
+        for name, value in headers.items():
+            if response.status_code == 200 or name != "Content-Type":
+                response[name] = value
+        response["X-Cache"] = "HIT"
+        return response
@@ -0,0 +1,157 @@
+"""
+조건부 GET(ETag / Last-Modified) 모듈
+
+조회 대상 쿼리셋의 MAX(updated_at)과 레코드 수로 weak ETag와 Last-Modified를 만든다.
+If-None-Match / If-Modified-Since 가 일치하면 시리얼라이저를 거치지 않고 304를 반환한다.
+
+리스트는 ETag만 사용한다. 레코드를 삭제해도 MAX(updated_at)은 바뀌지 않으므로
+Last-Modified(If-Modified-Since)로는 삭제를 알 수 없다.(ETag는 레코드 수로 알 수 있다)
+
+응답 내용이 관계 테이블(환자의 보호자, 진료내역의 담당자 등)에 따라 달라지는 경우
+conditional_fields 에 관계 경로의 updated_at 을 추가한다.
+관계 경로가 있는 리스트는 전체 JOIN 집계를 피하도록 현재 페이지 레코드만 집계한다.(conditional_page)
+"""
+
+__all__ = ["ConditionalListMixin", "ConditionalRetrieveMixin"]
+
+import hashlib
+from functools import partial
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+
+class ConditionalMixin:
+    """ETag / Last-Modified 계산 공통"""
+
+    # MAX()를 구할 수정일 필드(관계 경로 가능)
+    conditional_fields = ["updated_at"]
+    # Last-Modified 응답, If-Modified-Since 검사 여부
+    conditional_last_modified = True
+
+    def get_conditional_state(self, queryset, *extra):
+        """(레코드 수, etag, last_modified timestamp) 반환. 집계 쿼리 1회
+
+        extra 는 etag 에 함께 넣을 값
+        """
+        aggregates = {
+            f"modified_{index}": Max(field)
+            for index, field in enumerate(self.conditional_fields)
+        }
+        state = queryset.order_by().aggregate(
+            count=Count("pk", distinct=True), **aggregates
+        )
+
+        modified = [state[key] for key in aggregates if state[key] is not None]
+        last_modified = int(max(modified).timestamp()) if modified else None
+
+        # 같은 URL이라도 렌더러(json/browsable api)에 따라 응답이 다르다
+        key = "|".join(
+            [self.request.accepted_renderer.format]
+            + [str(value) for value in state.values()]
+            + [str(value) for value in extra]
+        )
+        etag = f'W/"{hashlib.md5(key.encode()).hexdigest()}"'
+        return state["count"], etag, last_modified
+
+    def conditional_response(self, request, queryset, render, *extra):
+        """304 혹은 render() 응답에 ETag / Last-Modified 헤더를 붙여 반환"""
+        count, etag, last_modified = self.get_conditional_state(queryset, *extra)
+        if not self.conditional_last_modified:
+            last_modified = None
+        if count:
+            not_modified = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if not_modified is not None:
+                return not_modified
+
+        response = render()
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            # 캐시는 하되 매번 재검증하도록
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class ConditionalListMixin(ConditionalMixin):
+    """리스트 조회 조건부 GET
+
+    필터가 적용된 쿼리셋 전체 기준으로 계산하고 같은 쿼리셋으로 응답한다.
+    (검색 필터를 한번만 적용한다)
+
+    conditional_page 가 True 면 페이지를 먼저 조회하고 페이지 레코드(pk)로만 집계한다.
+    전체 레코드 수(커서 모드는 이전/다음 페이지 유무)와 페이지 pk 목록을 etag 에 넣으므로
+    목록 구성이 바뀌어도 알 수 있다.
+    """
+
+    conditional_last_modified = False
+    # 현재 페이지 레코드로 계산(관계 경로 JOIN 을 페이지 크기로 제한)
+    # None 이면 conditional_fields 에 관계 경로(__)가 있을 때 True
+    conditional_page = None
+
+    def use_conditional_page(self) -> bool:
+        if self.conditional_page is None:
+            return any("__" in field for field in self.conditional_fields)
+        return self.conditional_page
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.use_conditional_page():
+            return self.page_conditional_response(request, queryset)
+        render = partial(self.list_response, queryset)
+        return self.conditional_response(request, queryset, render)
+
+    def page_conditional_response(self, request, queryset):
+        """페이지 조회 후 페이지 레코드의 집계로 304 혹은 페이지 응답"""
+        page = self.paginate_queryset(queryset)
+        objects = list(queryset) if page is None else page
+        pks = [obj.pk for obj in objects]
+        if page is None:
+            total = len(pks)
+        elif getattr(self.paginator, "cursor_paginator", None) is not None:
+            # 커서 모드는 COUNT 쿼리가 없다(ApiPageNumberPagination)
+            cursor = self.paginator.cursor_paginator
+            total = f"{cursor.has_previous}:{cursor.has_next}"
+        else:
+            total = self.paginator.page.paginator.count
+
+        def render():
+            serializer = self.get_serializer(objects, many=True)
+            if page is None:
+                return Response(serializer.data)
+            return self.get_paginated_response(serializer.data)
+
+        page_queryset = queryset.model._default_manager.filter(pk__in=pks)
+        return self.conditional_response(
+            request, page_queryset, render, total, ",".join(map(str, pks))
+        )
+
+    def list_response(self, queryset):
+        """ListModelMixin.list 와 같다. filter_queryset 은 다시 호출하지 않는다"""
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+
+class ConditionalRetrieveMixin(ConditionalMixin):
+    """상세 조회 조건부 GET
+
+    레코드가 없으면 기존 흐름대로 404를 반환한다.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        render = partial(super().retrieve, request, *args, **kwargs)
+        return self.conditional_response(request, queryset, render)
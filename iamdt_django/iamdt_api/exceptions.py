@@ -0,0 +1,16 @@
+"""
+API 예외 모듈
+"""
+
+__all__ = ["Conflict"]
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class Conflict(APIException):
+    """동시 요청으로 데이터가 먼저 변경된 경우(409)"""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "다른 요청에서 먼저 변경되었습니다. 다시 조회 후 시도하세요."
+    default_code = "conflict"
@@ -0,0 +1,162 @@
+"""
+진료내역 내보내기(NDJSON/CSV 스트리밍) 모듈
+
+/api/services 를 page_size=1000 으로 넘겨가며 받으면 페이지마다 전체를 메모리에 올려 직렬화한다.
+/api/exports/services 는 StreamingHttpResponse 로 진료내역을 한 행씩 만들어 보낸다.
+
+    GET /api/exports/services?patient_id=3  # 환자의 전체 진료내역(NDJSON)
+    GET /api/exports/services?format=csv&date_from=2022-07-01&date_to=2022-07-31
+
+    SERVICE_EXPORT = {
+        "CHUNK_SIZE": 2000,  # QuerySet.iterator(chunk_size) 로 한번에 읽는 행 수
+        "FLUSH_ROWS": 100,  # 이 행 수 만큼 모아서 응답에 쓴다
+    }
+
+- 진료내역과 담당자를 각각 진료내역 id 순서의 iterator 로 읽어 병합(merge join)한다.
+  결과 크기와 관계없이 쿼리 2회, 메모리는 chunk 크기 만큼만 사용한다.
+- 행은 진료내역 검색 응답의 details 항목과 같은 형태이다.(MedicalRegisterListSerializer.service_row)
+- 쿼리는 응답을 보내는 동안 실행된다.
+  Django 4.0 ASGIHandler 는 스트리밍 응답을 이벤트 루프에서 순회하므로(DB 접근 불가) WSGI 로 실행한다.
+"""
+
+__all__ = [
+    "CSV_FIELDS",
+    "CSVRenderer",
+    "NDJSONRenderer",
+    "get_options",
+    "iter_services",
+]
+
+import csv
+import json
+
+from django.conf import settings
+from rest_framework import renderers
+
+from iamdt.models import MedicalStaff
+from iamdt_api.serializers.medical_register import MedicalRegisterListSerializer
+
+DEFAULTS = {"CHUNK_SIZE": 2000, "FLUSH_ROWS": 100}
+
+# CSV 열. 담당자는 id, username 을 ";" 로 이어 붙인다
+CSV_FIELDS = [
+    "id",
+    "patient",
+    "register",
+    "stage",
+    "stage_display",
+    "status",
+    "status_display",
+    "creator",
+    "staff",
+    "staff_username",
+    "created_at",
+    "updated_at",
+]
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "SERVICE_EXPORT", {})}
+
+
+def iter_services(queryset, chunk_size: int = None):
+    """진료내역 응답 행 iterator
+
+    진료내역(id 순서)과 담당자(진료내역 id, 스태프 id 순서)를 동시에 읽으며 맞춰 붙인다.
+    두 쿼리 사이에 추가된 진료내역의 담당자는 건너뛴다.
+    """
+    chunk_size = chunk_size or get_options()["CHUNK_SIZE"]
+    services = (
+        queryset.order_by("id")
+        .values(*MedicalRegisterListSerializer.service_fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    staffs = (
+        MedicalStaff.objects.filter(detail__in=queryset.values("id"))
+        .order_by("detail", "staff__id")
+        .values(*MedicalRegisterListSerializer.staff_fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    try:
+        staff = next(staffs, None)
+        for service in services:
+            rows = []
+            while staff is not None and staff["detail"] <= service["id"]:
+                if staff["detail"] == service["id"]:
+                    rows.append(MedicalRegisterListSerializer.staff_row(staff))
+                staff = next(staffs, None)
+            yield MedicalRegisterListSerializer.service_row(service, rows)
+    finally:
+        # 응답 중 연결이 끊기면 남은 cursor 를 바로 닫는다
+        services.close()
+        staffs.close()
+
+
+def batched(lines, size: int):
+    """size 줄씩 이어 붙인 문자열 iterator"""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+class ExportRenderer(renderers.BaseRenderer):
+    """내보내기 형식 선택(Accept, ?format=)용 renderer
+
+    응답 본문은 뷰에서 stream() 으로 StreamingHttpResponse 를 만든다.
+    """
+
+    charset = "utf-8"
+
+    def lines(self, rows):
+        raise NotImplementedError
+
+    def stream(self, rows, flush_rows: int = None):
+        return batched(self.lines(rows), flush_rows or get_options()["FLUSH_ROWS"])
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        raise NotImplementedError("내보내기 응답은 stream() 으로 만든다")
+
+
+class NDJSONRenderer(ExportRenderer):
+    """한 줄에 진료내역 하나(JSON)"""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def lines(self, rows):
+        for row in rows:
+            yield json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 반환"""
+
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(ExportRenderer):
+    """CSV_FIELDS 열의 CSV. 엑셀에서 한글이 깨지지 않도록 BOM 으로 시작한다"""
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def lines(self, rows):
+        writer = csv.writer(Echo())
+        yield "\ufeff" + writer.writerow(CSV_FIELDS)
+        for row in rows:
+            staff = row["staff"]
+            yield writer.writerow(
+                [
+                    *(row[field] for field in CSV_FIELDS[:8]),
+                    ";".join(str(s["id"]) for s in staff),
+                    ";".join(s["username"] for s in staff),
+                    row["created_at"],
+                    row["updated_at"],
+                ]
+            )
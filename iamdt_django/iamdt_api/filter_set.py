@@ -2,12 +2,53 @@
 API 검색 설정을 위한 FilterSet 모듈
 """
 
-__all__ = ["MedicalRegisterFilter", "StaffFilter", "CustomerFilter", "PatientFilter"]
+__all__ = [
+    "SearchFilter",
+    "MedicalRegisterFilter",
+    "MedicalServiceExportFilter",
+    "StaffFilter",
+    "CustomerFilter",
+    "PatientFilter",
+]
 
 from django.contrib.auth import get_user_model
+from django.db.models.expressions import RawSQL
 from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
 
-from iamdt.models import MedicalRegister, Customer, Patient
+from iamdt.models import MedicalRegister, MedicalService, Customer, Patient
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
+from iamdt_util.search import search_sql
+
+
+class SearchFilter(filters.CharFilter):
+    """검색 인덱스를 사용하는 부분일치 검색 필터
+
+    field_name의 마지막 필드가 검색 인덱스(iamdt_util.search)에 등록되어 있으면
+    인덱스에서 pk를 찾아 검색한다.
+    인덱스를 사용할 수 없는 경우(SEARCH_BACKEND = "icontains" 등) icontains로 검색한다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "icontains")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        # companion__name -> Customer 모델의 name 인덱스
+        *path, field = self.field_name.split("__")
+        model = qs.model
+        for name in path:
+            model = model._meta.get_field(name).related_model
+
+        sql = search_sql(model, field, value, using=qs.db)
+        if sql is None:
+            return super().filter(qs, value)
+
+        lookup = "__".join(path + ["pk", "in"])
+        return self.get_method(qs)(**{lookup: RawSQL(*sql)})
 
 
 class MedicalRegisterFilter(filters.FilterSet):
@@ -20,12 +61,30 @@ class MedicalRegisterFilter(filters.FilterSet):
         fields = []
 
 
+class MedicalServiceExportFilter(MedicalRegisterFilter):
+    """진료내역 내보내기 필터
+
+    진료내역 검색(MedicalRegisterFilter) 조건에 환자 번호, 기간(등록일), 단계/상태 조건을 더한다.
+    """
+
+    patient_id = filters.NumberFilter(field_name="patient")
+    register = filters.NumberFilter(field_name="register")
+    stage = filters.ChoiceFilter(choices=MedicalStage.choices)
+    status = filters.ChoiceFilter(choices=MedicalStageStatus.choices)
+    date_from = filters.DateFilter(field_name="created_at", lookup_expr="date__gte")
+    date_to = filters.DateFilter(field_name="created_at", lookup_expr="date__lte")
+
+    class Meta:
+        model = MedicalService
+        fields = []
+
+
 class StaffFilter(filters.FilterSet):
     """스태프 검색 필터"""
 
-    username = filters.CharFilter(field_name="username", lookup_expr="icontains")
+    username = SearchFilter(field_name="username")
     role = filters.ChoiceFilter(choices=get_user_model().UserType.choices)
-    phone = filters.CharFilter(field_name="phone", lookup_expr="icontains")
+    phone = SearchFilter(field_name="phone")
 
     o = filters.OrderingFilter(
         # tuple-mapping retains order
@@ -44,8 +103,8 @@ class StaffFilter(filters.FilterSet):
 class CustomerFilter(filters.FilterSet):
     """고객 검색 필터"""
 
-    name = filters.CharFilter(field_name="name", lookup_expr="icontains")
-    phone = filters.CharFilter(field_name="phone", lookup_expr="icontains")
+    name = SearchFilter(field_name="name")
+    phone = SearchFilter(field_name="phone")
 
     o = filters.OrderingFilter(
         # tuple-mapping retains order
@@ -64,10 +123,8 @@ class CustomerFilter(filters.FilterSet):
 class PatientFilter(filters.FilterSet):
     """고객 검색 필터"""
 
-    name = filters.CharFilter(field_name="name", lookup_expr="icontains")
-    companion = filters.CharFilter(
-        field_name="companion__name", lookup_expr="icontains"
-    )
+    name = SearchFilter(field_name="name")
+    companion = SearchFilter(field_name="companion__name")
 
     o = filters.OrderingFilter(
         # tuple-mapping retains order
@@ -1,14 +1,58 @@
-__all__ = ["ApiPageNumberPagination"]
+__all__ = ["ApiPageNumberPagination", "ApiCursorPagination"]
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+
+
+class ApiCursorPagination(CursorPagination):
+    """
+    DRF CursorPagination 상속받은 클래스
+
+    (-id) 기준 keyset 페이지네이션.
+    COUNT/OFFSET 쿼리가 없으므로 뒤쪽 페이지도 조회 속도가 일정하다.
+    정렬 파라미터(o, ordering)는 무시하고 항상 (-id) 순서다.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    ordering = "-id"
+
+    def get_ordering(self, request, queryset, view):
+        # DRF는 view의 정렬 필터(OrderingFilter)를 따르므로 고정한다
+        return (self.ordering,)
 
 
 class ApiPageNumberPagination(PageNumberPagination):
     """
     DRF PageNumberPagination 상속받은 클래스
     기본 속성만 바꿨다
+
+    pagination=cursor 쿼리 파라미터가 있으면 요청 단위로 커서 모드로 동작한다.
     """
 
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 1000
+
+    pagination_query_param = "pagination"
+    cursor_pagination_class = ApiCursorPagination
+
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.pagination_query_param) == "cursor":
+            self.cursor_paginator = self.cursor_pagination_class()
+            page = self.cursor_paginator.paginate_queryset(queryset, request, view)
+            self.display_page_controls = self.cursor_paginator.display_page_controls
+            return page
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
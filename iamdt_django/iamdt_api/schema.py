@@ -0,0 +1,138 @@
+"""
+미리 생성한 OpenAPI 스키마 모듈
+
+SpectacularAPIView는 요청마다 전체 뷰/시리얼라이저를 순회해 스키마를 만든다.
+배포시 build_schema 커맨드로 한번 생성해 버전(내용 해시)이 붙은 파일로 저장하고
+API는 파일 내용을 그대로 응답한다.
+
+    python manage.py build_schema
+
+- /api/doc/scheme/<version>: 버전별 내용이 바뀌지 않으므로 장기 캐시(immutable)
+- /api/doc/scheme: 현재 버전. ETag로 재검증(no-cache)
+- swagger/redoc 은 현재 버전 URL을 사용한다.
+- DEBUG 이거나 생성된 스키마가 없으면 기존처럼 요청시 생성한다.
+
+    API_SCHEMA = {
+        "DIR": ROOT_DIR / "schema",  # 스키마 파일 디렉토리. None이면 사용 안함
+        "MAX_AGE": 60 * 60 * 24 * 365,  # 버전 URL 캐시 시간(초)
+        "KEEP": 3,  # 보관할 이전 버전 수(캐시된 이전 버전 URL 응답용)
+    }
+"""
+
+__all__ = [
+    "get_options",
+    "generate_schema",
+    "write_schema",
+    "current_version",
+    "read_schema",
+]
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+
+DEFAULTS = {"DIR": None, "MAX_AGE": 60 * 60 * 24 * 365, "KEEP": 3}
+
+RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+CURRENT = "current"
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "API_SCHEMA", {})}
+
+
+def schema_dir():
+    directory = get_options()["DIR"]
+    return Path(directory) if directory else None
+
+
+def generate_schema() -> dict:
+    """spectacular 커맨드와 같이 요청 없이(public) 스키마 생성"""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    return generator.get_schema(request=None, public=True)
+
+
+def _write(path: Path, content: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체(읽는 프로세스가 쓰는 중인 파일을 보지 않도록)"""
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.chmod(temp, 0o644)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def write_schema(schema: dict, directory=None, keep=None) -> str:
+    """포맷별 파일을 저장하고 현재 버전으로 지정한다. 버전을 반환"""
+    directory = Path(directory) if directory else schema_dir()
+    contents = {
+        fmt: renderer().render(schema, renderer_context={})
+        for fmt, renderer in RENDERERS.items()
+    }
+    version = hashlib.sha256(contents["yaml"]).hexdigest()[:12]
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for fmt, content in contents.items():
+        path = directory / f"openapi-{version}.{fmt}"
+        if not path.exists():
+            _write(path, content)
+        else:
+            path.touch()  # 보관 순서(수정시각) 갱신
+    _write(directory / CURRENT, version.encode())
+    _cleanup(directory, version, get_options()["KEEP"] if keep is None else keep)
+    return version
+
+
+def _cleanup(directory: Path, version: str, keep: int) -> None:
+    """현재 버전과 최근 keep 개 이전 버전만 남긴다"""
+    files = {}
+    for path in directory.glob("openapi-*.*"):
+        files.setdefault(path.name.split(".")[0][len("openapi-") :], []).append(path)
+    files.pop(version, None)
+    newest = sorted(
+        files,
+        key=lambda name: max(path.stat().st_mtime for path in files[name]),
+        reverse=True,
+    )
+    for name in newest[keep:]:
+        for path in files[name]:
+            path.unlink()
+
+
+def current_version():
+    """현재 스키마 버전. 생성된 스키마가 없으면 None"""
+    directory = schema_dir()
+    if directory is None:
+        return None
+    try:
+        return (directory / CURRENT).read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _read(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def read_schema(version: str, fmt: str):
+    """버전별 스키마 파일 내용. 없으면 None
+
+    버전 파일은 내용이 바뀌지 않으므로 프로세스 내에 보관한다.
+    """
+    directory = schema_dir()
+    if directory is None or fmt not in RENDERERS or not version.isalnum():
+        return None
+    path = directory / f"openapi-{version}.{fmt}"
+    if not path.exists():
+        return None
+    return _read(path)
@@ -2,8 +2,10 @@
 Django Spectacular SCHEME 관련 설정 파일을 모아두기 위한 모듈
 """
 
+__all__ = ["PAGINATION_QUERY_SCHEME", "LazyExamples", "lazy_examples"]
 
-__all__ = ["PAGINATION_QUERY_SCHEME"]
+from collections.abc import Sequence
+from importlib import import_module
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiExample
@@ -31,4 +33,66 @@ PAGINATION_QUERY_SCHEME = [
             OpenApiExample(name="최대 1개", value=1),
         ],
     ),
+    OpenApiParameter(
+        "pagination",
+        OpenApiTypes.STR,
+        OpenApiParameter.QUERY,
+        enum=["page", "cursor"],
+        description="페이지네이션 방식. cursor 지정시 count 없이 next/previous 링크로 조회합니다.(최신 등록순 고정, 정렬조건 무시)",
+    ),
+    OpenApiParameter(
+        "cursor",
+        OpenApiTypes.STR,
+        OpenApiParameter.QUERY,
+        description="pagination=cursor 일때 조회할 위치. 응답의 next/previous 링크에 포함된 값을 사용합니다.",
+    ),
 ]
+
+
+class LazyExamples(Sequence):
+    """문서 생성시 처음 사용할 때 불러오는 OpenApiExample 리스트
+
+    extend_schema(examples=...)는 import 시점에 평가되므로
+    예제 모듈(iamdt_api.scheme.examples.*) import를 스키마 생성시까지 미룬다.
+    API 워커는 예제를 만들지 않는다.(스키마는 build_schema 로 미리 생성)
+
+    sources: (예제 모듈 이름, EXAMPLES 키) 목록. 더하면 sources를 이어 붙인다.
+    """
+
+    def __init__(self, *sources):
+        self.sources = sources
+        self._examples = None
+
+    def load(self) -> list:
+        if self._examples is None:
+            examples = []
+            for module, key in self.sources:
+                examples += import_module(f"{__name__}.examples.{module}").EXAMPLES[key]
+            self._examples = examples
+        return self._examples
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __bool__(self) -> bool:
+        # 데코레이터의 `if examples:` 에서 불러오지 않도록 sources로 판단
+        return bool(self.sources)
+
+    def __add__(self, other):
+        if isinstance(other, LazyExamples):
+            return LazyExamples(*self.sources, *other.sources)
+        return [*self, *other]
+
+    def __radd__(self, other):
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return f"LazyExamples{self.sources}"
+
+
+def lazy_examples(module: str, keys: list) -> dict:
+    """{키: LazyExamples} 예제 모듈의 EXAMPLES 와 같은 키로 사용"""
+    return {key: LazyExamples((module, key)) for key in keys}
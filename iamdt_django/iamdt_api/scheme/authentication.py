@@ -0,0 +1,26 @@
+"""
+인증 방식 OpenAPI 스키마(drf-spectacular extension)
+
+drf-spectacular 는 인증 클래스별 security scheme 을 extension 으로 찾는다.
+등록된 extension 이 없는 SignedTokenAuthentication 은 스키마에서 빠지고 생성시 경고가 난다.
+IamdtApiConfig.ready 에서 import 해 등록한다.
+"""
+
+__all__ = ["SignedTokenScheme"]
+
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from drf_spectacular.plumbing import build_bearer_security_scheme_object
+
+from iamdt_api.authentication import KEYWORD
+
+
+class SignedTokenScheme(OpenApiAuthenticationExtension):
+    """Authorization: Bearer <access> (서명 토큰)"""
+
+    target_class = "iamdt_api.authentication.SignedTokenAuthentication"
+    name = "bearerAuth"
+
+    def get_security_definition(self, auto_schema):
+        return build_bearer_security_scheme_object(
+            header_name="Authorization", token_prefix=KEYWORD
+        )
@@ -0,0 +1,27 @@
+"""
+변경 피드 API 문서화 관련 데이터
+"""
+
+__all__ = ["CHANGE_API_QUERY", "CHANGE_API_EXAMPLES"]
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+
+from iamdt_api.scheme import LazyExamples
+
+CHANGE_API_QUERY = [
+    OpenApiParameter(
+        "since",
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="마지막으로 받은 token. 생략하면 변경 없이 현재 token만 반환합니다.(전체 조회 전에 받아둘 것)",
+    ),
+    OpenApiParameter(
+        "limit",
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="조회할 변경 이력 최대 갯수(기본 500, 최대 1000)",
+    ),
+]
+
+CHANGE_API_EXAMPLES = LazyExamples(("change", "list"))
@@ -5,12 +5,16 @@
 __all__ = [
     "CUSTOMER_API_URL_PARAM",
     "CUSTOMER_API_SEARCH_QUERY",
+    "CUSTOMER_API_LOOKUP_QUERY",
     "CUSTOMER_API_EXAMPLES",
+    "CUSTOMER_LOOKUP_API_EXAMPLES",
 ]
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter
 
+from iamdt_api.scheme import LazyExamples, lazy_examples
+
 # 고객 검색 url path kwargs
 CUSTOMER_API_URL_PARAM = [
     OpenApiParameter(
@@ -49,51 +53,20 @@ CUSTOMER_API_SEARCH_QUERY = [
     ),
 ]
 
-# serialzier example
-_read_example = [
-    OpenApiExample(
-        name="고객 정보 조회",
-        summary="고객 정보 조회",
-        description="고객정보 조회시에는 read_only 필드인 id, created_at, updated_at이 포함된다",
-        value={
-            "id": "1",
-            "name": "고객1",
-            "phone": "01022223333",
-            "created_at": "2022-07-13T10:28:31.680Z",
-            "updated_at": "2022-07-13T10:30:21.885Z",
-        },
-        response_only=True,
-    )
-]
-_add_example = [
-    OpenApiExample(
-        name="고객 추가1",
-        summary="고객정보 신규 등록",
-        description="고객정보를 추가한다. 이름+연락처 결과는 중복될 수 없다.",
-        value={"name": "customer1", "phone": "01022223333"},
-        request_only=True,
-    ),
-    OpenApiExample(
-        name="고객 추가2",
-        summary="고객정보 신규 등록 실패",
-        description="이름과 연락처는 모두 필수 값이며, 연락처는 핸드폰 형식에 맞춰 입력되어야 한다.",
-        value={"name": "customer1", "phone": "11122223333"},
-        request_only=True,
-        status_codes=["400"],
-    ),
-]
-_mod_example = [
-    OpenApiExample(
-        name="고객 수정",
-        summary="고객정보 수정",
-        description="고객정보를 수정한다 이름+연락처 결과는 중복될 수 없다.",
-        value={"name": "customer1", "phone": "01022223333"},
-        request_only=True,
+# 발신번호 조회 쿼리 파라미터
+CUSTOMER_API_LOOKUP_QUERY = [
+    OpenApiParameter(
+        "phone",
+        OpenApiTypes.STR,
+        OpenApiParameter.QUERY,
+        required=True,
+        description="발신번호(하이픈 포함 여부 무관). 일치하는 고객과 환자 목록을 반환합니다.",
+        examples=[
+            OpenApiExample(name="하이픈 없음", value="01011112222"),
+            OpenApiExample(name="하이픈 포함", value="010-1111-2222"),
+        ],
     )
 ]
-CUSTOMER_API_EXAMPLES = {
-    "read": _read_example,
-    "add": _add_example + _read_example,
-    "mod": _mod_example + _read_example,
-    "all": _add_example + _mod_example + _read_example,
-}
+
+CUSTOMER_API_EXAMPLES = lazy_examples("customer", ["read", "add", "mod", "all"])
+CUSTOMER_LOOKUP_API_EXAMPLES = LazyExamples(("customer", "lookup"))
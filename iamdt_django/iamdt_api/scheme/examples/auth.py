@@ -0,0 +1,57 @@
+"""
+인증 API 문서 예제
+
+스키마 생성시에만 import 된다.(iamdt_api.scheme.LazyExamples)
+"""
+
+__all__ = ["EXAMPLES"]
+
+from drf_spectacular.utils import OpenApiExample
+
+_read_example = []
+_add_example = [
+    OpenApiExample(
+        name="로그인 요청1",
+        summary="로그인 요청 성공",
+        description="로그인 요청시 제출 되어야 하는 데이터 입니다.",
+        value={"username": "doctor1", "password": "1234"},
+        request_only=True,
+    ),
+    OpenApiExample(
+        name="로그인 요청2",
+        summary="로그인 요청 실패",
+        description="로그인 요청이 실패하는 데이터",
+        value={"username": "doctor1"},
+        request_only=True,
+    ),
+]
+_mod_example = []
+_refresh_example = [
+    OpenApiExample(
+        name="토큰 갱신 요청",
+        summary="refresh 토큰으로 새 토큰 발급",
+        description="로그인 응답의 token.refresh 를 제출합니다. 이전 토큰은 폐기됩니다.",
+        value={"refresh": "eyJqdGkiOiI...:1oQ3xk:Yb8..."},
+        request_only=True,
+    ),
+    OpenApiExample(
+        name="토큰 갱신 응답",
+        summary="새 토큰 쌍",
+        description="API 요청시 Authorization: Bearer <access> 헤더로 사용합니다.",
+        value={
+            "access": "eyJqdGkiOiI...:1oQ3xk:k2P...",
+            "refresh": "eyJqdGkiOiI...:1oQ3xk:Yb8...",
+            "token_type": "Bearer",
+            "expires_in": 300,
+        },
+        response_only=True,
+    ),
+]
+
+EXAMPLES = {
+    "read": _read_example,
+    "add": _add_example + _read_example,
+    "mod": _mod_example + _read_example,
+    "all": _add_example + _mod_example + _read_example,
+    "refresh": _refresh_example,
+}
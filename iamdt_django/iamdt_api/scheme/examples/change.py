@@ -0,0 +1,48 @@
+"""
+변경 피드 API 문서 예제
+
+스키마 생성시에만 import 된다.(iamdt_api.scheme.LazyExamples)
+"""
+
+__all__ = ["EXAMPLES"]
+
+from drf_spectacular.utils import OpenApiExample
+
+_list_example = [
+    OpenApiExample(
+        name="변경피드1",
+        summary="변경 피드 조회",
+        description="같은 객체의 변경은 마지막 것 하나로 합쳐지고 data는 현재 값입니다. 삭제는 data가 null입니다.",
+        value={
+            "token": 42,
+            "has_more": False,
+            "changes": [
+                {
+                    "seq": 40,
+                    "model": "customer",
+                    "id": 3,
+                    "action": "update",
+                    "data": {
+                        "id": 3,
+                        "name": "고객3",
+                        "phone": "010-1234-5678",
+                        "created_at": "2022-07-13T10:28:31.680Z",
+                        "updated_at": "2022-07-14T09:00:00.000Z",
+                    },
+                },
+                {
+                    "seq": 42,
+                    "model": "patient",
+                    "id": 7,
+                    "action": "delete",
+                    "data": None,
+                },
+            ],
+        },
+        response_only=True,
+    )
+]
+
+EXAMPLES = {
+    "list": _list_example,
+}
@@ -0,0 +1,125 @@
+"""
+스태프 API 문서 예제
+
+스키마 생성시에만 import 된다.(iamdt_api.scheme.LazyExamples)
+"""
+
+__all__ = ["EXAMPLES"]
+
+from drf_spectacular.utils import OpenApiExample
+
+# serialzier example
+_read_example = [
+    OpenApiExample(
+        name="스태프 정보",
+        summary="스태프(병원관계자) 정보 조회",
+        description="스태프(병원관계자)의 정보 조회",
+        value={
+            "id": 2,
+            "username": "doctor2",
+            "first_name": "name2",
+            "last_name": "doc",
+            "role": "doctor",
+            "role_display": "수의사",
+            "phone": "01012345678",
+            "messenger": "kakaotalk",
+            "messenger_id": "doc2",
+            "is_staff": True,
+            "is_superuser": False,
+        },
+        response_only=True,
+    )
+]
+_add_example = [
+    OpenApiExample(
+        name="스태프 등록",
+        summary="스태프(병원관계자) 정보 등록",
+        description="스태프(병원관계자)의 정보 등록<br>role을 지정하지 않으면 doctor로 기본 지정됨",
+        value={
+            "username": "doctor2",
+            "password": "123123",
+            "first_name": "name2",
+            "last_name": "doc",
+            "role": "doctor",
+            "phone": "01012345678",
+            "messenger": "kakaotalk",
+            "messenger_id": "doc2",
+        },
+        request_only=True,
+    ),
+    OpenApiExample(
+        name="스태프 등록 실패",
+        summary="스태프(병원관계자) 정보 등록 실패",
+        description="스태프(병원관계자)의 정보 등록 실패를 테스트를 위한 예제",
+        value={"username": "doctor2"},
+        request_only=True,
+    ),
+]
+_mod_example = [
+    OpenApiExample(
+        name="스태프 수정1",
+        summary="스태프(병원관계자) 정보 수정",
+        description="role과 messenger의 choices value 선택에 주의",
+        value={
+            "first_name": "name1",
+            "last_name": "doc",
+            "role": "doctor",
+            "phone": "01012345678",
+            "messenger": "kakaotalk",
+            "messenger_id": "doc1",
+        },
+        request_only=True,
+    ),
+    OpenApiExample(
+        name="스태프 수정2",
+        summary="스태프(병원관계자) 정보 수정 실패",
+        description="스태프(병원관계자)의 정보 수정 실패 예제. 핸드폰 번호는 비워둘 수 없다",
+        value={
+            "first_name": "name1",
+            "last_name": "doc",
+            "role": "doctor",
+            "phone": "",
+            "messenger": "kakaotalk",
+            "messenger_id": "doc1",
+        },
+        request_only=True,
+    ),
+]
+
+
+_workload_example = [
+    OpenApiExample(
+        name="스태프 업무량",
+        summary="스태프별 대기 진료내역 건수",
+        description="대기(wait) 상태인 담당 진료내역 건수. stages는 모든 진료단계를 포함합니다.",
+        value=[
+            {
+                "id": 2,
+                "username": "doctor1",
+                "first_name": "name1",
+                "last_name": "doc",
+                "role": "doctor",
+                "role_display": "수의사",
+                "total": 3,
+                "stages": {
+                    "register": 0,
+                    "examination": 2,
+                    "diagnosys": 1,
+                    "treatment": 0,
+                    "counseling": 0,
+                    "payment": 0,
+                    "discharge": 0,
+                },
+            }
+        ],
+        response_only=True,
+    )
+]
+
+EXAMPLES = {
+    "read": _read_example,
+    "add": _add_example + _read_example,
+    "mod": _mod_example + _read_example,
+    "all": _add_example + _mod_example + _read_example,
+    "workload": _workload_example,
+}
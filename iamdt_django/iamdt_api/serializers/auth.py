@@ -2,7 +2,7 @@
 인증 API 관련 Serializer 모듈
 """
 
-__all__ = ["LoginSerializer"]
+__all__ = ["LoginSerializer", "TokenRefreshSerializer"]
 
 from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
@@ -20,3 +20,12 @@ class LoginSerializer(serializers.Serializer):
 
     username = serializers.CharField(required=True)
     password = serializers.CharField(required=True)
+
+
+@extend_schema_serializer(
+    component_name="TokenRefresh", examples=AUTH_API_EXAMPLES["refresh"]
+)
+class TokenRefreshSerializer(serializers.Serializer):
+    """토큰 갱신 요청 serializers"""
+
+    refresh = serializers.CharField(required=True)
@@ -2,14 +2,18 @@
 Customer API 관련 Serializer 모듈
 """
 
-__all__ = ["CustomerInfoSerializer"]
+__all__ = ["CustomerInfoSerializer", "CustomerLookupSerializer"]
 
 from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
 from iamdt.models import Customer
-from iamdt_api.scheme.customer import CUSTOMER_API_EXAMPLES
+from iamdt_api.scheme.customer import (
+    CUSTOMER_API_EXAMPLES,
+    CUSTOMER_LOOKUP_API_EXAMPLES,
+)
+from iamdt_api.serializers.patient import PatientInfoSerializer
 
 
 @extend_schema_serializer(
@@ -28,3 +32,21 @@ class CustomerInfoSerializer(serializers.ModelSerializer):
                 queryset=Customer.objects.all(), fields=["name", "phone"]
             )
         ]
+
+
+@extend_schema_serializer(
+    component_name="CustomerLookup",
+    examples=CUSTOMER_LOOKUP_API_EXAMPLES,
+)
+class CustomerLookupSerializer(serializers.ModelSerializer):
+    """발신번호 조회용 고객정보 시리얼라이저(환자 포함)
+
+    응답용으로만 사용된다.
+    """
+
+    patients = PatientInfoSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Customer
+        fields = ["id", "name", "phone", "patients", "created_at", "updated_at"]
+        read_only_fields = fields
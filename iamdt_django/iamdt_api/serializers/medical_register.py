@@ -2,15 +2,133 @@
 MedicalRegister Serializer 모듈
 """
 
-__all__ = ["MedicalRegisterInfoSerializer"]
+__all__ = ["MedicalRegisterInfoSerializer", "MedicalRegisterListSerializer"]
 
+from django.contrib.auth import get_user_model
+from django.db import models
 from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
 
-from iamdt.models import MedicalService
+from iamdt.models import MedicalService, MedicalStaff
+from iamdt.models.choices import MedicalStage, MedicalStageStatus
 from iamdt_api.serializers.medical_service import MedicalServiceInfoSerializer
 
 
+class MedicalRegisterListSerializer(serializers.ListSerializer):
+    """진료접수번호 리스트 시리얼라이저(읽기 전용)
+
+    MedicalRegisterInfoSerializer(many=True) 사용시 자동으로 선택된다.
+    진료내역/담당자마다 시리얼라이저를 만들지 않고
+    진료내역 values() 쿼리 1회 + 담당자 조회 1회로 같은 형태의 응답을 만든다.
+    접수번호 쿼리셋은 patient__companion을 select_related 할 것(prefetch 불필요).
+    """
+
+    stage_labels = dict(MedicalStage.choices)
+    status_labels = dict(MedicalStageStatus.choices)
+    role_labels = dict(get_user_model().UserType.choices)
+
+    service_fields = [
+        "id",
+        "patient",
+        "register",
+        "stage",
+        "status",
+        "creator",
+        "created_at",
+        "updated_at",
+    ]
+    staff_fields = [
+        "detail",
+        "staff__id",
+        "staff__username",
+        "staff__first_name",
+        "staff__last_name",
+        "staff__role",
+    ]
+
+    datetime_field = serializers.DateTimeField()
+
+    def to_representation(self, data):
+        registers = data.all() if isinstance(data, models.Manager) else data
+        details = self._get_details([register.id for register in registers])
+
+        return [
+            {
+                "id": register.id,
+                "patient": register.patient_id,
+                "stage": register.current_stage,
+                "details": details.get(register.id, []),
+                "created_at": self.datetime_field.to_representation(
+                    register.created_at
+                ),
+                "updated_at": self.datetime_field.to_representation(
+                    register.updated_at
+                ),
+            }
+            for register in registers
+        ]
+
+    def _get_details(self, register_ids) -> dict:
+        """접수번호 id: 진료내역 응답 리스트"""
+        services = list(
+            MedicalService.objects.filter(register__in=register_ids)
+            .order_by("id")
+            .values(*self.service_fields)
+        )
+        staffs = self._get_staffs([service["id"] for service in services])
+
+        details = {}
+        for service in services:
+            details.setdefault(service["register"], []).append(
+                self.service_row(service, staffs.get(service["id"], []))
+            )
+        return details
+
+    def _get_staffs(self, service_ids) -> dict:
+        """진료내역 id: 담당자(SimpleStaffInfoSerializer 형태) 리스트"""
+        if not service_ids:
+            return {}
+
+        rows = (
+            MedicalStaff.objects.filter(detail__in=service_ids)
+            .order_by("detail", "staff__id")
+            .values(*self.staff_fields)
+        )
+        staffs = {}
+        for row in rows:
+            staffs.setdefault(row["detail"], []).append(self.staff_row(row))
+        return staffs
+
+    @classmethod
+    def service_row(cls, service: dict, staff: list) -> dict:
+        """진료내역 values(service_fields) 행 -> MedicalServiceInfoSerializer 형태"""
+        to_datetime = cls.datetime_field.to_representation
+        return {
+            "id": service["id"],
+            "patient": service["patient"],
+            "register": service["register"],
+            "stage": service["stage"],
+            "stage_display": cls.stage_labels[service["stage"]],
+            "status": service["status"],
+            "status_display": cls.status_labels[service["status"]],
+            "creator": service["creator"],
+            "staff": staff,
+            "created_at": to_datetime(service["created_at"]),
+            "updated_at": to_datetime(service["updated_at"]),
+        }
+
+    @classmethod
+    def staff_row(cls, row: dict) -> dict:
+        """담당자 values(staff_fields) 행 -> SimpleStaffInfoSerializer 형태"""
+        return {
+            "id": row["staff__id"],
+            "username": row["staff__username"],
+            "first_name": row["staff__first_name"],
+            "last_name": row["staff__last_name"],
+            "role_display": cls.role_labels.get(row["staff__role"], row["staff__role"]),
+        }
+
+
 @extend_schema_serializer(component_name="MedicalRegisterInfo", examples=[])
 class MedicalRegisterInfoSerializer(serializers.ModelSerializer):
     """진료접수번호 시리얼라이저
@@ -25,6 +143,7 @@ class MedicalRegisterInfoSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MedicalService
+        list_serializer_class = MedicalRegisterListSerializer
         fields = [
             "id",
             "patient",
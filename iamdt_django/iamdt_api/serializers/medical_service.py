@@ -2,19 +2,43 @@
 MedicalService Serializer 모듈
 """
 
-__all__ = ["MedicalServiceAddSerializer", "MedicalServiceInfoSerializer"]
+__all__ = [
+    "MedicalServiceAddSerializer",
+    "MedicalServiceInfoSerializer",
+    "MedicalServiceBulkSerializer",
+]
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
-from iamdt.models import MedicalService, MedicalRegister
+from iamdt.models import (
+    ChangeLog,
+    MedicalService,
+    MedicalStaff,
+    MedicalRegister,
+    Patient,
+    collect_service_changes,
+    record_service_changes,
+)
 from iamdt.models.choices import MedicalStage, POSSIBLE_STAGES, MedicalStageStatus
+from iamdt_api.exceptions import Conflict
 from iamdt_api.scheme.medical_service import SERVICE_API_EXAMPLES
 from iamdt_api.serializers.staff import SimpleStaffField
 
 
+def stage_error_message(last_stage, stage) -> str:
+    """이행할 수 없는 단계 오류 메시지"""
+    return (
+        f"'{MedicalStage(last_stage).label}'에서 "
+        f"'{MedicalStage(stage).label}'로 진행 할 수 없습니다"
+    )
+
+
 @extend_schema_serializer(
     component_name="MedicalServiceAdd", examples=SERVICE_API_EXAMPLES["add"]
 )
@@ -22,6 +46,10 @@ class MedicalServiceAddSerializer(serializers.ModelSerializer):
     """진료내역 등록용 시리얼라이저
 
     환자, 진료단계, 담당스태프 3개 정보만 입력받는다
+
+    같은 환자에 대한 동시 등록으로 접수번호가 갈라지지 않도록
+    검증시 조회한 환자의 service_version 으로 compare-and-swap 후 등록한다.
+    먼저 등록된 요청이 있으면 409(Conflict)
     """
 
     stage_display = serializers.CharField(source="get_stage_display", read_only=True)
@@ -57,6 +85,7 @@ class MedicalServiceAddSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """데이터 검증"""
+        self._version = data["patient"].service_version  # 검증 시점의 버전
         self._get_last_service(data)  # 마지막 단계를 찾는다.
         self._get_register()  # 마지막 접수번호를 찾는다.
 
@@ -89,8 +118,7 @@ class MedicalServiceAddSerializer(serializers.ModelSerializer):
         possible = POSSIBLE_STAGES[self._last_service.stage]
         if data["stage"] not in possible:
             raise serializers.ValidationError(
-                f"'{MedicalStage(self._last_service.stage).label}'에서 "
-                f"'{MedicalStage(data['stage']).label}'로 진행 할 수 없습니다"
+                stage_error_message(self._last_service.stage, data["stage"])
             )
 
     def save(self, **kwargs):
@@ -98,19 +126,40 @@ class MedicalServiceAddSerializer(serializers.ModelSerializer):
         return obj
 
     def create(self, validated_data):
-        """신규생성"""
-        with transaction.atomic():
-            validated_data["register"] = self._get_register_obj()
+        """신규생성
+
+        진료내역 저장, 담당자 등록, 이전 단계 완료의 파생 데이터는 한번에 갱신한다.
+        """
+        staff = validated_data.pop("staff")
+        with transaction.atomic(), collect_service_changes():
+            # 첫 쿼리로 쓰기 잠금을 잡는다(SQLite 잠금 승격 교착 방지)
+            self._swap_version(validated_data["patient"])
+            validated_data["register"] = self._get_register_obj(validated_data)
             new_obj = super().create(validated_data)
-            self._last_service.status = MedicalStageStatus.COMPLETE
-            self._last_service.save()
+            # 신규 진료내역은 담당자가 없으므로 m2m add()의 기존 담당자 조회 없이 등록(일괄 등록과 같다)
+            staff_ids = [user.pk for user in dict.fromkeys(staff)]
+            MedicalStaff.objects.bulk_create(
+                [MedicalStaff(detail=new_obj, staff_id=pk) for pk in staff_ids]
+            )
+            record_service_changes(staff_added=[(new_obj, pk) for pk in staff_ids])
+            if self._last_service:
+                self._last_service.status = MedicalStageStatus.COMPLETE
+                self._last_service.save()
         return new_obj
 
-    def _get_register_obj(self) -> MedicalRegister:
+    def _swap_version(self, patient) -> None:
+        """검증 이후 다른 요청이 먼저 등록했다면 Conflict"""
+        updated = Patient.objects.filter(
+            pk=patient.pk, service_version=self._version
+        ).update(service_version=F("service_version") + 1)
+        if not updated:
+            raise Conflict()
+
+    def _get_register_obj(self, validated_data) -> MedicalRegister:
         """진료접수번호 객체를 리턴한다."""
         if self._register_id:
             return self._last_service.register
-        return MedicalRegister.objects.create(patient=self._last_service.patient)
+        return MedicalRegister.objects.create(patient=validated_data["patient"])
 
 
 @extend_schema_serializer(
@@ -163,4 +212,254 @@ class MedicalServiceInfoSerializer(serializers.ModelSerializer):
 
     def _validate_status_change(self, data) -> None:
         if data.get("status", False) and data.get("staff", False):
-            raise serializers.ValidationError("상태 변경과 담당자 변경은 동시에 불가능 합니다.")
+            raise serializers.ValidationError(
+                "상태 변경과 담당자 변경은 동시에 불가능 합니다."
+            )
+
+    def update(self, instance, validated_data):
+        """수정
+
+        상태 변경시 접수번호의 현재 단계도 같은 트랜잭션에서 갱신된다.
+        진료내역 저장과 담당자 등록의 파생 데이터는 한번에 갱신한다.
+        """
+        with transaction.atomic(), collect_service_changes():
+            return super().update(instance, validated_data)
+
+
+class MedicalServiceBulkItemSerializer(serializers.Serializer):
+    """진료내역 일괄 등록 항목
+
+    필드 형식만 검증한다.(DB 조회 없음)
+    """
+
+    patient = serializers.IntegerField(min_value=1)
+    stage = serializers.ChoiceField(choices=MedicalStage.choices)
+    staff = serializers.ListField(child=serializers.IntegerField(min_value=1))
+
+
+@extend_schema_serializer(
+    component_name="MedicalServiceBulk", examples=SERVICE_API_EXAMPLES["bulk"]
+)
+class MedicalServiceBulkSerializer(serializers.Serializer):
+    """진료내역 일괄 등록 시리얼라이저
+
+    여러 환자의 다음 진료단계를 한 요청으로 등록한다.
+    항목 수와 관계없이 조회/등록 쿼리 수가 일정하다.
+
+    - 환자별 마지막 진료내역은 쿼리 1회로 조회해 POSSIBLE_STAGES로 검증
+    - 접수번호/진료내역/담당자/알림은 bulk_create
+    - atomic: 하나라도 실패하면 아무것도 등록하지 않음
+    - best_effort: 검증을 통과한 항목만 등록
+
+    bulk_create는 시그널이 발생하지 않으므로 단건 저장 시그널과 같은 함수
+    (iamdt.models.record_service_changes)로 파생 데이터를 갱신한다.
+    대상 환자의 service_version을 먼저 증가시켜 쓰기 잠금을 잡으므로
+    검증 이후 다른 요청이 끼어들 수 없고, 동시에 검증된 단건 등록은 409가 된다.
+    검증을 통과한 항목이 없는 환자는 버전 증가를 되돌려서
+    등록하지 않는 환자의 단건 등록은 409가 되지 않는다.
+    """
+
+    ATOMIC = "atomic"
+    BEST_EFFORT = "best_effort"
+
+    mode = serializers.ChoiceField(
+        choices=[(ATOMIC, "전체 성공시에만 등록"), (BEST_EFFORT, "가능한 항목만 등록")],
+        default=ATOMIC,
+    )
+    items = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=500
+    )
+
+    def create(self, validated_data) -> dict:
+        """일괄 등록 후 항목별 결과를 반환한다"""
+        results = [None] * len(validated_data["items"])
+        items = self._validate_fields(validated_data["items"], results)
+
+        with transaction.atomic():
+            if items:
+                locked = self._lock_patients(items)
+                patients = self._get_patients(items)
+                staff_ids = self._get_staff_ids(items)
+                items = self._validate_items(items, results, patients, staff_ids)
+                self._unlock_patients(locked - {data["patient"] for _, data in items})
+
+            if validated_data["mode"] == self.ATOMIC and any(results):
+                # 모두 검증을 통과해야 등록(잠금용 버전 증가도 취소)
+                for index, result in enumerate(results):
+                    results[index] = result or {"index": index, "status": "skipped"}
+
+            if None in results:
+                for index, service in self._bulk_create(
+                    items, patients, validated_data["creator"]
+                ):
+                    results[index] = {
+                        "index": index,
+                        "status": "created",
+                        "id": service.id,
+                        "patient": service.patient_id,
+                        "register": service.register_id,
+                        "stage": service.stage,
+                    }
+            else:
+                transaction.set_rollback(True)
+
+        created = sum(result["status"] == "created" for result in results)
+        return {"mode": validated_data["mode"], "created": created, "results": results}
+
+    def _validate_fields(self, items, results) -> list:
+        """항목별 필드 형식 검증. 통과한 (index, data) 리스트 반환"""
+        valid = []
+        for index, item in enumerate(items):
+            serializer = MedicalServiceBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                results[index] = self._error(index, serializer.errors)
+        return valid
+
+    def _lock_patients(self, items) -> set:
+        """대상 환자의 service_version 증가(쓰기 잠금). 대상 환자 id 반환"""
+        ids = {data["patient"] for _, data in items}
+        Patient.objects.filter(pk__in=ids).update(
+            service_version=F("service_version") + 1
+        )
+        return ids
+
+    def _unlock_patients(self, ids) -> None:
+        """등록하지 않는 환자의 service_version 증가 취소(트랜잭션 안이므로 잠금은 유지)"""
+        if ids:
+            Patient.objects.filter(pk__in=ids).update(
+                service_version=F("service_version") - 1
+            )
+
+    def _get_patients(self, items) -> dict:
+        """환자별 마지막 진료내역(쿼리 1회)"""
+        last = MedicalService.objects.filter(patient=OuterRef("pk")).order_by("-id")
+        rows = (
+            Patient.objects.filter(pk__in={data["patient"] for _, data in items})
+            .annotate(
+                last_id=Subquery(last.values("id")[:1]),
+                last_stage=Subquery(last.values("stage")[:1]),
+                last_status=Subquery(last.values("status")[:1]),
+                last_register=Subquery(last.values("register")[:1]),
+            )
+            .values("pk", "last_id", "last_stage", "last_status", "last_register")
+        )
+        return {row["pk"]: row for row in rows}
+
+    def _get_staff_ids(self, items) -> set:
+        ids = {pk for _, data in items for pk in data["staff"]}
+        return set(
+            get_user_model().objects.filter(pk__in=ids).values_list("pk", flat=True)
+        )
+
+    def _validate_items(self, items, results, patients, staff_ids) -> list:
+        """환자/담당자 존재 여부와 이행 가능한 단계인지 검증"""
+        does_not_exist = serializers.PrimaryKeyRelatedField.default_error_messages[
+            "does_not_exist"
+        ]
+        valid, seen = [], set()
+        for index, data in items:
+            errors = {}
+            patient = patients.get(data["patient"])
+            if patient is None:
+                errors["patient"] = [does_not_exist.format(pk_value=data["patient"])]
+            elif data["patient"] in seen:
+                errors["patient"] = ["같은 요청에 이미 포함된 환자입니다."]
+            elif self._continues(patient) and (
+                data["stage"] not in POSSIBLE_STAGES[patient["last_stage"]]
+            ):
+                errors[api_settings.NON_FIELD_ERRORS_KEY] = [
+                    stage_error_message(patient["last_stage"], data["stage"])
+                ]
+
+            missing = [pk for pk in data["staff"] if pk not in staff_ids]
+            if missing:
+                errors["staff"] = [does_not_exist.format(pk_value=pk) for pk in missing]
+
+            if errors:
+                results[index] = self._error(index, errors)
+            else:
+                seen.add(data["patient"])
+                valid.append((index, data))
+        return valid
+
+    @staticmethod
+    def _continues(patient) -> bool:
+        """마지막 진료가 있고 퇴원이 아니면 해당 접수번호로 이어서 진행"""
+        return patient["last_id"] is not None and (
+            patient["last_stage"] != MedicalStage.DISCHARGE
+        )
+
+    @staticmethod
+    def _error(index, errors) -> dict:
+        return {"index": index, "status": "error", "errors": errors}
+
+    def _bulk_create(self, items, patients, creator) -> list:
+        """검증된 항목 등록. (index, 진료내역) 리스트 반환"""
+        now = timezone.now()
+
+        # 신규 접수번호
+        registers = {
+            data["patient"]: MedicalRegister(patient_id=data["patient"])
+            for _, data in items
+            if not self._continues(patients[data["patient"]])
+        }
+        MedicalRegister.objects.bulk_create(registers.values())
+
+        services = []
+        for _, data in items:
+            patient = patients[data["patient"]]
+            if self._continues(patient):
+                register_id = patient["last_register"]
+            else:
+                register_id = registers[data["patient"]].id
+            services.append(
+                MedicalService(
+                    patient_id=data["patient"],
+                    register_id=register_id,
+                    stage=data["stage"],
+                    creator=creator,
+                )
+            )
+        MedicalService.objects.bulk_create(services)
+
+        pairs = [
+            (service, staff_id)
+            for service, (_, data) in zip(services, items)
+            for staff_id in dict.fromkeys(data["staff"])  # 중복 제거(순서 유지)
+        ]
+        MedicalStaff.objects.bulk_create(
+            [MedicalStaff(detail=service, staff_id=staff) for service, staff in pairs]
+        )
+
+        # 이전 단계 완료. 잠금 이후 조회한 마지막 진료내역으로 만들고
+        # 저장 전 (단계, 상태)로 담당자 업무량을 증감한다
+        previous = []
+        for _, data in items:
+            patient = patients[data["patient"]]
+            if patient["last_id"] is not None:
+                service = MedicalService(
+                    id=patient["last_id"],
+                    register_id=patient["last_register"],
+                    stage=patient["last_stage"],
+                    status=MedicalStageStatus.COMPLETE,
+                )
+                service._saved_state = (patient["last_stage"], patient["last_status"])
+                previous.append(service)
+        MedicalService.objects.filter(
+            pk__in=[service.pk for service in previous]
+        ).update(status=MedicalStageStatus.COMPLETE, updated_at=now)
+
+        ChangeLog.record(
+            [
+                ("medicalregister", register.id, ChangeLog.Action.CREATE)
+                for register in registers.values()
+            ]
+        )
+        record_service_changes(
+            saved=[(service, True) for service in services]
+            + [(service, False) for service in previous],
+            staff_added=pairs,
+        )
+        return [(index, service) for (index, _), service in zip(items, services)]
@@ -7,6 +7,7 @@ __all__ = [
     "StaffInfoSerializer",
     "SimpleStaffInfoSerializer",
     "SimpleStaffField",
+    "SimpleStaffListField",
 ]
 
 
@@ -17,6 +18,7 @@ from drf_spectacular.utils import (
     extend_schema_field,
 )
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 
 from iamdt_api.scheme.staff import STAFF_API_EXAMPLES
 
@@ -127,8 +129,47 @@ class SimpleStaffField(serializers.PrimaryKeyRelatedField):
     Request시 int 값으로 받기 위한 필드 객체다.
 
     nested serializer로 구현되면 Staff 테이블에 작업(등록/수정)이 된다
+    many=True 는 SimpleStaffListField(id 목록을 쿼리 1회로 조회)
     """
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return SimpleStaffListField(**list_kwargs)
+
     def to_representation(self, value):
         # super().to_representation(value)
         return SimpleStaffInfoSerializer(value).data
+
+
+class SimpleStaffListField(serializers.ManyRelatedField):
+    """SimpleStaffField(many=True)
+
+    ManyRelatedField는 id 마다 조회하므로 담당자 수 만큼 쿼리가 실행된다.
+    id 목록을 in_bulk 로 한번에 조회하고 오류 메시지는 SimpleStaffField 와 같다.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child = self.child_relation
+        pks = []
+        for pk in data:
+            if isinstance(pk, bool) or not isinstance(pk, (int, str)):
+                child.fail("incorrect_type", data_type=type(pk).__name__)
+            try:
+                pks.append(int(pk))
+            except ValueError:
+                child.fail("incorrect_type", data_type=type(pk).__name__)
+
+        users = child.get_queryset().in_bulk(pks)
+        for pk in pks:
+            if pk not in users:
+                child.fail("does_not_exist", pk_value=pk)
+        return [users[pk] for pk in pks]
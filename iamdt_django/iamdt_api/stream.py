@@ -0,0 +1,306 @@
+"""
+진료내역 실시간 스트림(Server-Sent Events) 모듈
+
+대기실/스태프 화면이 /api/services 를 폴링하지 않도록
+진료내역 단계/상태/담당자 변경을 커밋 후 SSE로 전달한다.
+
+    GET /api/services/stream?stage=examination&staff=2
+
+- 진료내역 변경(iamdt.models.services_changed, 일괄 등록 포함), 담당 제외(m2m_changed) 시그널에서
+  transaction.on_commit 으로 프로세스 내 broker에 발행한다.
+- Django 4.0의 ASGIHandler는 스트리밍 응답을 이벤트 루프에서 동기로 순회하므로
+  Django 뷰가 아닌 ASGI 앱(ServiceStreamApp)이 config/asgi.py 에서 해당 경로만 처리한다.
+  연결마다 스레드를 점유하지 않고 asyncio.Queue 하나로 대기한다.
+- broker는 프로세스 단위이다. 여러 프로세스로 실행하면 같은 프로세스에서 커밋된 변경만 전달된다.
+
+    SERVICE_STREAM = {
+        "HEARTBEAT": 15,  # 이벤트가 없을 때 연결 유지 주석 전송 간격(초)
+        "QUEUE_SIZE": 100,  # 연결별 대기 이벤트 수. 초과시 reset 이벤트 후 연결 종료
+    }
+"""
+
+__all__ = [
+    "STREAM_PATH",
+    "ServiceStreamApp",
+    "broker",
+    "connect_signals",
+    "publish_services",
+]
+
+import asyncio
+import io
+import itertools
+import json
+import threading
+from importlib import import_module
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from rest_framework import exceptions
+
+from iamdt.models.choices import MedicalStage
+from iamdt_api.authentication import SignedTokenAuthentication
+
+STREAM_PATH = "/api/services/stream"
+
+DEFAULTS = {"HEARTBEAT": 15, "QUEUE_SIZE": 100}
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "SERVICE_STREAM", {})}
+
+
+class Subscriber:
+    """SSE 연결 하나의 이벤트 큐
+
+    이벤트는 이벤트 루프 스레드에서만 큐에 넣는다.(asyncio.Queue는 스레드 안전하지 않다)
+    """
+
+    def __init__(self, loop, stages: set, staff: set, queue_size: int):
+        self.loop = loop
+        self.stages = stages
+        self.staff = staff
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflow = False
+
+    def match(self, event: dict) -> bool:
+        if self.stages and event["stage"] not in self.stages:
+            return False
+        if self.staff:
+            # 담당에서 제외된 스태프 화면도 알 수 있도록 제외된 담당자 포함
+            return bool(self.staff & {*event["staff"], *event["removed_staff"]})
+        return True
+
+    def push(self, event) -> None:
+        if self.overflow:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 클라이언트. 연결을 끊고 다시 조회하도록 한다
+            self.overflow = True
+
+
+class Broker:
+    """프로세스 내 pub/sub"""
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, event: dict) -> None:
+        """구독중인 연결에 이벤트 전달(어느 스레드에서나 호출 가능)"""
+        event = {"seq": next(self._ids), **event}
+        with self._lock:
+            subscribers = [s for s in self._subscribers if s.match(event)]
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.push, event)
+            except RuntimeError:  # 이벤트 루프 종료
+                self.unsubscribe(subscriber)
+
+
+broker = Broker()
+
+
+def publish_services(ids, removed_staff=()) -> None:
+    """진료내역의 현재 단계/상태/담당자를 조회해 발행한다
+
+    커밋 후 호출되며 구독자가 없으면 조회하지 않는다.
+    """
+    if not broker.has_subscribers or not ids:
+        return
+
+    from iamdt.models import MedicalService, MedicalStaff
+
+    staff = {}
+    for detail, staff_id in MedicalStaff.objects.filter(detail__in=ids).values_list(
+        "detail", "staff"
+    ):
+        staff.setdefault(detail, []).append(staff_id)
+
+    services = MedicalService.objects.filter(pk__in=ids).values(
+        "id", "patient", "register", "stage", "status", "updated_at"
+    )
+    for service in services.order_by("id"):
+        service["staff"] = staff.get(service["id"], [])
+        service["removed_staff"] = list(removed_staff)
+        broker.publish(service)
+
+
+def services_changed(sender, ids, **kwargs):
+    transaction.on_commit(lambda: publish_services(ids))
+
+
+def staff_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # 담당자 등록은 services_changed
+    if action != "post_remove" or not pk_set:
+        return
+
+    if reverse:  # staff.schedule.remove(service)
+        ids, staff = list(pk_set), [instance.pk]
+    else:  # service.staff.remove(staff)
+        ids, staff = [instance.pk], list(pk_set)
+    transaction.on_commit(lambda: publish_services(ids, staff))
+
+
+def connect_signals() -> None:
+    """IamdtApiConfig.ready 에서 호출
+
+    진료내역 등록/수정, 담당자 등록은 일괄 등록에도 발생하는 services_changed 로 발행한다.
+    """
+    from iamdt.models import MedicalService, services_changed as changed
+
+    changed.connect(
+        services_changed, sender=MedicalService, dispatch_uid="service-stream"
+    )
+    m2m_changed.connect(
+        staff_changed,
+        sender=MedicalService.staff.through,
+        dispatch_uid="service-stream",
+    )
+
+
+def format_event(event: dict) -> bytes:
+    data = json.dumps(event, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"id: {event['seq']}\nevent: service\ndata: {data}\n\n".encode()
+
+
+class ServiceStreamApp:
+    """STREAM_PATH 요청은 SSE로 처리하고 나머지는 Django 앱으로 전달하는 ASGI 앱"""
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == STREAM_PATH:
+            await self.stream(scope, receive, send)
+        else:
+            await self.application(scope, receive, send)
+
+    async def stream(self, scope, receive, send) -> None:
+        if scope["method"] != "GET":
+            detail = exceptions.MethodNotAllowed.default_detail
+            return await self.error(send, 405, detail.format(method=scope["method"]))
+        if not await self.authenticate(scope):
+            return await self.error(
+                send, 403, exceptions.PermissionDenied.default_detail
+            )
+
+        query = parse_qs(scope["query_string"].decode())
+        stages = set(query.get("stage", []))
+        if not stages <= set(MedicalStage.values):
+            return await self.error(send, 400, "잘못된 진료단계")
+        try:
+            staff = {int(pk) for pk in query.get("staff", [])}
+        except ValueError:
+            return await self.error(send, 400, "잘못된 담당자")
+
+        options = get_options()
+        subscriber = Subscriber(
+            asyncio.get_running_loop(), stages, staff, options["QUEUE_SIZE"]
+        )
+        broker.subscribe(subscriber)
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/event-stream; charset=utf-8"),
+                        (b"cache-control", b"no-cache"),
+                        (b"x-accel-buffering", b"no"),  # nginx 버퍼링 해제
+                    ],
+                }
+            )
+            await self.body(send, b": connected\n\n")
+            await self.relay(subscriber, receive, send, options["HEARTBEAT"])
+        finally:
+            broker.unsubscribe(subscriber)
+
+    async def relay(self, subscriber, receive, send, heartbeat) -> None:
+        """연결이 끊길 때까지 이벤트 전달"""
+        disconnected = asyncio.ensure_future(self.wait_disconnect(receive))
+        try:
+            while not disconnected.done():
+                event = asyncio.ensure_future(subscriber.queue.get())
+                done, _ = await asyncio.wait(
+                    {event, disconnected},
+                    timeout=heartbeat,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if event not in done:
+                    event.cancel()
+                    if not done:
+                        await self.body(send, b": keepalive\n\n")
+                    continue
+
+                await self.body(send, format_event(event.result()))
+                if subscriber.overflow and subscriber.queue.empty():
+                    await self.body(send, b"event: reset\ndata: {}\n\n")
+                    break
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            disconnected.cancel()
+
+    @staticmethod
+    async def wait_disconnect(receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    @staticmethod
+    async def body(send, body: bytes) -> None:
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    @staticmethod
+    async def error(send, status: int, detail: str) -> None:
+        body = json.dumps({"detail": str(detail)}, ensure_ascii=False).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def authenticate(self, scope) -> bool:
+        """서명 토큰 혹은 세션 쿠키로 스태프 유저인지 확인(다른 API와 같은 IsAdminUser 기준)"""
+        return await sync_to_async(self._is_staff)(scope)
+
+    @staticmethod
+    def _is_staff(scope) -> bool:
+        from django.contrib.auth import get_user
+
+        request = ASGIRequest(scope, io.BytesIO())
+        try:
+            token = SignedTokenAuthentication().authenticate(request)
+        except exceptions.AuthenticationFailed:
+            return False
+        if token is not None:
+            return token[0].is_staff  # DB 조회 없음
+
+        engine = import_module(settings.SESSION_ENGINE)
+        request.session = engine.SessionStore(
+            request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        )
+        user = get_user(request)
+        return bool(user and user.is_staff)
@@ -13,3 +13,14 @@ from .patient_api import *
 from .medical_service_serializer import *
 from .medical_register_serializer import *
 from .medical_service_api import *
+from .service_stream import *
+from .change_api import *
+from .service_export import *
+
+from .search_filter import *
+from .response_cache import *
+from .session_cache import *
+from .metrics import *
+from .query_budget import *
+from .profiling import *
+from .schema import *
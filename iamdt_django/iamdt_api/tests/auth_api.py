@@ -1,8 +1,14 @@
-__all__ = ["LoginApiTestCase"]
+__all__ = ["LoginApiTestCase", "TokenAuthApiTestCase"]
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APIClient
+
+from iamdt.models import MedicalService
+from iamdt_api.authentication import denylist
 
 
 class LoginApiTestCase(APITestCase):
@@ -54,3 +60,109 @@ class LoginApiTestCase(APITestCase):
         self.client.login(**{"username": "doctor1", "password": "1234"})
         response = self.client.get(self.logout_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class TokenAuthApiTestCase(APITestCase):
+    """서명 토큰 인증 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        denylist.clear()
+        self.refresh_url = reverse("api:auth:refresh")
+
+    def login(self) -> dict:
+        response = self.client.post(
+            reverse("api:auth:login"),
+            data={"username": "doctor1", "password": "1234"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username"], "doctor1")
+        return response.data["token"]
+
+    def token_client(self, access) -> APIClient:
+        """세션 쿠키 없이 토큰만 보내는 클라이언트"""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return client
+
+    def test_url_check(self) -> None:
+        self.assertURLEqual("/api/auth/refresh", self.refresh_url)
+
+    def test_token_auth(self) -> None:
+        """토큰 인증은 세션/유저를 조회하지 않는다"""
+        client = self.token_client(self.login()["access"])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("api:change:list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tables = ("django_session", "iamdt_user")
+        self.assertFalse([q for q in queries if any(t in q["sql"] for t in tables)])
+
+        # 등록자는 토큰의 유저
+        response = client.post(
+            "/api/services",
+            data={"patient": 1, "stage": "diagnosys", "staff": [2]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            MedicalService.objects.get(id=response.data["id"]).creator_id, 2
+        )
+
+    def test_refresh(self) -> None:
+        """refresh 후 이전 토큰 쌍은 폐기"""
+        token = self.login()
+        response = self.client.post(
+            self.refresh_url, data={"refresh": token["refresh"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["token_type"], "Bearer")
+
+        response = self.token_client(response.data["access"]).get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.post(
+            self.refresh_url, data={"refresh": token["refresh"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.token_client(token["access"]).get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_logout(self) -> None:
+        """토큰 로그아웃시 폐기"""
+        client = self.token_client(self.login()["access"])
+        response = client.get(reverse("api:auth:logout"))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = client.get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid(self) -> None:
+        """변조/만료 토큰, access와 refresh 혼용"""
+        token = self.login()
+
+        response = self.token_client(token["access"] + "x").get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.token_client(token["refresh"]).get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.post(
+            self.refresh_url, data={"refresh": token["access"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        with override_settings(API_TOKEN={"ACCESS_LIFETIME": -1}):
+            access = self.login()["access"]
+        response = self.token_client(access).get("/api/staffs")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data["detail"].code, "token_expired")
@@ -0,0 +1,106 @@
+__all__ = ["ChangeFeedApiTestCase"]
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+
+from iamdt.models import ChangeLog, Customer, MedicalService
+
+
+class ChangeFeedApiTestCase(APITestCase):
+    """변경 피드 api 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.url = "/api/changes"
+        self.client.login(username="doctor1", password="1234")
+        self.token = self.client.get(self.url).data["token"]
+
+    def test_url(self) -> None:
+        """url 예상대로 생성되었는가"""
+        self.assertURLEqual(self.url, reverse("api:change:list"))
+
+    def test_no_auth(self) -> None:
+        """인증 없이 요청"""
+        response = APIClient().get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_token(self) -> None:
+        """since 없이 요청하면 현재 토큰만 반환"""
+        self.assertEqual(self.token, ChangeLog.objects.last().id)
+
+        response = self.client.get(self.url, data={"since": self.token})
+        self.assertEqual(response.data["changes"], [])
+        self.assertEqual(response.data["token"], self.token)
+
+    def test_changes(self) -> None:
+        """같은 객체의 변경은 마지막 것 하나로, 삭제는 tombstone"""
+        customer = Customer.objects.create(name="신규", phone="010-1111-2222")
+        customer.name = "변경"
+        customer.save()
+        deleted = Customer.objects.create(name="삭제", phone="010-3333-4444")
+        deleted_id = deleted.pk
+        deleted.delete()
+        MedicalService.objects.get(id=6).staff.add(4)
+
+        response = self.client.get(self.url, data={"since": self.token})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        changes = response.data["changes"]
+        self.assertEqual(
+            [(c["model"], c["id"], c["action"]) for c in changes],
+            [
+                ("customer", customer.pk, "create"),
+                ("customer", deleted_id, "delete"),
+                ("medicalservice", 6, "update"),
+            ],
+        )
+        self.assertEqual(changes[0]["data"]["name"], "변경")
+        self.assertIsNone(changes[1]["data"])
+        self.assertIn(4, changes[2]["data"]["staff"])
+        self.assertEqual(response.data["token"], ChangeLog.objects.last().id)
+
+    def test_has_more(self) -> None:
+        """limit 단위로 이어서 조회"""
+        for index in range(3):
+            Customer.objects.create(name=f"신규{index}", phone=f"010-1111-000{index}")
+
+        first = self.client.get(self.url, data={"since": self.token, "limit": 2})
+        self.assertTrue(first.data["has_more"])
+        self.assertEqual(len(first.data["changes"]), 2)
+
+        second = self.client.get(
+            self.url, data={"since": first.data["token"], "limit": 2}
+        )
+        self.assertFalse(second.data["has_more"])
+        self.assertEqual(second.data["changes"][0]["data"]["name"], "신규2")
+
+    def test_bulk(self) -> None:
+        """일괄 등록도 이력에 남는다"""
+        response = self.client.post(
+            "/api/services/bulk",
+            data={"items": [{"patient": 1, "stage": "diagnosys", "staff": [2]}]},
+            format="json",
+        )
+        service_id = response.data["results"][0]["id"]
+
+        response = self.client.get(self.url, data={"since": self.token})
+        changes = {(c["model"], c["id"]): c for c in response.data["changes"]}
+        self.assertEqual(changes[("medicalservice", service_id)]["action"], "create")
+        self.assertEqual(changes[("medicalservice", 6)]["data"]["status"], "complete")
+        self.assertEqual(
+            changes[("medicalregister", 2)]["data"]["last_service"], service_id
+        )
+
+    def test_fail(self) -> None:
+        """잘못된 since/limit"""
+        for params in [{"since": "abc"}, {"since": -1}, {"since": 0, "limit": 0}]:
+            response = self.client.get(self.url, data=params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
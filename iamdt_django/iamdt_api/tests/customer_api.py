@@ -1,11 +1,22 @@
 __all__ = ["CustomerApiTestCase"]
 
+import time
+from unittest import mock
 
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
 from rest_framework import status
+from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
 
 from iamdt.models import Customer
+from iamdt_api.pagination import ApiCursorPagination
+from iamdt_api.views.customer import CustomerList, CustomerLookup
 from rest_framework.reverse import reverse
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
 
 
 class CustomerApiTestCase(APITestCase):
@@ -21,6 +32,9 @@ class CustomerApiTestCase(APITestCase):
     ]
 
     def setUp(self) -> None:
+        # 응답 캐시는 테스트 DB 롤백과 무관하게 남아있다
+        caches["api"].clear()
+
         # {"name": "고객1", "phone": "01011112222"}
         self.customer = Customer.objects.get(id=1)
 
@@ -77,6 +91,93 @@ class CustomerApiTestCase(APITestCase):
         response = self.client.get(self.urls["list"])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_api_list_cursor(self) -> None:
+        """list api 커서 모드(get)"""
+        response = self.client.get(
+            self.urls["list"], data={"pagination": "cursor", "page_size": 2}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        first = [row["id"] for row in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second = [row["id"] for row in response.data["results"]]
+
+        self.assertEqual(len(second), 2)
+        self.assertGreater(min(first), max(second))  # (-id) 순서
+
+    def test_api_list_cursor_ordering(self) -> None:
+        """커서 모드는 정렬 파라미터와 관계없이 (-id) 순서"""
+        ids = []
+        params = {
+            "pagination": "cursor",
+            "page_size": 2,
+            "o": "name",
+            "ordering": "name",
+        }
+        response = self.client.get(self.urls["list"], data=params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [row["id"] for row in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(
+            ids, sorted(Customer.objects.values_list("id", flat=True))[::-1]
+        )
+
+        # DRF OrderingFilter를 사용하는 view에서도 (-id)
+        view = CustomerList(filter_backends=[OrderingFilter], ordering_fields="__all__")
+        request = Request(APIRequestFactory().get("/", {"ordering": "name"}))
+        ordering = ApiCursorPagination().get_ordering(
+            request, Customer.objects.all(), view
+        )
+        self.assertEqual(ordering, ("-id",))
+
+    def test_api_lookup(self) -> None:
+        """발신번호 조회 api(get)"""
+        url = reverse("api:customer:lookup")
+        self.assertURLEqual("/api/customers/lookup", url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data={"phone": "010-1111-2222"})
+
+        # 고객 1회 + 환자 prefetch 1회(silk의 EXPLAIN 쿼리 제외)
+        lookup_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and ("iamdt_patient" in query["sql"] or "iamdt_customer" in query["sql"])
+        ]
+        self.assertEqual(len(lookup_queries), 2)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["id"], self.customer.id)
+        self.assertEqual(
+            [patient["id"] for patient in response.data[0]["patients"]],
+            list(self.customer.patients.values_list("id", flat=True)),
+        )
+
+        # 환자는 Prefetch 로 채워진 QuerySet
+        (customer,) = CustomerLookup()._lookup("01011112222")
+        with self.assertNumQueries(0):
+            patients = customer.patients.all()
+            self.assertIsInstance(patients, QuerySet)
+            self.assertEqual(len(patients), len(response.data[0]["patients"]))
+
+    def test_api_lookup_fail(self) -> None:
+        """발신번호 조회 api 실패(get)"""
+        url = reverse("api:customer:lookup")
+        response = self.client.get(url, data={"phone": "01000000000"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_api_create(self) -> None:
         """create api (post)"""
         response = self.client.post(
@@ -91,6 +192,68 @@ class CustomerApiTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["name"], "고객1")
 
+    def test_api_read_conditional(self) -> None:
+        """read api 조건부 GET. 변경이 없으면 304, 수정후에는 200"""
+        response = self.client.get(self.urls["read"])
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(self.urls["read"], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        self.client.patch(self.urls["update"], data={"name": "변경"}, format="json")
+        response = self.client.get(self.urls["read"], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_api_list_conditional(self) -> None:
+        """list api 조건부 GET. 필터된 쿼리셋 기준, 삭제/추가시 ETag 변경"""
+        response = self.client.get(self.urls["list"], data={"name": "고객"})
+        etag = response["ETag"]
+
+        response = self.client.get(
+            self.urls["list"], data={"name": "고객"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post(self.urls["create"], data=self.new_customer, format="json")
+        response = self.client.get(
+            self.urls["list"], data={"name": "고객"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_api_list_conditional_delete(self) -> None:
+        """list api는 ETag만 사용. If-Modified-Since로는 삭제를 알 수 없다"""
+        created = self.client.post(
+            self.urls["create"], data=self.new_customer, format="json"
+        ).data
+        response = self.client.get(self.urls["list"])
+        self.assertNotIn("Last-Modified", response)
+        etag = response["ETag"]
+
+        Customer.objects.filter(id=created["id"]).delete()
+        response = self.client.get(
+            self.urls["list"], HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 3600)
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.urls["list"], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_api_list_filter_once(self) -> None:
+        """list api 조건부 GET은 검색 필터를 한번만 적용"""
+        with mock.patch.object(
+            CustomerList,
+            "filter_queryset",
+            autospec=True,
+            side_effect=CustomerList.filter_queryset,
+        ) as filter_queryset:
+            response = self.client.get(self.urls["list"], data={"name": "고객"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(filter_queryset.call_count, 1)
+
     def test_api_update(self) -> None:
         """update api (patch)"""
         response = self.client.patch(
@@ -1,7 +1,10 @@
 __all__ = ["MedicalRegisterSerializerTestCase"]
 
+import json
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from iamdt.models import MedicalRegister
 from iamdt_api.serializers.medical_register import MedicalRegisterInfoSerializer
@@ -32,3 +35,21 @@ class MedicalRegisterSerializerTestCase(TestCase):
 
         self.assertEqual(data["id"], 1)
         self.assertEqual(len(data["details"]), 4)  # 접수번호1의 내역은 총4개
+
+    def test_list_fast_path(self) -> None:
+        """리스트 응답은 기존 시리얼라이저 응답과 같아야 한다"""
+        registers = list(
+            MedicalRegister.objects.order_by("-id").select_related("patient__companion")
+        )
+        expected = [
+            MedicalRegisterInfoSerializer(register).data for register in registers
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            data = MedicalRegisterInfoSerializer(registers, many=True).data
+
+        # 진료내역, 담당자 (silk의 EXPLAIN 쿼리 제외)
+        selects = [q for q in queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 2)
+
+        self.assertEqual(json.loads(json.dumps(data)), json.loads(json.dumps(expected)))
@@ -1,11 +1,23 @@
 __all__ = ["MedicalServiceApiTestCase"]
 
 
+from django.db import connection, transaction
+from django.test import modify_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase, APIClient
 
-from iamdt.models import MedicalService
+from iamdt.models import (
+    ChangeLog,
+    MedicalRegister,
+    MedicalService,
+    Patient,
+    StaffAssignment,
+    StaffNotification,
+    StaffWorkload,
+)
+from iamdt_util import auth
 
 
 class MedicalServiceApiTestCase(APITestCase):
@@ -34,6 +46,7 @@ class MedicalServiceApiTestCase(APITestCase):
             "read": "/api/services/1",
             "update": "/api/services/1",
             "delete": "/api/services/1",
+            "bulk": "/api/services/bulk",
         }
 
         # new patient
@@ -60,6 +73,7 @@ class MedicalServiceApiTestCase(APITestCase):
         self.assertURLEqual(
             self.urls["delete"], reverse("api:service:detail", kwargs={"id": 1})
         )
+        self.assertURLEqual(self.urls["bulk"], reverse("api:service:bulk"))
 
     def test_url_option(self) -> None:
         """url access"""
@@ -84,6 +98,17 @@ class MedicalServiceApiTestCase(APITestCase):
         response = self.client.get(self.urls["list"])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    @modify_settings(MIDDLEWARE={"remove": "silk.middleware.SilkyMiddleware"})
+    def test_api_list_num_queries(self) -> None:
+        """list api 쿼리수는 레코드 수와 무관해야 한다"""
+        with CaptureQueriesContext(connection) as one:
+            self.client.get(self.urls["list"], data={"page_size": 1})
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(self.urls["list"], data={"page_size": 10})
+
+        self.assertEqual(len(response.data["results"]), 6)
+        self.assertEqual(len(one), len(many))
+
     def test_api_create(self) -> None:
         """create api (post)"""
         response = self.client.post(
@@ -92,6 +117,40 @@ class MedicalServiceApiTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["stage"], self.new_patient["stage"])
 
+    def test_api_write_queries(self) -> None:
+        """등록/담당자 교체시 파생 데이터는 요청당 한번 기록(세션 유저 미캐시에도 예산 이내)"""
+        url = reverse("api:service:detail", kwargs={"id": 6})
+        requests = [
+            (
+                "post",
+                self.urls["create"],
+                {"patient": 5, "stage": "examination", "staff": [2, 3, 4]},
+            ),
+            ("patch", url, {"staff": [4, 5]}),
+            ("put", url, {"staff": [2, 3, 4, 5]}),
+            ("patch", url, {"staff": []}),
+        ]
+        for method, path, data in requests:
+            with self.subTest(method=method, data=data):
+                auth.users.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    response = getattr(self.client, method)(path, data, format="json")
+                self.assertIn(response.status_code, (200, 201), response.data)
+
+                changelog = [
+                    q["sql"]
+                    for q in queries
+                    if q["sql"].startswith('INSERT INTO "iamdt_changelog"')
+                ]
+                self.assertEqual(len(changelog), 1)
+
+        workload = {
+            (row.staff_id, row.stage): row.waiting
+            for row in StaffWorkload.objects.filter(waiting__gt=0)
+        }
+        counts = StaffWorkload.counts().items()
+        self.assertEqual(workload, {key: waiting for key, waiting in counts if waiting})
+
     def test_api_read(self) -> None:
         """read api (get)"""
         response = self.client.get(self.urls["read"])
@@ -107,6 +166,47 @@ class MedicalServiceApiTestCase(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_api_conditional_staff(self) -> None:
+        """담당자만 변경되어도 상세/리스트 ETag가 바뀌어야 한다"""
+        url = reverse("api:service:detail", kwargs={"id": 6})
+        detail_etag = self.client.get(url)["ETag"]
+        list_etag = self.client.get(self.urls["list"])["ETag"]
+
+        MedicalService.objects.get(id=6).staff.add(4)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.urls["list"], HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_api_conditional_page(self) -> None:
+        """리스트 ETag 집계는 전체 JOIN 대신 현재 페이지 진료접수만 집계한다"""
+        patient = MedicalRegister.objects.order_by("-id")[0].patient_id
+        urls = [
+            self.urls["list"],
+            reverse("api:patient:services", kwargs={"id": patient}),
+        ]
+        for url in urls:
+            for params in [{"page_size": 1}, {"page_size": 1, "pagination": "cursor"}]:
+                response = self.client.get(url, data=params)
+                page = [row["id"] for row in response.data["results"]]
+                self.assertEqual(len(page), 1)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(
+                        url, data=params, HTTP_IF_NONE_MATCH=response["ETag"]
+                    )
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                aggregates = [
+                    q["sql"]
+                    for q in queries
+                    if q["sql"].startswith("SELECT") and "MAX(" in q["sql"]
+                ]
+                self.assertEqual(len(aggregates), 1)
+                self.assertIn(
+                    f'"iamdt_medicalregister"."id" IN ({page[0]})', aggregates[0]
+                )
+
     def test_api_update_fail(self) -> None:
         """update api (patch). phone validation fail"""
         response = self.client.patch(
@@ -121,3 +221,206 @@ class MedicalServiceApiTestCase(APITestCase):
         """
         response = self.client.delete(self.urls["delete"])
         self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+    def test_api_bulk_create(self) -> None:
+        """bulk api (post). 이전 단계 완료/접수번호 현재 단계/알림까지 처리"""
+        items = [
+            {"patient": 1, "stage": "diagnosys", "staff": [2]},
+            {"patient": 2, "stage": "examination", "staff": [2, 3, 3]},
+            {"patient": 3, "stage": "discharge", "staff": []},
+        ]
+        version = Patient.objects.get(id=1).service_version
+
+        response = self.client.post(
+            self.urls["bulk"], data={"items": items}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["created"] * 3,
+        )
+
+        result = response.data["results"][0]
+        service = MedicalService.objects.select_related("register").get(id=result["id"])
+        self.assertEqual(service.register_id, 2)  # 기존 접수번호에 이어서
+        self.assertEqual(service.register.last_service_id, service.id)
+        self.assertEqual(service.register.last_stage, "diagnosys")
+        self.assertEqual(MedicalService.objects.get(id=6).status, "complete")
+        self.assertEqual(Patient.objects.get(id=1).service_version, version + 1)
+
+        service = MedicalService.objects.get(id=response.data["results"][1]["id"])
+        self.assertEqual(sorted(service.staff.values_list("id", flat=True)), [2, 3])
+        self.assertEqual(
+            StaffNotification.objects.filter(sent_at__isnull=True).count(), 3
+        )
+
+    def test_api_bulk_new_register(self) -> None:
+        """퇴원 이후 등록은 새 접수번호"""
+        self.client.post(
+            self.urls["bulk"],
+            data={"items": [{"patient": 2, "stage": "discharge", "staff": [2]}]},
+            format="json",
+        )
+        response = self.client.post(
+            self.urls["bulk"],
+            data={"items": [{"patient": 2, "stage": "register", "staff": [2]}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        service = MedicalService.objects.get(id=response.data["results"][0]["id"])
+        self.assertNotEqual(service.register_id, 3)
+        self.assertEqual(service.register.patient_id, 2)
+        self.assertEqual(service.register.last_service_id, service.id)
+
+    def test_api_bulk_atomic(self) -> None:
+        """atomic 모드는 하나라도 실패하면 아무것도 등록하지 않는다"""
+        count = MedicalService.objects.count()
+        version = Patient.objects.get(id=1).service_version
+
+        response = self.client.post(
+            self.urls["bulk"],
+            data={
+                "items": [
+                    {"patient": 1, "stage": "diagnosys", "staff": [2]},
+                    {"patient": 2, "stage": "payment", "staff": [2]},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["skipped", "error"],
+        )
+        self.assertIn("non_field_errors", response.data["results"][1]["errors"])
+        self.assertEqual(MedicalService.objects.count(), count)
+        self.assertEqual(Patient.objects.get(id=1).service_version, version)
+
+    def test_api_bulk_best_effort(self) -> None:
+        """best_effort 모드는 검증을 통과한 항목만 등록"""
+        versions = dict(Patient.objects.values_list("id", "service_version"))
+        response = self.client.post(
+            self.urls["bulk"],
+            data={
+                "mode": "best_effort",
+                "items": [
+                    {"patient": 1, "stage": "diagnosys", "staff": [2]},
+                    {"patient": 2, "stage": "payment", "staff": [2]},  # 이행 불가
+                    {"patient": 1, "stage": "treatment", "staff": [2]},  # 중복 환자
+                    {"patient": 3, "stage": "examination", "staff": [99]},
+                    {"patient": 99, "stage": "examination", "staff": [2]},
+                    {"patient": 4, "stage": "unknown", "staff": [2]},
+                ],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1)
+
+        results = response.data["results"]
+        self.assertEqual(results[0]["status"], "created")
+        self.assertEqual(
+            [list(result["errors"]) for result in results[1:]],
+            [["non_field_errors"], ["patient"], ["staff"], ["patient"], ["stage"]],
+        )
+
+        # 등록된 환자만 버전 증가(실패한 환자의 동시 단건 등록은 409가 되지 않는다)
+        self.assertEqual(
+            dict(Patient.objects.values_list("id", "service_version")),
+            {**versions, 1: versions[1] + 1},
+        )
+
+    def test_api_bulk_fail(self) -> None:
+        """bulk api 요청 형식 오류"""
+        response = self.client.post(
+            self.urls["bulk"], data={"items": []}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.urls["bulk"],
+            data={"mode": "best_effort", "items": [{"patient": 99}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], 0)
+
+    def derived_state(self) -> dict:
+        """진료내역 등록으로 갱신되는 파생 데이터(시각 제외)"""
+        return {
+            "services": list(
+                MedicalService.objects.order_by("id").values_list(
+                    "id", "register", "stage", "status"
+                )
+            ),
+            "registers": list(
+                MedicalRegister.objects.order_by("id").values_list(
+                    "id", "last_service", "last_stage", "last_status"
+                )
+            ),
+            "workloads": set(
+                StaffWorkload.objects.filter(waiting__gt=0).values_list(
+                    "staff", "stage", "waiting"
+                )
+            ),
+            "assignments": set(
+                StaffAssignment.objects.values_list("staff", "register", "active")
+            ),
+            "notifications": sorted(
+                StaffNotification.objects.values_list("service", "staff", "action")
+            ),
+            "changes": set(ChangeLog.objects.values_list("model", "object_id")),
+        }
+
+    def test_api_bulk_same_as_single(self) -> None:
+        """일괄 등록과 단건 등록은 같은 파생 데이터를 남긴다"""
+        rounds = [
+            [
+                {"patient": 1, "stage": "diagnosys", "staff": [2]},  # 대기 단계 완료
+                {"patient": 2, "stage": "discharge", "staff": [2, 3]},
+            ],
+            [{"patient": 2, "stage": "register", "staff": [3]}],  # 새 접수번호
+        ]
+        self.client.login(username="admin", password="1234")
+
+        with transaction.atomic():
+            for items in rounds:
+                for item in items:
+                    response = self.client.post(
+                        self.urls["create"], data=item, format="json"
+                    )
+                    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            single = self.derived_state()
+            transaction.set_rollback(True)
+
+        for items in rounds:
+            response = self.client.post(
+                self.urls["bulk"], data={"items": items}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.derived_state(), single)
+
+    @modify_settings(MIDDLEWARE={"remove": "silk.middleware.SilkyMiddleware"})
+    def test_api_bulk_num_queries(self) -> None:
+        """bulk api 쿼리수는 항목 수와 무관해야 한다"""
+        with CaptureQueriesContext(connection) as one:
+            self.client.post(
+                self.urls["bulk"],
+                data={"items": [{"patient": 1, "stage": "diagnosys", "staff": [2]}]},
+                format="json",
+            )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.post(
+                self.urls["bulk"],
+                data={
+                    "items": [
+                        {"patient": pk, "stage": "examination", "staff": [2, 3]}
+                        for pk in [2, 3, 4, 5]
+                    ]
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.data["created"], 4)
+        self.assertEqual(len(one), len(many))
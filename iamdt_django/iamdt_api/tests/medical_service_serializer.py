@@ -1,8 +1,19 @@
-__all__ = ["MedicalServiceInfoSerializerTestCase"]
+__all__ = [
+    "MedicalServiceInfoSerializerTestCase",
+    "MedicalServiceAddSerializerTestCase",
+    "MedicalServiceTransitionStressTestCase",
+]
 
-from django.test import TestCase
+import re
+from io import StringIO
 
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+
+from iamdt.models import MedicalService
 from iamdt.models.choices import MedicalStage, MedicalStageStatus
+from iamdt_api.exceptions import Conflict
 from iamdt_api.serializers.medical_service import (
     MedicalServiceInfoSerializer,
     MedicalServiceAddSerializer,
@@ -29,6 +40,24 @@ class MedicalServiceAddSerializerTestCase(TestCase):
         serializer = MedicalServiceAddSerializer(data=self.data)
         self.assertTrue(serializer.is_valid())
 
+    def test_create_conflict(self) -> None:
+        """같은 상태에서 검증된 두 요청 중 나중 요청은 Conflict(접수번호 분기 방지)"""
+        creator = get_user_model().objects.get(id=2)
+        first = MedicalServiceAddSerializer(data=self.data)
+        second = MedicalServiceAddSerializer(
+            data={**self.data, "stage": MedicalStage.TREATMENT}
+        )
+        self.assertTrue(first.is_valid())
+        self.assertTrue(second.is_valid())
+
+        first.save(creator=creator)
+        with self.assertRaises(Conflict):
+            second.save(creator=creator)
+
+        services = MedicalService.objects.filter(patient=1).order_by("-id")
+        self.assertEqual(services[0].stage, MedicalStage.DIAGNOSYS)
+        self.assertEqual(services[1].status, MedicalStageStatus.COMPLETE)
+
     def test_validate_patient(self) -> None:
         """유효성 검증"""
         # text
@@ -148,3 +177,20 @@ class MedicalServiceInfoSerializerTestCase(TestCase):
         self.data["staff"] = [1, 2, "a"]
         serializer = MedicalServiceInfoSerializer(data=self.data)
         self.assertFalse(serializer.is_valid())
+
+
+class MedicalServiceTransitionStressTestCase(TransactionTestCase):
+    """여러 스레드가 같은 환자의 진료 단계를 동시에 등록해도 분기되지 않아야 한다"""
+
+    fixtures = ["user.json"]
+
+    def test_stress(self) -> None:
+        out = StringIO()
+        call_command("stress_stage_transition", threads=4, rounds=10, stdout=out)
+        report = out.getvalue()
+
+        numbers = dict(re.findall(r"(\w+) (\d+)", report))
+        self.assertEqual(numbers["forks"], "0", report)
+        self.assertEqual(numbers["attempts"], "40", report)
+        self.assertEqual(numbers["created"], numbers["success"], report)
+        self.assertGreater(int(numbers["success"]), 0, report)
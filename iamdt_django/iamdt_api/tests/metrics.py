@@ -0,0 +1,161 @@
+__all__ = ["MetricsTestCase", "MmapValuesTestCase"]
+
+import os
+import re
+import tempfile
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+
+from iamdt_util.metrics import LATENCY_BUCKETS, MmapValues, store
+
+
+class MetricsTestCase(TestCase):
+    """요청 지표 미들웨어/엔드포인트 테스트"""
+
+    fixtures = ["user.json"]
+
+    def setUp(self) -> None:
+        caches["api"].clear()
+        self.client.login(username="doctor1", password="1234")
+
+    def sample(self, name, **labels) -> float:
+        """/metrics 에서 지정된 라벨의 값(없으면 0)"""
+        body = self.client.get("/metrics").content.decode()
+        # 히스토그램 버킷의 le는 마지막
+        items = sorted(labels.items(), key=lambda item: (item[0] == "le", item[0]))
+        label = ",".join(f'{k}="{v}"' for k, v in items)
+        match = re.search(rf"^{name}\{{{re.escape(label)}\}} (\S+)$", body, re.M)
+        return float(match.group(1)) if match else 0.0
+
+    def test_request(self) -> None:
+        """url name 라벨로 요청 수/응답시간/쿼리 수/응답 크기 기록"""
+        labels = {"view": "api:staff:list", "method": "GET"}
+        requests = self.sample("http_requests_total", status="200", **labels)
+        latency = self.sample("http_request_duration_seconds_count", **labels)
+
+        self.client.get("/api/staffs")
+        self.client.get("/api/staffs")
+
+        self.assertEqual(
+            self.sample("http_requests_total", status="200", **labels), requests + 2
+        )
+        self.assertEqual(
+            self.sample("http_request_duration_seconds_count", **labels), latency + 2
+        )
+        self.assertEqual(
+            self.sample("http_request_duration_seconds_bucket", le="+Inf", **labels),
+            latency + 2,
+        )
+        self.assertGreater(self.sample("http_request_db_queries_sum", **labels), 0)
+        self.assertGreater(self.sample("http_response_size_bytes_sum", **labels), 0)
+
+        # 응답 캐시 hit
+        self.assertGreater(
+            self.sample("cache_requests_total", cache="api", result="hit"), 0
+        )
+
+    def test_unresolved(self) -> None:
+        """url이 없는 요청"""
+        labels = {"view": "unresolved", "method": "GET", "status": "404"}
+        before = self.sample("http_requests_total", **labels)
+        self.client.get("/unknown")
+        self.assertEqual(self.sample("http_requests_total", **labels), before + 1)
+
+    def test_exposition(self) -> None:
+        """text exposition 형식"""
+        self.client.get("/api/staffs")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            response["Content-Type"].startswith("text/plain; version=0.0.4")
+        )
+
+        body = response.content.decode()
+        self.assertIn("# TYPE http_requests_total counter", body)
+        self.assertIn("# TYPE http_request_duration_seconds histogram", body)
+
+        # 버킷은 누적값
+        buckets = [
+            float(value)
+            for value in re.findall(
+                r'^http_request_duration_seconds_bucket\{method="GET",'
+                r'view="api:staff:list",le="[^"]+"\} (\S+)$',
+                body,
+                re.M,
+            )
+        ]
+        self.assertEqual(len(buckets), len(LATENCY_BUCKETS) + 1)
+        self.assertEqual(buckets, sorted(buckets))
+
+    @override_settings(METRICS={"ALLOWED_IPS": []})
+    def test_permission(self) -> None:
+        """허용 IP가 아니면 스태프 유저만"""
+        self.assertEqual(self.client.get("/metrics").status_code, status.HTTP_200_OK)
+
+        self.client.logout()
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_forwarded(self) -> None:
+        """프록시를 거친 요청은 허용 IP(프록시 주소)로 허용하지 않는다"""
+        self.client.logout()
+        self.assertEqual(self.client.get("/metrics").status_code, status.HTTP_200_OK)
+        for header in ["HTTP_X_FORWARDED_FOR", "HTTP_X_REAL_IP", "HTTP_FORWARDED"]:
+            response = self.client.get("/metrics", **{header: "203.0.113.1"})
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(METRICS={"ALLOWED_IPS": [], "TOKEN": "secret"})
+    def test_token(self) -> None:
+        """Authorization: Bearer <TOKEN> 요청 허용"""
+        self.client.logout()
+        for authorization, expected in [
+            ("Bearer secret", status.HTTP_200_OK),
+            ("Bearer wrong", status.HTTP_403_FORBIDDEN),
+            ("secret", status.HTTP_403_FORBIDDEN),
+        ]:
+            response = self.client.get(
+                "/metrics",
+                HTTP_AUTHORIZATION=authorization,
+                HTTP_X_FORWARDED_FOR="203.0.113.1",
+            )
+            self.assertEqual(response.status_code, expected)
+
+
+class MmapValuesTestCase(SimpleTestCase):
+    """프로세스별 mmap 파일 저장소 테스트"""
+
+    def test_collect(self) -> None:
+        """여러 프로세스 파일 합산"""
+        with tempfile.TemporaryDirectory() as directory:
+            first = MmapValues(os.path.join(directory, "metrics_1.db"))
+            second = MmapValues(os.path.join(directory, "metrics_2.db"))
+            first.inc("a", 1)
+            first.inc("b", 2.5)
+            second.inc("a", 3)
+
+            with override_settings(METRICS={"DIR": directory}):
+                self.assertEqual(store.collect(), {"a": 4.0, "b": 2.5})
+
+    def test_grow_reopen(self) -> None:
+        """파일 크기 확장, 다시 열면 이어서 기록"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics_1.db")
+            values = MmapValues(path)
+            keys = [f"key-{index}" * 20 for index in range(1000)]
+            for key in keys:
+                values.inc(key, 1)
+            self.assertGreater(os.path.getsize(path), MmapValues.initial_size)
+
+            reopened = MmapValues(path)
+            reopened.inc(keys[0], 1)
+            self.assertEqual(dict(reopened.items())[keys[0]], 2.0)
+            self.assertEqual(len(reopened.items()), 1000)
+
+    def test_anonymous(self) -> None:
+        """파일 없이 프로세스 메모리"""
+        values = MmapValues()
+        for index in range(5000):
+            values.inc(f"key-{index}", index)
+        self.assertEqual(dict(values.items())["key-4999"], 4999.0)
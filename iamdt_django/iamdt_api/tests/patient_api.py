@@ -1,6 +1,7 @@
 __all__ = ["PatientApiTestCase"]
 
 
+from django.core.cache import caches
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase, APIClient
@@ -21,6 +22,9 @@ class PatientApiTestCase(APITestCase):
     ]
 
     def setUp(self) -> None:
+        # 응답 캐시는 테스트 DB 롤백과 무관하게 남아있다
+        caches["api"].clear()
+
         # {"name": "환자1", "companion": 1}
         self.patient = Patient.objects.get(id=1)
 
@@ -0,0 +1,104 @@
+__all__ = ["SamplingProfilerTestCase"]
+
+import sys
+import threading
+import time
+from collections import Counter
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from iamdt_util.profiling import (
+    StackSampler,
+    clear_profiles,
+    collapse_stack,
+    get_profiles,
+)
+
+PROFILER_MIDDLEWARE = ["iamdt_util.profiling.SamplingProfilerMiddleware"] + [
+    middleware
+    for middleware in settings.MIDDLEWARE
+    if not middleware.startswith("silk.")
+]
+
+
+@override_settings(MIDDLEWARE=PROFILER_MIDDLEWARE)
+class SamplingProfilerTestCase(TestCase):
+    """샘플링 프로파일러 미들웨어 테스트"""
+
+    fixtures = ["user.json"]
+
+    def setUp(self) -> None:
+        clear_profiles()
+        self.client.login(username="doctor1", password="1234")
+
+    @override_settings(SAMPLING_PROFILER={"RATE": 1, "SLOW_MS": 10_000})
+    def test_sample(self) -> None:
+        """RATE 비율로 선택된 요청 기록"""
+        self.client.get("/api/staffs")
+
+        profile = get_profiles()[-1]
+        self.assertEqual(profile["path"], "/api/staffs")
+        self.assertEqual(profile["status"], 200)
+        self.assertEqual(profile["reason"], "sample")
+
+    @override_settings(SAMPLING_PROFILER={"RATE": 0, "SLOW_MS": 10_000})
+    def test_skip(self) -> None:
+        """선택되지 않은 빠른 요청은 스택을 수집하지 않고 기록하지 않는다"""
+        with mock.patch.object(StackSampler, "track") as track:
+            self.client.get("/api/staffs")
+
+        track.assert_not_called()
+        self.assertEqual(get_profiles(), [])
+
+    @override_settings(SAMPLING_PROFILER={"RATE": 0, "SLOW_MS": 0, "INTERVAL": 0.001})
+    def test_slow(self) -> None:
+        """느린 요청은 항상 기록"""
+        with self.assertLogs("iamdt_util.profiling", level="WARNING"):
+            self.client.get("/api/staffs")
+
+        profile = get_profiles()[-1]
+        self.assertEqual(profile["reason"], "slow")
+        self.assertGreaterEqual(
+            profile["samples"], sum(n for _, n in profile["stacks"])
+        )
+
+    @override_settings(SAMPLING_PROFILER={"RATE": 1, "BUFFER_SIZE": 2})
+    def test_ring_buffer(self) -> None:
+        """보관 개수 제한"""
+        for page in range(1, 4):
+            self.client.get("/api/staffs", data={"page": page})
+
+        self.assertEqual(
+            [profile["path"] for profile in get_profiles()],
+            ["/api/staffs?page=2", "/api/staffs?page=3"],
+        )
+
+    def test_collapse_stack(self) -> None:
+        """스택은 바깥 → 안쪽 순서"""
+        stack = collapse_stack(sys._getframe())
+        self.assertTrue(stack.split(";")[-1].startswith(f"{__name__}.test_collapse"))
+
+    def test_watch(self) -> None:
+        """watch 한 요청은 delay 가 지난 뒤부터 수집"""
+
+        def busy(sampler, seconds) -> Counter:
+            ident = threading.get_ident()
+            counter = sampler.watch(ident)
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                pass
+            sampler.unwatch(ident)
+            return counter
+
+        with mock.patch("iamdt_util.profiling.sys._current_frames") as frames:
+            frames.return_value = {}
+            busy(StackSampler(0.001, 64, delay=10), 0.05)
+        frames.assert_not_called()
+
+        sampler = StackSampler(0.001, 64, delay=0.02)
+        counter = busy(sampler, 0.2)
+        self.assertTrue(counter)
+        self.assertEqual(sampler._active, {})
+        self.assertEqual(sampler._pending, {})
@@ -0,0 +1,105 @@
+__all__ = ["QueryBudgetTestCase"]
+
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from iamdt.models import MedicalRegister, Patient
+from iamdt_api.views.service import MedicalServiceList
+from iamdt_util.query_budget import (
+    QueryBudgetExceeded,
+    QueryBudgetTestMixin,
+    QueryInspector,
+    normalize_sql,
+)
+
+
+class QueryBudgetTestCase(QueryBudgetTestMixin, APITestCase):
+    """N+1 쿼리 탐지/쿼리 예산 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.client.login(username="doctor1", password="1234")
+
+    def test_normalize(self) -> None:
+        """값/IN 목록이 달라도 같은 템플릿"""
+        self.assertEqual(
+            normalize_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s) AND "n" = 10'),
+            normalize_sql('SELECT * FROM "t" WHERE "id" IN (%s) AND "n" = 20'),
+        )
+        self.assertEqual(
+            normalize_sql("SELECT * FROM \"t\"  WHERE \"name\" = 'it''s'"),
+            'SELECT * FROM "t" WHERE "name" = ?',
+        )
+
+    def test_inspector(self) -> None:
+        """반복 쿼리와 실행 위치"""
+        with QueryInspector() as inspector:
+            for register in MedicalRegister.objects.all():
+                register.patient.name
+
+        [(template, count, locations)] = inspector.repeated()
+        self.assertIn('FROM "iamdt_patient"', template)
+        self.assertEqual(count, MedicalRegister.objects.count())
+        # 쿼리를 실행한 프로젝트 코드(지연 로딩한 테스트 라인)
+        [location] = locations
+        self.assertTrue(location.startswith(f"{__name__}.test_inspector:"))
+
+    def test_assert_budget(self) -> None:
+        """테스트 헬퍼"""
+        # 요청 전체(미들웨어 포함)에 N+1 없음
+        with self.assertQueryBudget():
+            response = self.client.get("/api/services")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertQueryBudget(1):
+            for patient in Patient.objects.select_related("companion"):
+                patient.companion.name
+
+        with self.assertRaisesMessage(AssertionError, "N+1 쿼리"):
+            with self.assertQueryBudget():
+                for patient in Patient.objects.all():
+                    patient.companion.name
+
+        with self.assertRaisesMessage(AssertionError, "쿼리 예산 초과"):
+            with self.assertQueryBudget(0):
+                Patient.objects.count()
+
+    def test_budget_exceeded(self) -> None:
+        """뷰 예산 초과시 테스트 실패"""
+        with mock.patch.object(MedicalServiceList, "query_budget", {"GET": 1}):
+            with self.assertRaisesMessage(QueryBudgetExceeded, "쿼리 예산 초과"):
+                self.client.get("/api/services")
+
+            # 다른 메소드는 확인하지 않는다
+            response = self.client.options("/api/services")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_n_plus_one(self) -> None:
+        """select_related 가 빠지면 N+1"""
+        queryset = MedicalRegister.objects.order_by("-id")
+        with mock.patch.object(MedicalServiceList, "get_queryset", lambda _: queryset):
+            with self.assertRaisesMessage(QueryBudgetExceeded, "N+1 쿼리") as caught:
+                self.client.get("/api/services")
+        # current_stage 에서 사용하는 __str__ 이 환자/보호자를 지연 로딩한다
+        self.assertIn("iamdt.models.medical_register.__str__", str(caught.exception))
+        self.assertIn("iamdt.models.patient.__str__", str(caught.exception))
+
+    @override_settings(QUERY_BUDGET={"RAISE": False})
+    def test_log(self) -> None:
+        """운영에서는 경고 로그"""
+        with mock.patch.object(MedicalServiceList, "query_budget", {"GET": 1}):
+            with self.assertLogs("iamdt_util.query_budget", "WARNING") as logs:
+                response = self.client.get("/api/services")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("api:service:list", logs.output[0])
@@ -0,0 +1,174 @@
+__all__ = ["ResponseCacheTestCase", "LRUFileBasedCacheTestCase"]
+
+import importlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from iamdt.models import Customer, MedicalService
+from iamdt_api.cache import bump_version, cache_stats, get_versions
+from iamdt_util.cache import LRUFileBasedCache
+
+
+class ResponseCacheTestCase(APITestCase):
+    """리스트 API 응답 캐시 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        caches["api"].clear()
+        self.client.login(username="doctor1", password="1234")
+
+    def test_hit(self) -> None:
+        """같은 요청은 DB 조회 없이 캐시에서 응답"""
+        stats = cache_stats()
+        first = self.client.get("/api/customers", data={"page_size": 2})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get("/api/customers", data={"page_size": 2})
+
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertFalse([q for q in queries if "iamdt_customer" in q["sql"]])
+        self.assertEqual(cache_stats()["hit"], stats["hit"] + 1)
+        self.assertEqual(cache_stats()["miss"], stats["miss"] + 1)
+
+        # 쿼리가 다르면 다른 키
+        other = self.client.get("/api/customers", data={"page_size": 3})
+        self.assertEqual(other["X-Cache"], "MISS")
+
+    def test_hit_not_modified(self) -> None:
+        """캐시된 ETag와 일치하면 304"""
+        etag = self.client.get("/api/customers")["ETag"]
+
+        response = self.client.get("/api/customers", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_invalidate(self) -> None:
+        """모델 저장/삭제시 해당 모델에 의존하는 응답만 무효화"""
+        self.client.get("/api/customers")
+        self.client.get("/api/staffs")
+
+        customer = Customer.objects.get(id=1)
+        customer.name = "변경"
+        customer.save()
+
+        response = self.client.get("/api/customers")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][-1]["name"], "변경")
+        self.assertEqual(self.client.get("/api/staffs")["X-Cache"], "HIT")
+
+        # 환자 리스트는 보호자 이름으로 검색하므로 고객 변경에도 무효화
+        self.client.get("/api/patients")
+        Customer.objects.create(name="신규", phone="01012341234")
+        self.assertEqual(self.client.get("/api/patients")["X-Cache"], "MISS")
+
+    def test_invalidate_m2m(self) -> None:
+        """담당자 변경시 진료내역/담당자 버전 증가"""
+        labels = ["iamdt.medicalservice", "iamdt.medicalstaff"]
+        before = get_versions(labels)
+
+        MedicalService.objects.get(id=6).staff.add(4)
+
+        after = get_versions(labels)
+        self.assertTrue(all(a > b for a, b in zip(after, before)))
+
+    def test_last_login(self) -> None:
+        """로그인(last_login 저장)은 스태프 리스트를 무효화하지 않는다"""
+        self.client.get("/api/staffs")
+        self.client.login(username="nurse1", password="1234")
+        self.client.login(username="doctor1", password="1234")
+
+        self.assertEqual(self.client.get("/api/staffs")["X-Cache"], "HIT")
+
+    def test_role(self) -> None:
+        """유저 역할이 다르면 다른 키"""
+        self.client.get("/api/staffs")
+
+        nurse = get_user_model().objects.get(username="nurse1")
+        self.client.force_login(nurse)
+        self.assertEqual(self.client.get("/api/staffs")["X-Cache"], "MISS")
+
+    def test_browsable_api(self) -> None:
+        """browsable API(HTML) 응답은 같은 역할의 다른 유저에게 공유하지 않는다"""
+        users = get_user_model().objects.filter(username__in=["admin", "dev1"])
+        self.assertEqual({user.role for user in users}, {"developer"})
+
+        for user in users:
+            self.client.force_login(user)
+            response = self.client.get("/api/customers", HTTP_ACCEPT="text/html")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(response.has_header("X-Cache"))
+            self.assertContains(response, user.username)
+
+        # JSON 응답은 역할별로 캐시
+        self.client.force_login(users[0])
+        self.client.get("/api/customers")
+        self.client.force_login(users[1])
+        self.assertEqual(self.client.get("/api/customers")["X-Cache"], "HIT")
+
+
+class LRUFileBasedCacheTestCase(SimpleTestCase):
+    """LRU 파일 캐시 테스트"""
+
+    def test_cull(self) -> None:
+        """MAX_ENTRIES 초과시 최근에 사용되지 않은 항목부터 삭제"""
+        with tempfile.TemporaryDirectory() as location:
+            cache = LRUFileBasedCache(
+                location, {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 3}}
+            )
+            for key in ["a", "b", "c"]:
+                cache.set(key, key)
+            # 파일 수정시각 해상도와 무관하도록 직접 지정
+            for offset, key in enumerate(["a", "b", "c"]):
+                os.utime(cache._key_to_file(key), (offset, offset))
+            cache.get("a")  # a를 최근 사용으로
+
+            cache.set("d", "d")  # 3개 이상이므로 가장 오래된 b 삭제
+
+            self.assertEqual(cache.get("a"), "a")
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("c"), "c")
+            self.assertEqual(cache.get("d"), "d")
+
+    def test_shared_versions(self) -> None:
+        """다른 worker(캐시 객체)에서 증가시킨 모델 버전이 공유된다"""
+        with tempfile.TemporaryDirectory() as location:
+            api = {
+                "BACKEND": "iamdt_util.cache.LRUFileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(CACHES={**settings.CACHES, "api": api}):
+                other = LRUFileBasedCache(location, {})
+                (before,) = get_versions(["iamdt.customer"])
+
+                bump_version("iamdt.customer")
+
+                key = "api:version:iamdt.customer"
+                self.assertNotEqual(other.get(key), before)
+                self.assertEqual(other.get(key), caches["api"].get(key))
+
+    def test_production_settings(self) -> None:
+        """운영 설정의 API 캐시는 파일 캐시"""
+        production = importlib.import_module("config.settings.production")
+        self.assertEqual(
+            production.CACHES["api"]["BACKEND"], "iamdt_util.cache.LRUFileBasedCache"
+        )
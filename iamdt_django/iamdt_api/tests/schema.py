@@ -0,0 +1,155 @@
+__all__ = ["SchemaTestCase"]
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from drf_spectacular.drainage import GENERATOR_STATS
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from iamdt_api.scheme import LazyExamples
+from iamdt_api.schema import current_version, generate_schema, write_schema
+
+
+class SchemaTestCase(APITestCase):
+    """미리 생성한 OpenAPI 스키마 테스트"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        overrides = override_settings(
+            API_SCHEMA={"DIR": self.directory, "MAX_AGE": 3600, "KEEP": 1}
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        # 스키마 생성 경고 출력 생략
+        self.enterContext(GENERATOR_STATS.silence())
+
+    def build(self) -> str:
+        call_command("build_schema", stdout=StringIO(), stderr=StringIO())
+        return current_version()
+
+    def test_lazy_examples(self) -> None:
+        """예제는 처음 사용할 때 불러온다"""
+        examples = LazyExamples(("patient", "read")) + LazyExamples(("auth", "add"))
+        self.assertIsInstance(examples, LazyExamples)
+        self.assertTrue(examples)
+        self.assertIsNone(examples._examples)
+
+        self.assertEqual(
+            [example.name for example in examples],
+            ["환자정보1", "로그인 요청1", "로그인 요청2"],
+        )
+        self.assertEqual(len([] + examples + []), 3)
+
+    def test_import(self) -> None:
+        """API 로딩(url/view/serializer)시 예제 모듈을 import 하지 않는다"""
+        code = (
+            "import sys, django; django.setup(); import config.urls; "
+            "print(sorted(m for m in sys.modules if '.scheme.examples' in m))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "config.settings.local"},
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_build(self) -> None:
+        """같은 내용이면 같은 버전"""
+        version = self.build()
+        self.assertRegex(version, r"^[0-9a-f]{12}$")
+        self.assertEqual(self.build(), version)
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()),
+            ["current", f"openapi-{version}.json", f"openapi-{version}.yaml"],
+        )
+
+    def test_bearer_auth(self) -> None:
+        """서명 토큰 인증(Authorization: Bearer)이 security scheme 에 포함된다"""
+        schema = generate_schema()
+        self.assertEqual(
+            schema["components"]["securitySchemes"]["bearerAuth"],
+            {"type": "http", "scheme": "bearer"},
+        )
+        security = schema["paths"]["/api/services"]["get"]["security"]
+        self.assertIn({"bearerAuth": []}, security)
+
+    def test_keep(self) -> None:
+        """현재 버전과 이전 KEEP 개 버전만 보관"""
+        versions = [
+            write_schema({"openapi": "3.0.3", "info": {"title": str(index)}})
+            for index in range(3)
+        ]
+        files = {path.name for path in self.directory.glob("openapi-*.yaml")}
+        self.assertEqual(files, {f"openapi-{v}.yaml" for v in versions[1:]})
+        self.assertEqual(current_version(), versions[-1])
+
+    def test_dynamic(self) -> None:
+        """생성된 스키마가 없으면 요청시 생성"""
+        response = self.client.get("/api/doc/scheme")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+        self.assertIn(b"/api/services", response.content)
+
+    def test_current(self) -> None:
+        """현재 버전은 ETag로 재검증"""
+        version = self.build()
+        response = self.client.get("/api/doc/scheme")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.content,
+            (self.directory / f"openapi-{version}.yaml").read_bytes(),
+        )
+        self.assertEqual(response["ETag"], f'"{version}-yaml"')
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        # 요청시 생성한 스키마와 같다
+        with override_settings(DEBUG=True):
+            dynamic = self.client.get("/api/doc/scheme")
+        self.assertEqual(response.content, dynamic.content)
+
+        response = self.client.get(
+            "/api/doc/scheme", HTTP_IF_NONE_MATCH=f'"{version}-yaml"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get("/api/doc/scheme", {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("/api/services", json.loads(response.content)["paths"])
+        self.assertEqual(response["ETag"], f'"{version}-json"')
+
+    def test_version(self) -> None:
+        """버전 URL은 장기 캐시"""
+        version = self.build()
+        response = self.client.get(f"/api/doc/scheme/{version}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response["Cache-Control"].split(", ")),
+            {"public", "max-age=3600", "immutable"},
+        )
+
+        response = self.client.get("/api/doc/scheme/0123456789ab")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_doc_page(self) -> None:
+        """문서 화면은 현재 버전 URL 사용"""
+        response = self.client.get("/api/doc/swagger")
+        self.assertContains(response, '"/api/doc/scheme"')
+
+        version = self.build()
+        for url in ["/api/doc/swagger", "/api/doc/redoc"]:
+            response = self.client.get(url)
+            self.assertContains(response, f"/api/doc/scheme/{version}")
@@ -0,0 +1,60 @@
+__all__ = ["SearchFilterTestCase"]
+
+
+from django.test import TestCase, override_settings
+
+from iamdt.models import Customer, Patient
+from iamdt_api.filter_set import CustomerFilter, PatientFilter, StaffFilter
+from iamdt_util.search import search_sql
+
+
+class SearchFilterTestCase(TestCase):
+    """검색 인덱스 필터 테스트"""
+
+    fixtures = ["user.json", "customer.json", "patient.json"]
+
+    def _search(self, filterset_class, **params):
+        filterset = filterset_class(data=params)
+        return list(filterset.qs.values_list("id", flat=True))
+
+    def test_customer_name(self) -> None:
+        """고객 이름 부분 검색"""
+        self.assertEqual(self._search(CustomerFilter, name="고객1"), [1])
+        self.assertEqual(len(self._search(CustomerFilter, name="고객")), 4)
+        self.assertEqual(len(self._search(CustomerFilter, name="객")), 4)
+        self.assertEqual(self._search(CustomerFilter, name="없는고객"), [])
+
+    def test_customer_phone(self) -> None:
+        """고객 연락처 부분 검색, 하이픈 무시"""
+        self.assertEqual(self._search(CustomerFilter, phone="5556"), [3])
+        self.assertEqual(self._search(CustomerFilter, phone="010-7777"), [4])
+
+    def test_patient_companion(self) -> None:
+        """보호자 이름으로 환자 검색"""
+        patients = Patient.objects.filter(companion=1).values_list("id", flat=True)
+        self.assertEqual(
+            sorted(self._search(PatientFilter, companion="고객1")), sorted(patients)
+        )
+
+    def test_staff_username(self) -> None:
+        """스태프 아이디 검색"""
+        self.assertEqual(self._search(StaffFilter, username="DOC"), [2])
+
+    def test_index_update(self) -> None:
+        """저장/삭제시 인덱스 갱신"""
+        customer = Customer.objects.create(name="홍길동", phone="01099998888")
+        self.assertEqual(self._search(CustomerFilter, name="길동"), [customer.id])
+
+        customer.name = "임꺽정"
+        customer.save()
+        self.assertEqual(self._search(CustomerFilter, name="길동"), [])
+        self.assertEqual(self._search(CustomerFilter, name="꺽정"), [customer.id])
+
+        customer.delete()
+        self.assertEqual(self._search(CustomerFilter, name="꺽정"), [])
+
+    @override_settings(SEARCH_BACKEND="icontains")
+    def test_icontains_fallback(self) -> None:
+        """icontains 설정시 검색 인덱스를 사용하지 않는다"""
+        self.assertIsNone(search_sql(Customer, "name", "고객"))
+        self.assertEqual(self._search(CustomerFilter, name="고객1"), [1])
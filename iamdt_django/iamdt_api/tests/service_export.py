@@ -0,0 +1,170 @@
+__all__ = ["ServiceExportApiTestCase"]
+
+import csv
+import io
+import json
+import tracemalloc
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+
+from iamdt.models import MedicalService
+from iamdt_api.export import CSV_FIELDS, NDJSONRenderer, iter_services
+from iamdt_util.query_budget import QueryInspector
+
+
+class ServiceExportApiTestCase(APITestCase):
+    """진료내역 내보내기 api 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.url = "/api/exports/services"
+        self.client.login(username="doctor1", password="1234")
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def ndjson(self, **params) -> list:
+        _, content = self.export(**params)
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_url(self) -> None:
+        """url 예상대로 생성되었는가"""
+        self.assertURLEqual(self.url, reverse("api:export:services"))
+
+    def test_no_auth(self) -> None:
+        """인증 없이 요청하면 JSON 오류"""
+        response = APIClient().get(self.url, {"format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_ndjson(self) -> None:
+        """진료내역 검색 응답의 details 와 같은 행"""
+        response, content = self.export()
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="services.ndjson"'
+        )
+
+        rows = [json.loads(line) for line in content.splitlines()]
+        listed = self.client.get("/api/services", {"page_size": 100}).data["results"]
+        details = sorted(
+            (detail for register in listed for detail in register["details"]),
+            key=lambda detail: detail["id"],
+        )
+        self.assertEqual(len(rows), MedicalService.objects.count())
+        self.assertEqual(rows, json.loads(json.dumps(details)))
+
+    def test_csv(self) -> None:
+        """CSV 형식(담당자는 ; 로 연결)"""
+        response, content = self.export(format="csv")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertTrue(content.startswith("\ufeff"))
+
+        reader = csv.DictReader(io.StringIO(content.lstrip("\ufeff")))
+        self.assertEqual(reader.fieldnames, CSV_FIELDS)
+        rows = {int(row["id"]): row for row in reader}
+        self.assertEqual(len(rows), MedicalService.objects.count())
+        for service in MedicalService.objects.prefetch_related("staff"):
+            staff = sorted(service.staff.all(), key=lambda user: user.id)
+            row = rows[service.id]
+            self.assertEqual(row["stage_display"], service.get_stage_display())
+            self.assertEqual(row["staff"], ";".join(str(user.id) for user in staff))
+            self.assertEqual(
+                row["staff_username"], ";".join(user.username for user in staff)
+            )
+
+        # Accept 헤더로 선택
+        response = self.client.get(self.url, HTTP_ACCEPT="text/csv")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+
+    def test_filter(self) -> None:
+        """진료내역 검색 조건과 환자/기간/단계 조건"""
+        service = MedicalService.objects.get(id=1)
+        patient = service.patient
+
+        rows = self.ndjson(patient=patient.name)
+        self.assertEqual(
+            {row["id"] for row in rows},
+            set(
+                MedicalService.objects.filter(
+                    patient__name__icontains=patient.name
+                ).values_list("id", flat=True)
+            ),
+        )
+
+        rows = self.ndjson(patient_id=patient.id, stage=service.stage)
+        self.assertEqual(
+            [row["id"] for row in rows],
+            list(
+                MedicalService.objects.filter(patient=patient, stage=service.stage)
+                .order_by("id")
+                .values_list("id", flat=True)
+            ),
+        )
+
+        created = service.created_at.date()
+        self.assertIn(service.id, {row["id"] for row in self.ndjson(date_from=created)})
+        self.assertEqual(self.ndjson(date_to="2000-01-01"), [])
+
+    def test_invalid(self) -> None:
+        """잘못된 검색 조건, 지원하지 않는 형식은 JSON 오류"""
+        response = self.client.get(self.url, {"stage": "none", "format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("stage", response.json())
+
+        response = self.client.get(self.url, {"format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_queries(self) -> None:
+        """결과 크기, chunk 크기와 관계없이 진료내역/담당자 쿼리 2회"""
+        for params in [{}, {"patient_id": 1}]:
+            with override_settings(SERVICE_EXPORT={"CHUNK_SIZE": 2}):
+                response = self.client.get(self.url, params)
+                with QueryInspector() as inspector:
+                    b"".join(response.streaming_content)
+            self.assertEqual(inspector.count, 2)
+
+    def test_memory(self) -> None:
+        """내보내는 동안 최대 할당 메모리는 결과 크기에 비례하지 않는다"""
+        call_command(
+            "gen_clinic_data",
+            "--customers=150",
+            "--visits=3",
+            "--staff=8",
+            "--seed=1",
+            stdout=StringIO(),
+        )
+        ids = list(MedicalService.objects.order_by("id").values_list("id", flat=True))
+        self.assertGreater(len(ids), 1000)
+
+        def peak(queryset) -> int:
+            tracemalloc.start()
+            try:
+                for _ in NDJSONRenderer().stream(iter_services(queryset, 100), 50):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small = peak(MedicalService.objects.filter(id__lte=ids[199]))
+        large = peak(MedicalService.objects.all())
+        self.assertLess(large, small * 2)
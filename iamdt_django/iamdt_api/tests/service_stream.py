@@ -0,0 +1,173 @@
+__all__ = ["ServiceStreamTestCase"]
+
+import asyncio
+import json
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from iamdt.models import MedicalService
+from iamdt_api.authentication import issue_tokens
+from iamdt_api.stream import STREAM_PATH, ServiceStreamApp, broker
+
+
+class ServiceStreamTestCase(TestCase):
+    """진료내역 SSE 테스트"""
+
+    fixtures = [
+        "user.json",
+        "customer.json",
+        "patient.json",
+        "medical_register.json",
+        "medical_service.json",
+        "medical_staff.json",
+    ]
+
+    def setUp(self) -> None:
+        self.app = ServiceStreamApp(None)
+        self.client.login(username="doctor1", password="1234")
+
+    def open_stream(self, query="", action=None, login=True, headers=()) -> list:
+        """스트림에 연결해 action 실행 후 연결을 끊고 받은 메시지를 반환
+
+        동기 action은 테스트 스레드(같은 DB 연결)에서, 코루틴은 이벤트 루프에서 실행된다.
+        """
+        cookie = self.client.cookies.get(settings.SESSION_COOKIE_NAME)
+        headers = list(headers)
+        if login and cookie:
+            headers.append((b"cookie", f"{cookie.key}={cookie.value}".encode()))
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": STREAM_PATH,
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+
+        async def run():
+            inbox, messages = asyncio.Queue(), []
+
+            async def send(message):
+                messages.append(message)
+
+            task = asyncio.ensure_future(self.app(scope, inbox.get, send))
+            while not broker.has_subscribers and not task.done():
+                await asyncio.sleep(0.001)
+            if asyncio.iscoroutinefunction(action):
+                await action()
+            elif action is not None:
+                await sync_to_async(action)()
+            await asyncio.sleep(0.05)  # call_soon_threadsafe 로 전달된 이벤트 처리
+            await inbox.put({"type": "http.disconnect"})
+            await task
+            return messages
+
+        return async_to_sync(run)()
+
+    def parse_events(self, messages) -> list:
+        body = b"".join(m.get("body", b"") for m in messages[1:]).decode()
+        events = []
+        for block in body.split("\n\n"):
+            lines = dict(
+                line.split(": ", 1) for line in block.splitlines() if ": " in line
+            )
+            if "event" in lines:
+                events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream(self) -> None:
+        """커밋된 상태/담당자 변경 전달"""
+
+        def action():
+            with self.captureOnCommitCallbacks(execute=True):
+                service = MedicalService.objects.get(id=6)
+                service.status = "complete"
+                service.save()
+            with self.captureOnCommitCallbacks(execute=True):
+                MedicalService.objects.get(id=6).staff.add(4)
+
+        messages = self.open_stream(action=action)
+        self.assertEqual(messages[0]["status"], 200)
+        self.assertIn(
+            (b"content-type", b"text/event-stream; charset=utf-8"),
+            messages[0]["headers"],
+        )
+
+        events = [data for _, data in self.parse_events(messages)]
+        self.assertEqual([e["id"] for e in events], [6, 6])
+        self.assertEqual(events[0]["status"], "complete")
+        self.assertIn(4, events[1]["staff"])
+        self.assertLess(events[0]["seq"], events[1]["seq"])
+        self.assertFalse(broker.has_subscribers)
+
+    def test_filter(self) -> None:
+        """진료단계/담당자 필터. 담당 제외도 해당 스태프에 전달"""
+
+        def action():
+            with self.captureOnCommitCallbacks(execute=True):
+                MedicalService.objects.get(id=6).staff.add(4)
+            with self.captureOnCommitCallbacks(execute=True):
+                MedicalService.objects.get(id=6).staff.remove(4)
+
+        events = self.parse_events(self.open_stream("stage=discharge", action))
+        self.assertEqual(events, [])
+
+        events = self.parse_events(
+            self.open_stream("staff=4&stage=examination", action)
+        )
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1][1]["removed_staff"], [4])
+        self.assertNotIn(4, events[1][1]["staff"])
+
+    def test_bulk(self) -> None:
+        """일괄 등록도 발행"""
+
+        def action():
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(
+                    "/api/services/bulk",
+                    data={
+                        "items": [{"patient": 2, "stage": "examination", "staff": [3]}]
+                    },
+                    content_type="application/json",
+                )
+
+        events = self.parse_events(self.open_stream("staff=3", action))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0][1]["stage"], "examination")
+
+    @override_settings(SERVICE_STREAM={"QUEUE_SIZE": 1})
+    def test_overflow(self) -> None:
+        """대기 이벤트가 넘치면 reset 후 종료"""
+        event = {"stage": "register", "staff": [], "removed_staff": []}
+
+        async def action():
+            # 이벤트 루프에서 발행하면 전달 전에 모두 큐에 쌓인다
+            for _ in range(3):
+                broker.publish(event)
+
+        events = self.parse_events(self.open_stream(action=action))
+        self.assertEqual([name for name, _ in events], ["service", "reset"])
+
+    def test_fail(self) -> None:
+        """인증/쿼리 오류"""
+        messages = self.open_stream(login=False)
+        self.assertEqual(messages[0]["status"], 403)
+
+        messages = self.open_stream("stage=unknown")
+        self.assertEqual(messages[0]["status"], 400)
+
+        messages = self.open_stream("staff=abc")
+        self.assertEqual(messages[0]["status"], 400)
+
+    def test_token(self) -> None:
+        """서명 토큰 인증"""
+        user = MedicalService.objects.get(id=6).creator
+        header = f"Bearer {issue_tokens(user)['access']}".encode()
+
+        messages = self.open_stream(login=False, headers=[(b"authorization", header)])
+        self.assertEqual(messages[0]["status"], 200)
+
+        messages = self.open_stream(headers=[(b"authorization", header + b"x")])
+        self.assertEqual(messages[0]["status"], 403)
@@ -0,0 +1,119 @@
+__all__ = ["SessionCacheTestCase"]
+
+import importlib
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from iamdt_util.auth import user_cache_stats
+from iamdt_util.cache import LRUFileBasedCache
+from iamdt_util.session import SessionStore, session_stats
+
+
+class SessionCacheTestCase(APITestCase):
+    """캐시 세션/유저 캐시 테스트"""
+
+    fixtures = ["user.json"]
+
+    # 세션/유저 조회 쿼리
+    auth_tables = ("django_session", "iamdt_user")
+
+    def setUp(self) -> None:
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+        self.client.login(username="doctor1", password="1234")
+
+    def auth_queries(self, queries) -> list:
+        return [q for q in queries if any(t in q["sql"] for t in self.auth_tables)]
+
+    def test_hit(self) -> None:
+        """로그인된 요청은 세션/유저 조회 쿼리가 없다"""
+        self.client.get("/api/changes")  # 유저 캐시 채움
+        sessions, users = session_stats(), user_cache_stats()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/changes")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.auth_queries(queries), [])
+        self.assertEqual(session_stats()["hit"], sessions["hit"] + 1)
+        self.assertEqual(user_cache_stats()["hit"], users["hit"] + 1)
+
+    def test_write_through(self) -> None:
+        """세션은 DB에도 저장되어 캐시가 비어도 유지된다"""
+        session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+        self.assertTrue(Session.objects.filter(session_key=session_key).exists())
+
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+        sessions = session_stats()
+        response = self.client.get("/api/changes")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(session_stats()["miss"], sessions["miss"] + 1)
+
+    def test_user_changed(self) -> None:
+        """유저가 수정되면 다시 조회한다"""
+        self.client.get("/api/changes")
+
+        user = get_user_model().objects.get(username="doctor1")
+        user.is_staff = False
+        user.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/changes")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(self.auth_queries(queries))
+
+    def test_logout(self) -> None:
+        """로그아웃시 캐시에서도 삭제"""
+        self.client.get("/api/auth/logout")
+        response = self.client.get("/api/changes")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_shared(self) -> None:
+        """다른 worker(캐시 객체)에서 지운 유저 수정 시각, 세션이 반영된다"""
+        with tempfile.TemporaryDirectory() as location:
+            sessions = {
+                "BACKEND": "iamdt_util.cache.LRUFileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(
+                CACHES={**settings.CACHES, "sessions": sessions},
+                SESSION_CACHE_ALIAS="sessions",
+            ):
+                other = LRUFileBasedCache(location, {})
+
+                # 다른 worker 에서 로그아웃
+                self.client.login(username="doctor1", password="1234")
+                self.assertEqual(self.client.get("/api/changes").status_code, 200)
+                session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+                cache_key = SessionStore(session_key).cache_key
+                self.assertIsNotNone(other.get(cache_key))
+                Session.objects.filter(session_key=session_key).delete()
+                other.delete(cache_key)
+                response = self.client.get("/api/changes")
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+                # 다른 worker 에서 유저 수정(이 프로세스의 유저 캐시는 그대로)
+                self.client.login(username="doctor1", password="1234")
+                self.assertEqual(self.client.get("/api/changes").status_code, 200)
+                user = get_user_model().objects.get(username="doctor1")
+                get_user_model().objects.filter(pk=user.pk).update(
+                    is_staff=False, updated_at=timezone.now()
+                )
+                other.delete(f"auth:user:{user.pk}:updated_at")
+                response = self.client.get("/api/changes")
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_production_settings(self) -> None:
+        """운영 설정의 세션 캐시는 API 캐시와 같은 디렉토리의 파일 캐시"""
+        production = importlib.import_module("config.settings.production")
+        sessions = production.CACHES[production.SESSION_CACHE_ALIAS]
+        self.assertEqual(sessions["BACKEND"], "iamdt_util.cache.LRUFileBasedCache")
+        self.assertEqual(sessions["LOCATION"].parent, production.CACHE_DIR)
@@ -2,10 +2,16 @@ __all__ = ["StaffApiTestCase"]
 
 
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase, APIClient
 
+from iamdt.models import MedicalService
+from iamdt_api.views.staff import StaffList, StaffSchedule
+
 
 class StaffApiTestCase(APITestCase):
     """로그인 기능 테스트"""
@@ -20,6 +26,9 @@ class StaffApiTestCase(APITestCase):
     ]
 
     def setUp(self) -> None:
+        # 응답 캐시는 테스트 DB 롤백과 무관하게 남아있다
+        caches["api"].clear()
+
         self.staff = get_user_model().objects.get(id=2)
 
         self.login_url = reverse("api:auth:login")
@@ -123,3 +132,122 @@ class StaffApiTestCase(APITestCase):
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_schedule(self) -> None:
+        """담당 진료접수 리스트(스태프 담당 진료접수 인덱스 조회)"""
+        url = reverse("api:staff:schedules", kwargs={"id": 2})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["results"]], [2, 1])
+
+        # 진료내역 담당자 → 진료내역 서브쿼리 없이 JOIN 조회
+        selects = [q["sql"] for q in queries if "iamdt_staffassignment" in q["sql"]]
+        self.assertTrue(selects)
+        self.assertFalse([sql for sql in selects if "IN (SELECT" in sql])
+
+        # 퇴원 전 진료접수만
+        response = self.client.get(url, data={"active_only": "true"})
+        self.assertEqual([row["id"] for row in response.data["results"]], [2])
+
+        # 커서 모드(COUNT 없음)
+        params = {"page_size": 1, "pagination": "cursor"}
+        etag = self.client.get(url, data=params)["ETag"]
+        response = self.client.get(url, data=params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_conditional_page_default(self) -> None:
+        """conditional_fields 에 관계 경로가 있으면 현재 페이지로 집계"""
+        self.assertTrue(StaffSchedule().use_conditional_page())
+        self.assertFalse(StaffList().use_conditional_page())
+
+    def test_staff_schedule_conditional(self) -> None:
+        """담당 진료접수 리스트 조건부 GET(현재 페이지 진료접수만 집계)"""
+        url = reverse("api:staff:schedules", kwargs={"id": 2})
+        etag = self.client.get(url, data={"page_size": 1})["ETag"]  # 진료접수 2
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, data={"page_size": 1}, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        aggregates = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith("SELECT") and "MAX(" in q["sql"]
+        ]
+        self.assertEqual(len(aggregates), 1)
+        self.assertNotIn("iamdt_staffassignment", aggregates[0])
+
+        # 다른 페이지 진료접수의 변경은 이 페이지의 etag 와 무관
+        MedicalService.objects.get(id=1).staff.add(3)
+        response = self.client.get(url, data={"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 페이지 진료접수의 담당자 변경
+        MedicalService.objects.get(id=6).staff.add(4)
+        response = self.client.get(url, data={"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["results"]], [2])
+
+        # 커서 모드(COUNT 없음)
+        params = {"page_size": 1, "pagination": "cursor"}
+        etag = self.client.get(url, data=params)["ETag"]
+        response = self.client.get(url, data=params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_conditional_page_default(self) -> None:
+        """conditional_fields 에 관계 경로가 있으면 현재 페이지로 집계"""
+        self.assertTrue(StaffSchedule().use_conditional_page())
+        self.assertFalse(StaffList().use_conditional_page())
+
+    def test_staff_workload(self) -> None:
+        """스태프별 대기 건수(업무량 집계 조회)"""
+        url = reverse("api:staff:workload")
+        self.assertURLEqual("/api/staffs/workload", url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in queries if "iamdt_medicalstaff" in q["sql"]])
+
+        rows = {row["id"]: row for row in response.data}
+        self.assertEqual(rows[2]["total"], 1)
+        self.assertEqual(rows[2]["stages"]["examination"], 1)
+        self.assertEqual(rows[2]["role_display"], "수의사")
+        self.assertEqual(rows[4]["total"], 0)
+
+        # 다음 단계 등록시 이전 단계(완료) 감소, 새 단계 증가
+        self.client.post(
+            "/api/services",
+            data={"patient": 1, "stage": "diagnosys", "staff": [2, 4]},
+            format="json",
+        )
+        response = self.client.get(url, data={"role": "doctor"})
+        self.assertEqual([row["id"] for row in response.data], [2])
+        self.assertEqual(response.data[0]["stages"]["examination"], 0)
+        self.assertEqual(response.data[0]["stages"]["diagnosys"], 1)
+
+        # 일괄 등록
+        self.client.post(
+            "/api/services/bulk",
+            data={"items": [{"patient": 1, "stage": "counseling", "staff": [3]}]},
+            format="json",
+        )
+        rows = {row["id"]: row for row in self.client.get(url).data}
+        self.assertEqual(rows[3]["stages"]["counseling"], 1)
+        self.assertEqual(rows[3]["total"], 1)
+        self.assertEqual(rows[4]["total"], 0)
+
+    def test_staff_workload_legacy_role(self) -> None:
+        """빈 값이나 선택지에 없는 role 은 값 그대로 표시"""
+        get_user_model().objects.filter(id=3).update(role="")
+        get_user_model().objects.filter(id=4).update(role="vet")
+
+        response = self.client.get(reverse("api:staff:workload"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = {row["id"]: row for row in response.data}
+        self.assertEqual(rows[3]["role_display"], "")
+        self.assertEqual(rows[4]["role_display"], "vet")
+        self.assertEqual(rows[2]["role_display"], "수의사")
@@ -12,6 +12,10 @@ urlpatterns = [
     path("", include("iamdt_api.urls.patient")),
     # 진료내역
     path("", include("iamdt_api.urls.service")),
+    # 변경 피드
+    path("", include("iamdt_api.urls.change")),
+    # 내보내기
+    path("", include("iamdt_api.urls.export")),
     # Documentation: DRF Spectacular
-    path("", include("iamdt_api.urls.doc")),
+    path("doc/", include("iamdt_api.urls.doc")),
 ]
@@ -8,4 +8,5 @@ urlpatterns = [
     # 인증
     path("auth/login", auth.Login.as_view(), name="login"),
     path("auth/logout", auth.Logout.as_view(), name="logout"),
+    path("auth/refresh", auth.TokenRefresh.as_view(), name="refresh"),
 ]
@@ -0,0 +1,9 @@
+from django.urls import path
+
+
+from ..views import change
+
+app_name = "change"
+urlpatterns = [
+    path("changes", change.ChangeFeed.as_view(), name="list"),
+]
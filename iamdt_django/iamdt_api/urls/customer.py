@@ -8,4 +8,5 @@ urlpatterns = [
     # 인증
     path("customers", customer.CustomerList.as_view(), name="list"),
     path("customers/<int:id>", customer.CustomerDetail.as_view(), name="detail"),
+    path("customers/lookup", customer.CustomerLookup.as_view(), name="lookup"),
 ]
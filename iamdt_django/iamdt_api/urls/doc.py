@@ -1,22 +1,16 @@
-from django.urls import path, include
+from django.urls import path
 
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
-)
+
+from ..views import doc
 
 app_name = "doc"
 urlpatterns = [
-    path("doc/scheme", SpectacularAPIView.as_view(), name="scheme"),
-    path(
-        "doc/swagger",
-        SpectacularSwaggerView.as_view(url_name="api:doc:scheme"),
-        name="swagger",
-    ),
+    path("scheme", doc.SchemeView.as_view(), name="scheme"),
     path(
-        "doc/redoc",
-        SpectacularRedocView.as_view(url_name="api:doc:scheme"),
-        name="redoc",
+        "scheme/<str:version>",
+        doc.SchemeVersionView.as_view(),
+        name="scheme_version",
     ),
+    path("swagger", doc.SwaggerView.as_view(), name="swagger"),
+    path("redoc", doc.RedocView.as_view(), name="redoc"),
 ]
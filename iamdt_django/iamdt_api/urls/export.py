@@ -0,0 +1,9 @@
+from django.urls import path
+
+
+from ..views import export
+
+app_name = "export"
+urlpatterns = [
+    path("exports/services", export.MedicalServiceExport.as_view(), name="services"),
+]
@@ -7,5 +7,6 @@ app_name = "service"
 urlpatterns = [
     # 인증
     path("services", service.MedicalServiceList.as_view(), name="list"),
+    path("services/bulk", service.MedicalServiceBulk.as_view(), name="bulk"),
     path("services/<int:id>", service.MedicalServiceDetail.as_view(), name="detail"),
 ]
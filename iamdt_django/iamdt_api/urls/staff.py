@@ -7,6 +7,7 @@ app_name = "staff"
 urlpatterns = [
     # 인증
     path("staffs", staff.StaffList.as_view(), name="list"),
+    path("staffs/workload", staff.StaffWorkloadSummary.as_view(), name="workload"),
     path("staffs/<int:id>", staff.StaffDetail.as_view(), name="detail"),
     path("staffs/<int:id>/schedules", staff.StaffSchedule.as_view(), name="schedules"),
 ]
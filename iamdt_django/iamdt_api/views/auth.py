@@ -2,22 +2,28 @@
 API 인증 관련 View
 """
 
-__all__ = ["Login", "Logout"]
+__all__ = ["Login", "Logout", "TokenRefresh"]
 
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import authenticate, get_user_model, login, logout
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from rest_framework import generics, permissions, exceptions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from iamdt_api import authentication
 from iamdt_api.scheme.auth import AUTH_API_EXAMPLES
-from iamdt_api.serializers import LoginSerializer, StaffInfoSerializer
+from iamdt_api.serializers import (
+    LoginSerializer,
+    StaffInfoSerializer,
+    TokenRefreshSerializer,
+)
 
 
 class Login(APIView):
     """로그인 API"""
 
     permission_classes = [permissions.AllowAny]
+    query_budget = 6
 
     @extend_schema(
         tags=["인증"],
@@ -30,10 +36,16 @@ class Login(APIView):
         examples=AUTH_API_EXAMPLES["add"],
     )
     def post(self, request, *args, **kwargs):
-        """테스트용이어서 Session을 이용하도록 처리함"""
+        """세션 로그인과 함께 서명 토큰(token)을 발급한다
+
+        token.access 를 Authorization: Bearer 헤더로 보내면 세션 조회 없이 인증된다.
+        """
         self._authenticate(request, self._validate(request))
         return Response(
-            StaffInfoSerializer(request.user).data,
+            {
+                **StaffInfoSerializer(request.user).data,
+                "token": authentication.issue_tokens(request.user),
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -60,6 +72,8 @@ class Login(APIView):
 class Logout(generics.GenericAPIView):
     """로그아웃 API"""
 
+    query_budget = 4
+
     @extend_schema(
         tags=["인증"],
         summary="로그아웃 요청 처리",
@@ -70,6 +84,50 @@ class Logout(generics.GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         """로그아웃 처리를 한다.
+        토큰 인증이면 같이 발급된 토큰을 폐기한다.
         정상처리시 응답 본문은 없다."""
+        if isinstance(request.auth, dict):
+            authentication.revoke(request.auth)
         logout(request)
         return Response(None, status=status.HTTP_204_NO_CONTENT)
+
+
+class TokenRefresh(APIView):
+    """토큰 갱신 API
+
+    refresh 토큰을 폐기하고 새 토큰 쌍을 발급한다.
+    유저를 다시 조회하므로 역할 변경/비활성화가 반영된다.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []  # 세션 조회 없음
+    query_budget = 1
+
+    @extend_schema(
+        tags=["인증"],
+        summary="토큰 갱신",
+        request=TokenRefreshSerializer,
+        responses={
+            200: OpenApiResponse(description="새 토큰 쌍"),
+            400: OpenApiResponse(description="Bad request"),
+            403: OpenApiResponse(description="잘못된/만료된/폐기된 토큰"),
+        },
+        examples=AUTH_API_EXAMPLES["refresh"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = TokenRefreshSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        payload = authentication.verify_token(
+            serializer.validated_data["refresh"], authentication.REFRESH
+        )
+
+        user = (
+            get_user_model()
+            .objects.filter(pk=payload["user_id"], is_active=True)
+            .first()
+        )
+        if user is None:
+            raise exceptions.AuthenticationFailed("사용할 수 없는 계정입니다.")
+
+        authentication.revoke(payload)
+        return Response(authentication.issue_tokens(user), status=status.HTTP_200_OK)
@@ -0,0 +1,168 @@
+"""
+ChangeLog Api View
+"""
+
+__all__ = ["ChangeFeed"]
+
+from django.apps import apps
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework import generics, permissions, exceptions
+from rest_framework.response import Response
+
+from iamdt.models import ChangeLog, MedicalStaff
+from iamdt_api.scheme.change import CHANGE_API_QUERY, CHANGE_API_EXAMPLES
+
+
+class ChangeFeed(generics.GenericAPIView):
+    """변경 피드 View
+
+    since 토큰 이후의 등록/수정/삭제를 순서대로 반환한다.
+    한번에 limit 개의 이력을 읽고 같은 객체의 이력은 마지막 것 하나로 합친다.
+    행 데이터는 모델별 쿼리 1회로 현재 값을 읽는다.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    query_budget = 5
+    queryset = ChangeLog.objects.order_by("id")
+    pagination_class = None
+
+    default_limit = 500
+    max_limit = 1000
+
+    feed_fields = {
+        "customer": ["id", "name", "phone", "created_at", "updated_at"],
+        "patient": ["id", "companion", "name", "created_at", "updated_at"],
+        "medicalregister": [
+            "id",
+            "patient",
+            "last_service",
+            "last_stage",
+            "last_status",
+            "created_at",
+            "updated_at",
+        ],
+        "medicalservice": [
+            "id",
+            "patient",
+            "register",
+            "stage",
+            "status",
+            "creator",
+            "created_at",
+            "updated_at",
+        ],
+    }
+
+    @extend_schema(
+        tags=["변경피드"],
+        summary="변경 피드",
+        description="since 이후 고객/환자/진료접수/진료내역의 변경을 조회합니다. has_more가 true면 응답의 token으로 다시 요청하세요.",
+        responses={
+            200: OpenApiResponse(description="변경 리스트"),
+            400: OpenApiResponse(description="잘못된 요청"),
+            403: OpenApiResponse(description="인증 없는 액세스"),
+        },
+        parameters=CHANGE_API_QUERY,
+        examples=CHANGE_API_EXAMPLES,
+    )
+    def get(self, request, *args, **kwargs):
+        since = self._get_int(request, "since", None, minimum=0)
+        limit = self._get_int(request, "limit", self.default_limit, minimum=1)
+        limit = min(limit, self.max_limit)
+
+        if since is None:
+            # 전체 조회 전에 받아둘 현재 토큰
+            last = self.get_queryset().values_list("id", flat=True).last()
+            return Response({"token": last or 0, "has_more": False, "changes": []})
+
+        entries = list(
+            self.get_queryset()
+            .filter(id__gt=since)
+            .values("id", "model", "object_id", "action")[: limit + 1]
+        )
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        return Response(
+            {
+                "token": entries[-1]["id"] if entries else since,
+                "has_more": has_more,
+                "changes": self._changes(entries),
+            }
+        )
+
+    @staticmethod
+    def _get_int(request, name, default, minimum):
+        value = request.query_params.get(name)
+        if value in (None, ""):
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            value = None
+        if value is None or value < minimum:
+            raise exceptions.ValidationError(
+                {name: f"{minimum} 이상의 정수를 입력하세요."}
+            )
+        return value
+
+    def _changes(self, entries) -> list:
+        """객체별 마지막 이력 + 현재 행 데이터"""
+        latest, created = {}, set()
+        for entry in entries:
+            key = (entry["model"], entry["object_id"])
+            if entry["action"] == ChangeLog.Action.CREATE:
+                created.add(key)
+            latest.pop(key, None)  # 마지막 이력 순서로
+            latest[key] = entry
+
+        rows = self._get_rows(
+            [key for key, e in latest.items() if e["action"] != ChangeLog.Action.DELETE]
+        )
+
+        changes = []
+        for key, entry in latest.items():
+            if entry["action"] == ChangeLog.Action.DELETE:
+                action, data = ChangeLog.Action.DELETE, None
+            elif key in rows:
+                action = ChangeLog.Action.CREATE if key in created else entry["action"]
+                data = rows[key]
+            else:
+                continue  # 이후에 삭제됨(다음 이력의 tombstone으로 전달)
+
+            changes.append(
+                {
+                    "seq": entry["id"],
+                    "model": key[0],
+                    "id": key[1],
+                    "action": action,
+                    "data": data,
+                }
+            )
+        return changes
+
+    def _get_rows(self, keys) -> dict:
+        """(모델명, id): 행 데이터"""
+        ids = {}
+        for model, object_id in keys:
+            ids.setdefault(model, []).append(object_id)
+
+        rows = {}
+        for model, object_ids in ids.items():
+            queryset = apps.get_model("iamdt", model).objects.filter(pk__in=object_ids)
+            for row in queryset.values(*self.feed_fields[model]):
+                rows[(model, row["id"])] = row
+
+        # 진료내역은 담당자 id 리스트 포함
+        services = {
+            object_id: row
+            for (model, object_id), row in rows.items()
+            if model == "medicalservice"
+        }
+        if services:
+            for row in services.values():
+                row["staff"] = []
+            staff = MedicalStaff.objects.filter(detail__in=services).order_by("id")
+            for detail, staff_id in staff.values_list("detail", "staff"):
+                services[detail]["staff"].append(staff_id)
+        return rows
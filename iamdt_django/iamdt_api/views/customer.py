@@ -2,41 +2,51 @@
 Customer Api View
 """
 
-__all__ = ["CustomerList", "CustomerDetail"]
+__all__ = ["CustomerList", "CustomerDetail", "CustomerLookup"]
 
-from django.db.models import ProtectedError
+from django.db.models import Prefetch, ProtectedError
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from rest_framework import generics, permissions, exceptions
+from rest_framework.response import Response
 
 from django_filters import rest_framework as filters
 
-from iamdt.models import Customer
+from iamdt.models import Customer, Patient
+from iamdt_api.cache import CachedListMixin
+from iamdt_api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
 from iamdt_api.filter_set import CustomerFilter
 from iamdt_api.scheme import PAGINATION_QUERY_SCHEME
 from iamdt_api.scheme.customer import (
     CUSTOMER_API_URL_PARAM,
     CUSTOMER_API_EXAMPLES,
     CUSTOMER_API_SEARCH_QUERY,
+    CUSTOMER_API_LOOKUP_QUERY,
+    CUSTOMER_LOOKUP_API_EXAMPLES,
 )
-from iamdt_api.serializers import CustomerInfoSerializer
+from iamdt_api.serializers import CustomerInfoSerializer, CustomerLookupSerializer
+from iamdt_util.validators import normalize_phone
 
 
-class CustomerList(generics.ListCreateAPIView):
+class CustomerList(CachedListMixin, ConditionalListMixin, generics.ListCreateAPIView):
     """Staff 검색/등록 View"""
 
     permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    query_budget = {"GET": 5, "POST": 7}
     queryset = Customer.objects.order_by("-id")
     serializer_class = CustomerInfoSerializer
 
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = CustomerFilter
 
+    cache_models = ["iamdt.customer"]
+
     @extend_schema(
         tags=["고객정보"],
         summary="고객정보 검색",
         description="고객정보 리스트를 검색합니다",
         responses={
             200: CustomerInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
         parameters=PAGINATION_QUERY_SCHEME + CUSTOMER_API_SEARCH_QUERY,
@@ -61,9 +71,10 @@ class CustomerList(generics.ListCreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class CustomerDetail(generics.RetrieveUpdateDestroyAPIView):
+class CustomerDetail(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
 
     permission_classes = [permissions.IsAdminUser]
+    query_budget = {"GET": 3, "PUT": 7, "PATCH": 7, "DELETE": 3}
     queryset = Customer.objects.all()
     serializer_class = CustomerInfoSerializer
 
@@ -76,6 +87,7 @@ class CustomerDetail(generics.RetrieveUpdateDestroyAPIView):
         description="지정된 고객의 정보를 조회합니다",
         responses={
             200: CustomerInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
             404: OpenApiResponse(description="찾을 수 없는 데이터"),
         },
@@ -138,3 +150,52 @@ class CustomerDetail(generics.RetrieveUpdateDestroyAPIView):
             )
         except Exception as e:
             raise e
+
+
+class CustomerLookup(generics.GenericAPIView):
+    """발신번호로 고객/환자 조회 View
+
+    phone_digits 인덱스로 고객을 찾고 환자는 prefetch 쿼리 1회로 가져온다.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    query_budget = 2
+    queryset = Customer.objects.all()
+    serializer_class = CustomerLookupSerializer
+    pagination_class = None
+
+    customer_fields = ["id", "name", "phone", "created_at", "updated_at"]
+    patient_fields = ["id", "name", "created_at", "updated_at"]
+
+    @extend_schema(
+        tags=["고객정보"],
+        summary="발신번호 조회",
+        description="연락처가 일치하는 고객과 고객의 환자 리스트를 조회합니다",
+        responses={
+            200: CustomerLookupSerializer(many=True),
+            400: OpenApiResponse(description="잘못된 요청"),
+            403: OpenApiResponse(description="인증 없는 액세스"),
+        },
+        parameters=CUSTOMER_API_LOOKUP_QUERY,
+        examples=CUSTOMER_LOOKUP_API_EXAMPLES,
+    )
+    def get(self, request, *args, **kwargs):
+        phone = normalize_phone(request.query_params.get("phone"))
+        if not phone:
+            raise exceptions.ValidationError({"phone": "연락처를 입력하세요."})
+
+        serializer = self.get_serializer(self._lookup(phone), many=True)
+        return Response(serializer.data)
+
+    def _lookup(self, phone: str) -> list:
+        """고객(phone_digits 인덱스)과 고객의 환자(Prefetch)를 조회"""
+        patients = Patient.objects.order_by("id").only(
+            "companion", *self.patient_fields
+        )
+        return list(
+            self.get_queryset()
+            .filter(phone_digits=phone)
+            .order_by("id")
+            .only(*self.customer_fields)
+            .prefetch_related(Prefetch("patients", queryset=patients))
+        )
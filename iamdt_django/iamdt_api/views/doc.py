@@ -0,0 +1,93 @@
+"""
+API 문서 View
+
+build_schema 로 미리 생성한 스키마 파일을 응답한다.(iamdt_api.schema)
+생성된 스키마가 없거나 DEBUG 이면 drf-spectacular 뷰와 같이 요청시 생성한다.
+"""
+
+__all__ = ["SchemeView", "SchemeVersionView", "SwaggerView", "RedocView"]
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import (
+    SpectacularAPIView,
+    SpectacularRedocView,
+    SpectacularSwaggerView,
+)
+
+from iamdt_api.schema import current_version, get_options, read_schema
+
+
+def prebuilt_version():
+    """응답에 사용할 미리 생성한 스키마 버전(DEBUG 에서는 사용하지 않음)"""
+    return None if settings.DEBUG else current_version()
+
+
+class PrebuiltSchemeMixin:
+    """미리 생성한 스키마 파일 응답
+
+    yaml(기본)/json 은 spectacular 뷰와 같이 Accept 혹은 ?format= 으로 선택한다.
+    """
+
+    def schema_response(self, request, version):
+        fmt = request.accepted_renderer.format
+        content = read_schema(version, fmt)
+        if content is None:
+            return None
+
+        etag = f'"{version}-{fmt}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type=request.accepted_media_type)
+        response["ETag"] = etag
+        response["Vary"] = "Accept"
+        return response
+
+
+class SchemeView(PrebuiltSchemeMixin, SpectacularAPIView):
+    """현재 버전 스키마. 배포마다 바뀌므로 ETag로 재검증한다"""
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        version = prebuilt_version()
+        response = version and self.schema_response(request, version)
+        if not response:
+            return super().get(request, *args, **kwargs)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class SchemeVersionView(PrebuiltSchemeMixin, SpectacularAPIView):
+    """버전별 스키마. 내용이 바뀌지 않으므로 장기 캐시"""
+
+    @extend_schema(exclude=True)
+    def get(self, request, version, *args, **kwargs):
+        response = self.schema_response(request, version)
+        if response is None:
+            raise Http404
+        patch_cache_control(
+            response, public=True, max_age=get_options()["MAX_AGE"], immutable=True
+        )
+        return response
+
+
+class PrebuiltSchemeUrlMixin:
+    """문서 화면에서 현재 버전 스키마 URL 사용"""
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        version = prebuilt_version()
+        if version:
+            self.url = reverse("api:doc:scheme_version", kwargs={"version": version})
+        return super().get(request, *args, **kwargs)
+
+
+class SwaggerView(PrebuiltSchemeUrlMixin, SpectacularSwaggerView):
+    url_name = "api:doc:scheme"
+
+
+class RedocView(PrebuiltSchemeUrlMixin, SpectacularRedocView):
+    url_name = "api:doc:scheme"
@@ -0,0 +1,67 @@
+"""
+진료내역 내보내기 Api View
+"""
+
+__all__ = ["MedicalServiceExport"]
+
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework import generics, permissions
+from rest_framework.renderers import JSONRenderer
+
+from django_filters import rest_framework as filters
+
+from iamdt.models import MedicalService
+from iamdt_api.export import CSVRenderer, NDJSONRenderer, iter_services
+from iamdt_api.filter_set import MedicalServiceExportFilter
+from iamdt_api.scheme.medical_service import SERVICE_API_EXPORT_QUERY
+
+
+class MedicalServiceExport(generics.GenericAPIView):
+    """진료내역 내보내기 View
+
+    검색 조건의 진료내역 전체를 NDJSON(기본) 혹은 CSV로 스트리밍한다.(iamdt_api.export)
+    형식은 Accept 헤더 혹은 ?format=ndjson|csv 로 선택한다.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    # 세션/유저 조회만 포함된다.
+    # 진료내역/담당자 쿼리(2회)는 응답을 보내는 동안 실행되어 포함되지 않는다.
+    query_budget = 2
+    queryset = MedicalService.objects.all()
+    pagination_class = None
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    filter_backends = (filters.DjangoFilterBackend,)
+    filterset_class = MedicalServiceExportFilter
+
+    @extend_schema(
+        tags=["진료내역"],
+        summary="진료내역 내보내기",
+        description="검색 조건의 진료내역 전체를 NDJSON(한 줄에 진료내역 하나) 혹은 CSV로 내려받습니다. 페이지를 나누지 않습니다.",
+        responses={
+            200: OpenApiResponse(description="진료내역(NDJSON/CSV)"),
+            400: OpenApiResponse(description="잘못된 검색 조건"),
+            403: OpenApiResponse(description="인증 없는 액세스"),
+            404: OpenApiResponse(description="지원하지 않는 형식"),
+        },
+        parameters=SERVICE_API_EXPORT_QUERY,
+    )
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+
+        response = StreamingHttpResponse(
+            renderer.stream(iter_services(queryset)),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="services.{renderer.format}"'
+        )
+        return response
+
+    def handle_exception(self, exc):
+        """오류(인증, 검색 조건, 형식)는 JSON 으로 응답"""
+        self.request.accepted_renderer = JSONRenderer()
+        self.request.accepted_media_type = JSONRenderer.media_type
+        return super().handle_exception(exc)
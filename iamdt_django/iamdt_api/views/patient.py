@@ -11,6 +11,8 @@ from rest_framework import generics, permissions, exceptions
 from django_filters import rest_framework as filters
 
 from iamdt.models import Patient, MedicalRegister
+from iamdt_api.cache import CachedListMixin
+from iamdt_api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
 from iamdt_api.filter_set import PatientFilter
 from iamdt_api.scheme import PAGINATION_QUERY_SCHEME
 from iamdt_api.scheme.medical_service import SERVICE_API_EXAMPLES
@@ -24,22 +26,26 @@ from iamdt_api.serializers.medical_register import MedicalRegisterInfoSerializer
 from iamdt_api.serializers.medical_service import MedicalServiceInfoSerializer
 
 
-class PatientList(generics.ListCreateAPIView):
+class PatientList(CachedListMixin, ConditionalListMixin, generics.ListCreateAPIView):
     """환자 검색/등록 View"""
 
     permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    query_budget = {"GET": 4, "POST": 8}
     queryset = Patient.objects.order_by("-id")
     serializer_class = PatientInfoSerializer
 
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = PatientFilter
 
+    cache_models = ["iamdt.patient", "iamdt.customer"]  # 보호자 이름 검색
+
     @extend_schema(
         tags=["환자"],
         summary="환자 검색",
         description="환자 리스트를 검색합니다",
         responses={
             200: PatientInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
         parameters=PAGINATION_QUERY_SCHEME + PATIENT_API_SEARCH_QUERY,
@@ -64,9 +70,10 @@ class PatientList(generics.ListCreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class PatientDetail(generics.RetrieveUpdateDestroyAPIView):
+class PatientDetail(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
 
     permission_classes = [permissions.IsAdminUser]
+    query_budget = {"GET": 3, "PUT": 8, "PATCH": 8, "DELETE": 4}
     queryset = Patient.objects.all()
     serializer_class = PatientInfoSerializer
 
@@ -79,6 +86,7 @@ class PatientDetail(generics.RetrieveUpdateDestroyAPIView):
         description="환자의 정보를 조회합니다",
         responses={
             200: PatientInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
             404: OpenApiResponse(description="찾을 수 없는 데이터"),
         },
@@ -143,19 +151,29 @@ class PatientDetail(generics.RetrieveUpdateDestroyAPIView):
             raise e
 
 
-class PatientService(generics.ListAPIView):
+class PatientService(ConditionalListMixin, generics.ListAPIView):
     """ "환자 진료내역 검색"""
 
     permission_classes = [permissions.IsAdminUser]
+    query_budget = 6
     queryset = MedicalRegister.objects.order_by("-id")
     serializer_class = MedicalRegisterInfoSerializer
 
+    # 응답에 환자/보호자/진료내역/담당자 정보가 포함된다.(관계 경로이므로 현재 페이지만 집계)
+    conditional_fields = [
+        "updated_at",
+        "patient__updated_at",
+        "patient__companion__updated_at",
+        "details__updated_at",
+        "details__staff__updated_at",
+    ]
+
     def get_queryset(self):
         return (
             super()
             .get_queryset()
             .filter(patient=self.kwargs["id"])
-            .prefetch_related("details", "details__staff")
+            .select_related("patient__companion")
         )
 
     @extend_schema(
@@ -164,6 +182,7 @@ class PatientService(generics.ListAPIView):
         description="환자의 진료내역 리스트를 검색합니다",
         responses={
             200: MedicalServiceInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
         parameters=PAGINATION_QUERY_SCHEME,
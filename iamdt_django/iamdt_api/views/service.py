@@ -2,17 +2,19 @@
 MedicalService Api View
 """
 
-__all__ = ["MedicalServiceList", "MedicalServiceDetail"]
+__all__ = ["MedicalServiceList", "MedicalServiceDetail", "MedicalServiceBulk"]
 
 from django.db.models import ProtectedError
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
-from rest_framework import generics, permissions, exceptions
+from rest_framework import generics, permissions, exceptions, status
+from rest_framework.response import Response
 
 from django_filters import rest_framework as filters
 
 from iamdt.models import MedicalService, MedicalRegister
 from iamdt.models.choices import MedicalStageStatus
+from iamdt_api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
 from iamdt_api.filter_set import MedicalRegisterFilter
 from iamdt_api.scheme import PAGINATION_QUERY_SCHEME
 from iamdt_api.scheme.medical_service import (
@@ -24,23 +26,37 @@ from iamdt_api.serializers.medical_register import MedicalRegisterInfoSerializer
 from iamdt_api.serializers.medical_service import (
     MedicalServiceInfoSerializer,
     MedicalServiceAddSerializer,
+    MedicalServiceBulkSerializer,
 )
 
 
-class MedicalServiceList(generics.ListCreateAPIView):
+class MedicalServiceList(ConditionalListMixin, generics.ListCreateAPIView):
     """진료내역 검색/등록 View"""
 
     permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    # 요청당 최대 쿼리 수(iamdt_util.query_budget), 세션 유저 조회 1회 포함
+    # GET: 페이지 COUNT, 접수(환자/보호자 JOIN), 조건부 GET 집계(페이지 접수), 진료내역, 담당자
+    # POST: 파생 데이터(collect_service_changes)는 저장 횟수와 관계없이 한번에 갱신
+    query_budget = {"GET": 6, "POST": 21}
     queryset = MedicalRegister.objects.order_by("-id")
     serializer_class = MedicalRegisterInfoSerializer
 
+    # 응답에 환자/보호자/진료내역/담당자 정보가 포함된다.(관계 경로이므로 현재 페이지만 집계)
+    conditional_fields = [
+        "updated_at",
+        "patient__updated_at",
+        "patient__companion__updated_at",
+        "details__updated_at",
+        "details__staff__updated_at",
+    ]
+
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = MedicalRegisterFilter
 
     def get_queryset(self):
         if self.request.method == "POST":
             return MedicalService.objects.order_by("-id")
-        return super().get_queryset().prefetch_related("details", "details__staff")
+        return super().get_queryset().select_related("patient__companion")
 
     def get_serializer_class(self):
         """요청 메소드에 따라 시리얼라이저 반환"""
@@ -54,6 +70,7 @@ class MedicalServiceList(generics.ListCreateAPIView):
         description="진료내역 리스트를 검색합니다",
         responses={
             200: MedicalServiceInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
         parameters=PAGINATION_QUERY_SCHEME + SERVICE_API_SEARCH_QUERY,
@@ -71,6 +88,7 @@ class MedicalServiceList(generics.ListCreateAPIView):
             200: MedicalServiceInfoSerializer,
             400: OpenApiResponse(description="잘못된 요청"),
             403: OpenApiResponse(description="인증 없는 액세스"),
+            409: OpenApiResponse(description="같은 환자의 진료내역이 먼저 등록됨"),
         },
         examples=SERVICE_API_EXAMPLES["add"],
     )
@@ -82,12 +100,19 @@ class MedicalServiceList(generics.ListCreateAPIView):
         obj = serializer.save(creator=self.request.user)  # 등록자는 현재 유저
 
 
-class MedicalServiceDetail(generics.RetrieveUpdateDestroyAPIView):
+class MedicalServiceDetail(
+    ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
 
     permission_classes = [permissions.IsAdminUser]
+    # PUT/PATCH: 담당자 교체(제외 + 등록)가 가장 많다
+    query_budget = {"GET": 4, "PUT": 22, "PATCH": 22}
     queryset = MedicalService.objects.all()
     serializer_class = MedicalServiceInfoSerializer
 
+    # 응답에 담당자 정보가 포함된다
+    conditional_fields = ["updated_at", "staff__updated_at"]
+
     lookup_url_kwarg = "id"
 
     @extend_schema(
@@ -97,6 +122,7 @@ class MedicalServiceDetail(generics.RetrieveUpdateDestroyAPIView):
         description="진료내역의 정보를 조회합니다",
         responses={
             200: MedicalServiceInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
             404: OpenApiResponse(description="찾을 수 없는 데이터"),
         },
@@ -159,11 +185,44 @@ class MedicalServiceDetail(generics.RetrieveUpdateDestroyAPIView):
         완료된 내역이나 외래키 참조가 있다면 삭제 할 수 없다.
         """
         if instance.status == MedicalStageStatus.COMPLETE:
-            raise exceptions.NotAcceptable(detail="완료 처리된 내역", code="protected_data")
+            raise exceptions.NotAcceptable(
+                detail="완료 처리된 내역", code="protected_data"
+            )
 
         try:
             super().perform_destroy(instance)
         except ProtectedError as e:
-            raise exceptions.NotAcceptable(detail="보호된 데이터", code="protected_data")
+            raise exceptions.NotAcceptable(
+                detail="보호된 데이터", code="protected_data"
+            )
         except Exception as e:
             raise e
+
+
+class MedicalServiceBulk(generics.GenericAPIView):
+    """진료내역 일괄 등록 View"""
+
+    permission_classes = [permissions.IsAdminUser]
+    query_budget = 19
+    serializer_class = MedicalServiceBulkSerializer
+
+    @extend_schema(
+        tags=["진료내역"],
+        summary="진료내역 일괄 등록",
+        description="여러 환자의 진료내역을 한번에 등록합니다. 항목별 결과를 요청 순서대로 반환합니다.",
+        request=MedicalServiceBulkSerializer,
+        responses={
+            201: OpenApiResponse(description="1건 이상 등록"),
+            400: OpenApiResponse(description="잘못된 요청 또는 등록된 항목 없음"),
+            403: OpenApiResponse(description="인증 없는 액세스"),
+        },
+        examples=SERVICE_API_EXAMPLES["bulk"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save(creator=request.user)  # 등록자는 현재 유저
+
+        if result["created"]:
+            return Response(result, status=status.HTTP_201_CREATED)
+        return Response(result, status=status.HTTP_400_BAD_REQUEST)
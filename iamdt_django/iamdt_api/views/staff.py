@@ -2,21 +2,30 @@
 Staff API View
 """
 
-__all__ = ["StaffList", "StaffDetail"]
+__all__ = ["StaffList", "StaffDetail", "StaffWorkloadSummary"]
 
 from django.contrib.auth import get_user_model
 from django.db.models import ProtectedError
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from rest_framework import generics, permissions, exceptions
+from rest_framework.response import Response
 
 from django_filters import rest_framework as filters
 
-from iamdt.models import MedicalRegister, MedicalService
+from iamdt.models import MedicalRegister, StaffWorkload
+from iamdt.models.choices import MedicalStage
 from iamdt_api import permissions as perms
+from iamdt_api.cache import CachedListMixin
+from iamdt_api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
 from iamdt_api.filter_set import StaffFilter
 from iamdt_api.scheme import PAGINATION_QUERY_SCHEME
 from iamdt_api.scheme.medical_service import SERVICE_API_EXAMPLES
-from iamdt_api.scheme.staff import STAFF_API_EXAMPLES, STAFF_API_SEARCH_QUERY
+from iamdt_api.scheme.staff import (
+    STAFF_API_EXAMPLES,
+    STAFF_API_SCHEDULE_QUERY,
+    STAFF_API_SEARCH_QUERY,
+    STAFF_API_WORKLOAD_EXAMPLES,
+)
 from iamdt_api.serializers import StaffInfoSerializer, StaffAddSerializer
 from iamdt_api.serializers.medical_register import MedicalRegisterInfoSerializer
 from iamdt_api.serializers.medical_service import MedicalServiceInfoSerializer
@@ -24,15 +33,18 @@ from iamdt_api.serializers.medical_service import MedicalServiceInfoSerializer
 user_model = get_user_model()
 
 
-class StaffList(generics.ListCreateAPIView):
+class StaffList(CachedListMixin, ConditionalListMixin, generics.ListCreateAPIView):
     """Staff 검색/등록 View"""
 
     permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    query_budget = {"GET": 5, "POST": 9}
     queryset = user_model.objects.filter(is_staff=True).order_by("-id")
 
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = StaffFilter
 
+    cache_models = ["iamdt.user"]
+
     def get_serializer_class(self):
         """post일때는 등록용 시리얼라이저를 반환하도록 한다"""
         if self.request.method == "POST":
@@ -45,6 +57,7 @@ class StaffList(generics.ListCreateAPIView):
         description="병원의 스태프 리스트를 검색합니다",
         responses={
             200: StaffInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
         parameters=PAGINATION_QUERY_SCHEME + STAFF_API_SEARCH_QUERY,
@@ -73,9 +86,10 @@ class StaffList(generics.ListCreateAPIView):
         serializer.save(is_staff=True)
 
 
-class StaffDetail(generics.RetrieveUpdateDestroyAPIView):
+class StaffDetail(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
 
     permission_classes = [permissions.IsAdminUser, perms.ObjOwnerOrReadOnly]
+    query_budget = {"GET": 3, "PUT": 6, "PATCH": 6}
     queryset = get_user_model().objects.filter(is_staff=True)
     serializer_class = StaffInfoSerializer
 
@@ -90,6 +104,7 @@ class StaffDetail(generics.RetrieveUpdateDestroyAPIView):
         description="지정된 스태프의 정보를 조회합니다",
         responses={
             200: StaffInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
             404: OpenApiResponse(description="찾을 수 없는 데이터"),
         },
@@ -151,26 +166,39 @@ class StaffDetail(generics.RetrieveUpdateDestroyAPIView):
             raise e
 
 
-class StaffSchedule(generics.ListAPIView):
+class StaffSchedule(ConditionalListMixin, generics.ListAPIView):
     """스태프가 담당중인 의료내역"""
 
     permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    query_budget = 6
     queryset = MedicalRegister.objects.order_by("-id")
     serializer_class = MedicalRegisterInfoSerializer
 
+    # 응답에 환자/보호자/진료내역/담당자 정보가 포함된다.
+    # 관계 경로가 있으므로 스태프의 전체 진료접수 대신 현재 페이지 진료접수로만 JOIN 해서 집계한다
+    conditional_fields = [
+        "updated_at",
+        "patient__updated_at",
+        "patient__companion__updated_at",
+        "details__updated_at",
+        "details__staff__updated_at",
+    ]
+
     def get_queryset(self):
-        """url kwargs에 따라 진료접수 쿼리셋 반환"""
+        """url kwargs에 따라 진료접수 쿼리셋 반환
+
+        스태프 담당 진료접수(StaffAssignment)의 (staff, register) 인덱스 범위 조회
+        """
+        assignment = {"staff_assignments__staff": self.kwargs["id"]}
+        if self.request.query_params.get("active_only") in ("true", "1"):
+            assignment["staff_assignments__active"] = True  # 퇴원 전 진료접수만
+
         queryset = (
             super()
             .get_queryset()
-            .filter(
-                id__in=MedicalService.objects.filter(
-                    id__in=MedicalService.staff.through.objects.filter(
-                        staff=self.kwargs["id"]
-                    ).values("detail")
-                ).values("register")
-            )
-        ).prefetch_related("details", "details__staff")
+            .filter(**assignment)
+            .select_related("patient__companion")
+        )
         return queryset
 
     @extend_schema(
@@ -179,10 +207,61 @@ class StaffSchedule(generics.ListAPIView):
         description="지정된 스태프의 진료내역 리스트를 검색합니다",
         responses={
             200: MedicalServiceInfoSerializer,
+            304: OpenApiResponse(description="변경 없음(조건부 GET)"),
             403: OpenApiResponse(description="인증 없는 액세스"),
         },
-        parameters=PAGINATION_QUERY_SCHEME,
+        parameters=PAGINATION_QUERY_SCHEME + STAFF_API_SCHEDULE_QUERY,
         examples=SERVICE_API_EXAMPLES["read"],
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
+
+
+class StaffWorkloadSummary(generics.GenericAPIView):
+    """스태프별 대기 진료내역 건수
+
+    담당 배정 전 확인용. 스태프 업무량(StaffWorkload) 집계를 읽는다.(스태프/집계 쿼리 2회)
+    """
+
+    permission_classes = [permissions.IsAdminUser]  # is_staff 만
+    query_budget = 3
+    queryset = user_model.objects.filter(is_staff=True, is_active=True).order_by("id")
+    pagination_class = None
+
+    filter_backends = (filters.DjangoFilterBackend,)
+    filterset_class = StaffFilter
+
+    staff_fields = ["id", "username", "first_name", "last_name", "role"]
+    # 빈 값이나 선택지에 없는(이전) role 은 값 그대로 표시
+    role_labels = dict(user_model.UserType.choices)
+
+    @extend_schema(
+        tags=["병원 스태프"],
+        summary="스태프 업무량",
+        description="스태프별 대기중인 담당 진료내역 건수를 진료단계별로 조회합니다",
+        responses={
+            200: OpenApiResponse(description="스태프별 대기 건수 리스트"),
+            403: OpenApiResponse(description="인증 없는 액세스"),
+        },
+        parameters=STAFF_API_SEARCH_QUERY,
+        examples=STAFF_API_WORKLOAD_EXAMPLES,
+    )
+    def get(self, request, *args, **kwargs):
+        staff = self.filter_queryset(self.get_queryset()).values(*self.staff_fields)
+        rows = {
+            row["id"]: {
+                **row,
+                "role_display": self.role_labels.get(row["role"], row["role"]),
+                "total": 0,
+                "stages": dict.fromkeys(MedicalStage.values, 0),
+            }
+            for row in staff
+        }
+
+        workloads = StaffWorkload.objects.filter(staff__in=list(rows), waiting__gt=0)
+        for staff_id, stage, waiting in workloads.values_list(
+            "staff", "stage", "waiting"
+        ):
+            rows[staff_id]["stages"][stage] = waiting
+            rows[staff_id]["total"] += waiting
+        return Response(list(rows.values()))
@@ -0,0 +1,104 @@
+"""
+유저 캐시 인증 백엔드 모듈
+
+    AUTHENTICATION_BACKENDS = ["iamdt_util.auth.CachedModelBackend"]
+
+세션 인증은 요청마다 세션의 유저 id로 유저를 조회한다.
+CachedModelBackend는 조회한 유저를 프로세스별 LRU에 (id, updated_at) 키로 보관한다.
+
+- 유저의 현재 updated_at은 세션과 같은 캐시(SESSION_CACHE_ALIAS)에 보관한다.
+- 유저 저장/삭제시 forget_user로 updated_at을 지운다.(커밋 후 한번 더)
+  다음 조회는 DB에서 읽고 새 (id, updated_at) 키로 보관된다. 이전 키는 LRU로 밀려난다.
+- 로그인시 last_login만 저장하는 경우는 지우지 않는다.
+- 캐시된 유저는 요청마다 복사해서 반환한다.(요청에서 속성을 바꿔도 다른 요청에 영향 없음)
+
+    AUTH_USER_CACHE_SIZE = 1000  # LRU 최대 유저 수
+"""
+
+__all__ = ["CachedModelBackend", "forget_user", "user_cache_stats"]
+
+import copy
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+from django.db import transaction
+
+from iamdt_util.cache import HitCounter
+
+_counter = HitCounter("user")
+
+
+def _stamp_cache():
+    return caches[settings.SESSION_CACHE_ALIAS]
+
+
+def _stamp_key(user_id) -> str:
+    return f"auth:user:{user_id}:updated_at"
+
+
+class UserLRU:
+    """(id, updated_at): 유저 객체"""
+
+    def __init__(self):
+        self._users = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            user = self._users.get(key)
+            if user is not None:
+                self._users.move_to_end(key)
+            return user
+
+    def put(self, key, user) -> None:
+        size = getattr(settings, "AUTH_USER_CACHE_SIZE", 1000)
+        with self._lock:
+            self._users[key] = user
+            self._users.move_to_end(key)
+            while len(self._users) > size:
+                self._users.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+users = UserLRU()
+
+
+class CachedModelBackend(ModelBackend):
+    """세션 유저 조회를 프로세스별 LRU로 대신하는 ModelBackend"""
+
+    def get_user(self, user_id):
+        updated_at = _stamp_cache().get(_stamp_key(user_id))
+        user = users.get((user_id, updated_at)) if updated_at else None
+        _counter.count(user is not None)
+
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            _stamp_cache().set(_stamp_key(user_id), user.updated_at, timeout=None)
+            users.put((user_id, user.updated_at), user)
+        elif not self.user_can_authenticate(user):
+            return None
+        return copy.copy(user)
+
+
+def _forget(user_id) -> None:
+    _stamp_cache().delete(_stamp_key(user_id))
+
+
+def forget_user(user_id) -> None:
+    """유저 저장/삭제시 호출. 다음 조회는 DB에서 읽는다"""
+    _forget(user_id)
+    # 커밋 전에 다른 요청이 이전 값을 다시 보관할 수 있으므로 한번 더
+    transaction.on_commit(lambda: _forget(user_id))
+
+
+def user_cache_stats() -> dict:
+    """현재 프로세스의 유저 캐시 hit/miss 카운터"""
+    return _counter.stats()
@@ -0,0 +1,76 @@
+"""
+캐시 백엔드 모듈
+
+Django FileBasedCache는 MAX_ENTRIES 초과시 임의의 파일을 삭제한다.
+LRUFileBasedCache는 조회시 파일 수정시각을 갱신하고 오래 사용되지 않은 파일부터 삭제한다.
+(LocMemCache는 기본으로 LRU 삭제)
+
+HitCounter는 프로세스별 캐시 hit/miss 카운터이다.
+지표(iamdt_util.metrics)의 cache_requests_total{cache=이름} 에도 기록된다.
+"""
+
+__all__ = ["LRUFileBasedCache", "HitCounter"]
+
+import os
+import threading
+from collections import Counter
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+from iamdt_util import metrics
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """LRU 삭제 파일 캐시"""
+
+    def get(self, key, default=None, version=None):
+        fname = self._key_to_file(key, version)
+        value = super().get(key, self, version)
+        if value is self:
+            return default
+
+        # 최근 사용 시각 기록
+        try:
+            os.utime(fname)
+        except OSError:
+            pass
+        return value
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            return self.clear()
+
+        def last_used(fname):
+            try:
+                return os.path.getmtime(fname)
+            except OSError:
+                return 0
+
+        filelist.sort(key=last_used)
+        for fname in filelist[: num_entries // self._cull_frequency]:
+            self._delete(fname)
+
+
+class HitCounter:
+    """프로세스별 hit/miss 카운터"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, hit: bool) -> None:
+        result = "hit" if hit else "miss"
+        with self._lock:
+            self._counts[result] += 1
+        metrics.CACHE_REQUESTS.inc(cache=self.name, result=result)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hit, miss = self._counts["hit"], self._counts["miss"]
+        total = hit + miss
+        return {"hit": hit, "miss": miss, "hit_ratio": hit / total if total else 0.0}
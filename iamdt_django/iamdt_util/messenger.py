@@ -0,0 +1,257 @@
+"""
+직원 메신저 알림 발송 모듈
+
+User.MessengerType 별로 발송기(Dispatcher)를 등록해두고
+여러 직원에게 보내는 알림을 채널별 동시 발송 수 제한 안에서 동시에 발송한다.
+
+발송기는 settings.MESSENGER_DISPATCHERS 에 설정된 채널만 생성된다.
+
+    MESSENGER_DISPATCHERS = {
+        "telegram": {"TOKEN": "...", "CONCURRENCY": 4},
+        "line": {"TOKEN": "...", "ENDPOINT": "https://api.line.me/v2/bot/message/push"},
+    }
+
+HTTP 요청은 채널별 requests.Session(커넥션 풀)으로 보내며
+asyncio 이벤트 루프에서 스레드풀로 실행해 동시에 처리한다.
+"""
+
+__all__ = [
+    "MessengerDispatcher",
+    "register_dispatcher",
+    "get_dispatchers",
+    "reset_dispatchers",
+    "send_messages",
+]
+
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# messenger 값: 발송기 클래스
+DISPATCHER_CLASSES = {}
+
+# messenger 값: 발송기 객체(settings 기준으로 생성, 커넥션 풀 재사용)
+_dispatchers = None
+
+
+def register_dispatcher(cls):
+    """발송기 클래스 등록 decorator"""
+    DISPATCHER_CLASSES[cls.messenger] = cls
+    return cls
+
+
+class MessengerDispatcher:
+    """메신저 발송기 기본 클래스
+
+    채널별로 endpoint, 요청 형식(build_request)만 구현한다.
+    동시 발송 수는 concurrency, 실패시 retries 만큼 backoff * 2^n 초 대기 후 재시도한다.
+    """
+
+    messenger = None
+    endpoint = None
+
+    concurrency = 4
+    retries = 3
+    backoff = 0.5
+    timeout = 5
+
+    # 재시도 할 응답 코드
+    retry_status = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        token: str = "",
+        endpoint: str = None,
+        concurrency: int = None,
+        retries: int = None,
+        backoff: float = None,
+        timeout: float = None,
+    ):
+        self.token = token
+        self.endpoint = endpoint or self.endpoint
+        self.concurrency = concurrency or self.concurrency
+        self.retries = self.retries if retries is None else retries
+        self.backoff = self.backoff if backoff is None else backoff
+        self.timeout = timeout or self.timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.concurrency, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def build_request(self, messenger_id: str, text: str) -> dict:
+        """requests.Session.request 에 넘길 인자를 반환한다"""
+        raise NotImplementedError
+
+    def post(self, messenger_id: str, text: str) -> requests.Response:
+        """동기 발송(스레드풀에서 실행)"""
+        kwargs = self.build_request(messenger_id, text)
+        kwargs.setdefault("method", "POST")
+        kwargs.setdefault("url", self.endpoint)
+        return self.session.request(timeout=self.timeout, **kwargs)
+
+    async def send(self, messenger_id: str, text: str, semaphore, executor) -> bool:
+        """비동기 발송. 성공 여부를 반환한다"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.retries + 1):
+            async with semaphore:
+                try:
+                    response = await loop.run_in_executor(
+                        executor, self.post, messenger_id, text
+                    )
+                except requests.RequestException as e:
+                    error = str(e)
+                else:
+                    if response.ok:
+                        return True
+                    if response.status_code not in self.retry_status:
+                        error = f"status {response.status_code}"
+                        break
+                    error = f"status {response.status_code}"
+
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2**attempt)
+
+        logger.warning(f"{self.messenger} 메신저 발송 실패({messenger_id}): {error}")
+        return False
+
+
+@register_dispatcher
+class TelegramDispatcher(MessengerDispatcher):
+    """텔레그램 Bot API"""
+
+    messenger = "telegram"
+    endpoint = "https://api.telegram.org"
+
+    def build_request(self, messenger_id, text):
+        return {
+            "url": f"{self.endpoint}/bot{self.token}/sendMessage",
+            "json": {"chat_id": messenger_id, "text": text},
+        }
+
+
+@register_dispatcher
+class LineDispatcher(MessengerDispatcher):
+    """라인 Messaging API(push)"""
+
+    messenger = "line"
+    endpoint = "https://api.line.me/v2/bot/message/push"
+
+    def build_request(self, messenger_id, text):
+        return {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "json": {"to": messenger_id, "messages": [{"type": "text", "text": text}]},
+        }
+
+
+@register_dispatcher
+class FacebookDispatcher(MessengerDispatcher):
+    """페이스북 Messenger Send API"""
+
+    messenger = "facebook"
+    endpoint = "https://graph.facebook.com/v14.0/me/messages"
+
+    def build_request(self, messenger_id, text):
+        return {
+            "params": {"access_token": self.token},
+            "json": {"recipient": {"id": messenger_id}, "message": {"text": text}},
+        }
+
+
+@register_dispatcher
+class KakaoTalkDispatcher(MessengerDispatcher):
+    """카카오톡 친구에게 메시지 보내기 API"""
+
+    messenger = "kakaotalk"
+    endpoint = "https://kapi.kakao.com/v1/api/talk/friends/message/default/send"
+
+    def build_request(self, messenger_id, text):
+        template = {"object_type": "text", "text": text, "link": {}}
+        return {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "data": {
+                "receiver_uuids": json.dumps([messenger_id]),
+                "template_object": json.dumps(template, ensure_ascii=False),
+            },
+        }
+
+
+def get_dispatchers() -> dict:
+    """settings.MESSENGER_DISPATCHERS 에 설정된 채널의 발송기를 반환한다"""
+    global _dispatchers
+    if _dispatchers is None:
+        _dispatchers = {}
+        config = getattr(settings, "MESSENGER_DISPATCHERS", {})
+        for messenger, options in config.items():
+            cls = DISPATCHER_CLASSES[messenger]
+            _dispatchers[messenger] = cls(
+                token=options.get("TOKEN", ""),
+                endpoint=options.get("ENDPOINT"),
+                concurrency=options.get("CONCURRENCY"),
+                retries=options.get("RETRIES"),
+                backoff=options.get("BACKOFF"),
+                timeout=options.get("TIMEOUT"),
+            )
+    return _dispatchers
+
+
+def reset_dispatchers() -> None:
+    """설정 변경시(테스트 등) 발송기를 다시 생성하도록 초기화"""
+    global _dispatchers
+    _dispatchers = None
+
+
+async def _send_all(jobs) -> list:
+    semaphores = {
+        dispatcher.messenger: asyncio.Semaphore(dispatcher.concurrency)
+        for dispatcher, _, _ in jobs
+    }
+    workers = sum(
+        dispatcher.concurrency
+        for dispatcher in {dispatcher for dispatcher, _, _ in jobs}
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return await asyncio.gather(
+            *[
+                dispatcher.send(
+                    messenger_id, text, semaphores[dispatcher.messenger], executor
+                )
+                for dispatcher, messenger_id, text in jobs
+            ]
+        )
+
+
+def send_messages(messages) -> list:
+    """(staff, text) 리스트를 각 직원의 메신저로 동시에 발송한다
+
+    발송기가 설정되지 않은 메신저거나 메신저 아이디가 없으면 발송하지 않는다(None).
+
+    Returns
+    -------
+    list
+        메시지별 발송 결과(True/False/None)
+    """
+    dispatchers = get_dispatchers()
+
+    results = [None] * len(messages)
+    jobs, indexes = [], []
+    for index, (staff, text) in enumerate(messages):
+        dispatcher = dispatchers.get(staff.messenger)
+        if dispatcher is None or not staff.messenger_id:
+            continue
+        jobs.append((dispatcher, staff.messenger_id, text))
+        indexes.append(index)
+
+    if jobs:
+        for index, result in zip(indexes, asyncio.run(_send_all(jobs))):
+            results[index] = result
+    return results
@@ -0,0 +1,376 @@
+"""
+요청 지표(Prometheus text exposition) 모듈
+
+silk는 요청 기록을 DB에 남기고 최근 SILKY_MAX_RECORDED_REQUESTS 건만 보관한다.
+MetricsMiddleware는 뷰별(url name, 예: api:service:list) 응답시간/DB 쿼리 수, 시간/응답 크기
+히스토그램과 상태코드별 요청 수를 프로세스별 mmap 파일에 누적하고
+/metrics 에서 모든 프로세스 파일을 합쳐 Prometheus 형식으로 출력한다.
+
+    METRICS = {
+        "DIR": None,  # 프로세스별 파일 디렉토리. None이면 프로세스 메모리(단일 프로세스)
+        "ALLOWED_IPS": ["127.0.0.1", "::1"],  # /metrics 조회 허용 IP(스태프 유저는 항상 허용)
+        "TOKEN": None,  # 지정하면 Authorization: Bearer <TOKEN> 요청 허용(수집기용)
+    }
+
+- 리버스 프록시를 거친 요청(X-Forwarded-* 등 헤더)은 REMOTE_ADDR 가 프록시 주소이므로
+  ALLOWED_IPS 를 적용하지 않는다. 프록시 뒤에서는 TOKEN 혹은 스태프 유저로 조회한다.
+
+- 프로세스마다 자기 파일(metrics_<pid>.db)에만 쓰므로 프로세스 간 잠금이 없다.
+  스레드 간에는 같은 파일의 값을 읽고 더하는 동안만 프로세스 내 lock을 잡는다.(MmapValues.inc)
+- gunicorn 등 여러 worker로 실행시 DIR을 지정하고 서버 시작 전에 디렉토리를 비운다.
+  종료된 worker 파일은 누적값(counter)이 줄지 않도록 남겨둔다.
+- 캐시 hit/miss(iamdt_util.cache.HitCounter)도 같은 저장소에 기록된다.
+"""
+
+__all__ = [
+    "Counter",
+    "Histogram",
+    "MetricsMiddleware",
+    "metrics_allowed",
+    "metrics_view",
+    "render_metrics",
+]
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+DEFAULTS = {"DIR": None, "ALLOWED_IPS": ["127.0.0.1", "::1"], "TOKEN": None}
+
+# 리버스 프록시가 추가하는 헤더. 하나라도 있으면 REMOTE_ADDR 는 클라이언트 주소가 아니다
+FORWARDED_HEADERS = (
+    "HTTP_FORWARDED",
+    "HTTP_X_FORWARDED_FOR",
+    "HTTP_X_FORWARDED_PROTO",
+    "HTTP_X_REAL_IP",
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "METRICS", {})}
+
+
+class MmapValues:
+    """키: float64 값 저장소(파일 혹은 익명 mmap)
+
+    [사용 크기 uint32][패딩 4] 이후 [키 길이 uint32][키(8바이트 정렬)][값 float64] 반복.
+    항목을 모두 쓴 뒤 사용 크기를 갱신하므로 다른 프로세스는 완성된 항목만 읽는다.
+    """
+
+    initial_size = 1 << 16
+
+    def __init__(self, path=None):
+        self.path = path
+        self._positions = {}
+        self._lock = threading.Lock()
+        if path is None:
+            self._file = None
+            self._mm = mmap.mmap(-1, self.initial_size)
+        else:
+            self._file = open(path, "a+b")
+            if os.path.getsize(path) < self.initial_size:
+                self._file.truncate(self.initial_size)
+            self._mm = mmap.mmap(self._file.fileno(), os.path.getsize(path))
+
+        self._used = struct.unpack_from("I", self._mm, 0)[0] or 8
+        for key, _, position in _read_entries(self._mm, self._used):
+            self._positions[key] = position
+
+    def inc(self, key: str, amount: float) -> None:
+        # 값 읽기와 쓰기 사이에 다른 스레드가 끼어들면 증가분이 사라지므로(GIL 과 무관) 잠근다.
+        # 잡는 동안 I/O 가 없어 대기는 거의 없고 호출당 비용은 수백 ns 이다.
+        with self._lock:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._add(key)
+            value = struct.unpack_from("d", self._mm, position)[0]
+            struct.pack_into("d", self._mm, position, value + amount)
+
+    def _add(self, key: str) -> int:
+        encoded = key.encode()
+        padded = len(encoded) + (8 - (len(encoded) + 4) % 8) % 8
+        entry = struct.pack(f"I{padded}sd", len(encoded), encoded, 0.0)
+        if self._used + len(entry) > len(self._mm):
+            self._grow(self._used + len(entry))
+
+        self._mm[self._used : self._used + len(entry)] = entry
+        position = self._used + 4 + padded
+        self._used += len(entry)
+        struct.pack_into("I", self._mm, 0, self._used)
+        self._positions[key] = position
+        return position
+
+    def _grow(self, required: int) -> None:
+        size = len(self._mm)
+        while size < required:
+            size *= 2
+        if self._file is None:
+            mm = mmap.mmap(-1, size)
+            mm[: self._used] = self._mm[: self._used]
+        else:
+            self._file.truncate(size)
+            mm = mmap.mmap(self._file.fileno(), size)
+        self._mm.close()
+        self._mm = mm
+
+    def items(self):
+        with self._lock:
+            return [
+                (key, value) for key, value, _ in _read_entries(self._mm, self._used)
+            ]
+
+
+def _read_entries(buffer, used: int):
+    """(키, 값, 값 위치)"""
+    offset = 8
+    while offset < used:
+        length = struct.unpack_from("I", buffer, offset)[0]
+        padded = length + (8 - (length + 4) % 8) % 8
+        key = bytes(buffer[offset + 4 : offset + 4 + length]).decode()
+        position = offset + 4 + padded
+        yield key, struct.unpack_from("d", buffer, position)[0], position
+        offset = position + 8
+
+
+class Store:
+    """현재 프로세스의 저장소(fork 이후에는 새 파일)"""
+
+    def __init__(self):
+        self._values = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self) -> MmapValues:
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    directory = get_options()["DIR"]
+                    path = None
+                    if directory:
+                        Path(directory).mkdir(parents=True, exist_ok=True)
+                        path = os.path.join(directory, f"metrics_{pid}.db")
+                    self._values = MmapValues(path)
+                    self._pid = pid
+        return self._values
+
+    def collect(self) -> dict:
+        """모든 프로세스의 값 합계"""
+        totals = {}
+        directory = get_options()["DIR"]
+        if directory:
+            for path in sorted(Path(directory).glob("metrics_*.db")):
+                with open(path, "rb") as f:
+                    data = f.read()
+                if len(data) < 8:
+                    continue
+                used = struct.unpack_from("I", data, 0)[0]
+                for key, value, _ in _read_entries(data, used):
+                    totals[key] = totals.get(key, 0.0) + value
+        else:
+            for key, value in self.get().items():
+                totals[key] = value
+        return totals
+
+
+store = Store()
+registry = []
+
+
+def _key(name: str, labels: dict) -> str:
+    return json.dumps([name, sorted(labels.items())], ensure_ascii=False)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+class Counter:
+    """누적 카운터"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        registry.append(self)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        store.get().inc(_key(self.name, labels), amount)
+
+    def samples(self, series: dict) -> list:
+        rows = sorted(series.get(self.name, []), key=lambda row: _label_key(row[0]))
+        return [(self.name, labels, value) for labels, value in rows]
+
+
+class Histogram:
+    """히스토그램
+
+    관측값이 속하는 버킷 하나와 합계/횟수만 기록하고 출력시 버킷을 누적한다.
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = [*buckets, float("inf")]
+        registry.append(self)
+
+    def observe(self, value: float, **labels) -> None:
+        values = store.get()
+        le = next(bucket for bucket in self.buckets if value <= bucket)
+        values.inc(_key(f"{self.name}_bucket", {**labels, "le": _float(le)}), 1)
+        values.inc(_key(f"{self.name}_sum", labels), value)
+        values.inc(_key(f"{self.name}_count", labels), 1)
+
+    def samples(self, series: dict) -> list:
+        buckets = {}
+        for labels, value in series.get(f"{self.name}_bucket", []):
+            le = labels.pop("le")
+            buckets.setdefault(_label_key(labels), {})[le] = value
+        sums, counts = (
+            {_label_key(labels): value for labels, value in series.get(name, [])}
+            for name in (f"{self.name}_sum", f"{self.name}_count")
+        )
+
+        samples = []
+        for key in sorted(buckets.keys() | counts.keys()):
+            labels, cumulative = dict(key), 0.0
+            for bucket in self.buckets:
+                cumulative += buckets.get(key, {}).get(_float(bucket), 0.0)
+                bucket_labels = {**labels, "le": _float(bucket)}
+                samples.append((f"{self.name}_bucket", bucket_labels, cumulative))
+            samples.append((f"{self.name}_sum", labels, sums.get(key, 0.0)))
+            samples.append((f"{self.name}_count", labels, counts.get(key, 0.0)))
+        return samples
+
+
+def _float(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def render_metrics() -> str:
+    """모든 프로세스 값을 합쳐 text exposition 형식으로 출력"""
+    series = {}
+    for key, value in store.collect().items():
+        name, labels = json.loads(key)
+        series.setdefault(name, []).append((dict(labels), value))
+
+    lines = []
+    for metric in registry:
+        samples = metric.samples(series)
+        if not samples:
+            continue
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for name, labels, value in samples:
+            label = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(
+                f"{name}{{{label}}} {value!r}" if label else f"{name} {value!r}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+# 요청 지표
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+REQUESTS = Counter("http_requests_total", "뷰/메소드/상태코드별 요청 수")
+LATENCY = Histogram(
+    "http_request_duration_seconds", "뷰별 응답시간(초)", LATENCY_BUCKETS
+)
+QUERIES = Histogram(
+    "http_request_db_queries", "뷰별 요청당 DB 쿼리 수", (0, 1, 2, 5, 10, 20, 50, 100)
+)
+QUERY_TIME = Histogram(
+    "http_request_db_seconds", "뷰별 요청당 DB 쿼리 시간(초)", LATENCY_BUCKETS
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "뷰별 응답 크기(바이트, 스트리밍 응답 제외)",
+    (256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+CACHE_REQUESTS = Counter("cache_requests_total", "캐시별 hit/miss 조회 수")
+
+
+class QueryCounter:
+    """connection.execute_wrapper 로 요청 중 쿼리 수/시간 측정"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """뷰별 요청 지표 기록 미들웨어
+
+    가장 바깥쪽에 두어야 다른 미들웨어의 쿼리(세션 등)와 처리시간이 포함된다.
+    라벨은 url name(namespace:name)이다. url이 없으면 "unresolved".
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name if match else None) or "unresolved"
+        method = request.method
+
+        REQUESTS.inc(view=view, method=method, status=str(response.status_code))
+        LATENCY.observe(duration, view=view, method=method)
+        QUERIES.observe(queries.count, view=view, method=method)
+        QUERY_TIME.observe(queries.seconds, view=view, method=method)
+        if not response.streaming:
+            RESPONSE_SIZE.observe(len(response.content), view=view, method=method)
+        return response
+
+
+def metrics_allowed(request) -> bool:
+    """TOKEN, 프록시를 거치지 않은 ALLOWED_IPS 요청, 스태프 유저"""
+    options = get_options()
+    if options["TOKEN"] and constant_time_compare(
+        request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {options['TOKEN']}"
+    ):
+        return True
+    forwarded = any(header in request.META for header in FORWARDED_HEADERS)
+    if not forwarded and request.META.get("REMOTE_ADDR") in options["ALLOWED_IPS"]:
+        return True
+    return request.user.is_staff
+
+
+def metrics_view(request):
+    """GET /metrics (metrics_allowed)"""
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
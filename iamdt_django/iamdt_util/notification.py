@@ -1,7 +1,9 @@
-__all__ = ["medical_staff_change_signal"]
+__all__ = ["medical_staff_notify"]
 
 import logging
+from collections import defaultdict
 
+from .messenger import send_messages
 
 logger = logging.getLogger(__name__)
 
@@ -11,37 +13,53 @@ def staff_name_role(staff):
     return f"{staff.last_name} {staff.first_name} {staff.get_role_display()}"
 
 
-def medical_staff_noti_message(staffs, service, msg: str):
+def medical_staff_noti_message(staffs, service, msg: str) -> list:
+    """담당자별 알림 메시지 (staff, text) 리스트를 반환한다"""
+    messages = []
     for staff in staffs:
-        logger.info(f"{staff_name_role(staff)} 님 {service}의 담당자에 {msg} 되셨습니다")
+        text = f"{staff_name_role(staff)} 님 {service}의 담당자에 {msg} 되셨습니다"
+        logger.info(text)
+        messages.append((staff, text))
+    return messages
 
 
-message = {
-    "post_add": "등록",
-    "post_remove": "제외",
-}
+def medical_staff_notify(notifications) -> set:
+    """outbox(StaffNotification)에 쌓인 담당자 변경 알림을 발송한다
 
+    같은 진료내역/담당자/구분의 중복 알림은 한번만 발송하며
+    진료내역+구분 단위로 묶어서 메시지를 만들고
+    배치 전체를 직원별 메신저로 동시에 발송한다(iamdt_util.messenger).
+    notifications는 staff, service(str 출력용 관계 포함)가 select_related 되어 있어야 한다.
 
-def medical_staff_change_signal(info):
-    """진료내역 담당자가 바뀔경우 시그널에서 호출할 함수
-
-    m2m_changed signal
-    {
-        'signal': <django.db.models.signals.ModelSignal object at 0x0000022E82BC2E00>,
-        'action': 'pre_add', 'post_add', 'pre_remove', 'post_remove'
-        'instance': <MedicalService: 고객1(01011112222) / 환자1 의 진료2번 / 진단(대기)>,
-        'reverse': False,
-        'model': <class 'iamdt.models.user.User'>,
-        'pk_set': {5},
-        'using': 'default'
-    }
+    Returns
+    -------
+    set
+        발송에 실패한 알림 id(중복 알림 포함)
     """
-    # 추가/삭제 된 유저
-    staffs = info["model"].objects.filter(id__in=list(info["pk_set"]))
+    groups = {}
+    duplicates = defaultdict(list)  # (진료내역, 담당자, 구분): 알림 id
+    for notification in notifications:
+        key = (notification.service_id, notification.staff_id, notification.action)
+        duplicates[key].append(notification.id)
+        if len(duplicates[key]) > 1:
+            continue
+
+        group_key = (notification.service_id, notification.action)
+        if group_key not in groups:
+            groups[group_key] = (notification, [])
+        groups[group_key][1].append(notification.staff)
 
-    # 등록/제외 구분
-    msg = message.get(info["action"], None)
+    messages, keys = [], []
+    for notification, staffs in groups.values():
+        messages += medical_staff_noti_message(
+            staffs, notification.service, notification.get_action_display()
+        )
+        keys += [
+            (notification.service_id, staff.id, notification.action) for staff in staffs
+        ]
 
-    # pre 일때는 빼고 post_** 일때 호출
-    if msg:
-        medical_staff_noti_message(staffs, info["instance"], msg)
+    failed = set()
+    for key, result in zip(keys, send_messages(messages)):
+        if result is False:
+            failed.update(duplicates[key])
+    return failed
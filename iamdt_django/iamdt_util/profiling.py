@@ -0,0 +1,225 @@
+"""
+샘플링 프로파일러 미들웨어
+
+silk(cProfile)처럼 모든 함수 호출을 추적하지 않고
+백그라운드 스레드가 일정 간격으로 요청 처리중인 스레드의 스택만 수집한다.
+설정된 비율로 선택된 요청과 느린 요청만 수집해서 ring buffer에 보관한다.
+느린 요청(선택되지 않은 요청)은 SLOW_MS 가 지난 뒤의 스택만 수집된다.
+
+    SAMPLING_PROFILER = {
+        "RATE": 0.01,  # 기록할 요청 비율
+        "SLOW_MS": 500,  # 이보다 느린 요청은 항상 기록(이후 스택부터 수집)
+        "INTERVAL": 0.005,  # 스택 수집 간격(초)
+        "BUFFER_SIZE": 100,  # 보관할 프로파일 수
+        "TOP": 20,  # 프로파일별 보관할 스택 수
+    }
+
+스택은 flamegraph 도구에서 사용하는 collapsed 형식("a;b;c")으로 저장된다.
+스레드 단위로 수집하므로 WSGI(동기 뷰) 기준이다.
+"""
+
+__all__ = [
+    "SamplingProfilerMiddleware",
+    "get_profiles",
+    "clear_profiles",
+]
+
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "RATE": 0.01,
+    "SLOW_MS": 500,
+    "INTERVAL": 0.005,
+    "BUFFER_SIZE": 100,
+    "TOP": 20,
+    "MAX_DEPTH": 64,
+}
+
+_profiles = deque(maxlen=DEFAULTS["BUFFER_SIZE"])
+
+
+def get_profiles() -> list:
+    """보관중인 프로파일(오래된 순)"""
+    return list(_profiles)
+
+
+def clear_profiles() -> None:
+    _profiles.clear()
+
+
+def collapse_stack(frame, max_depth=DEFAULTS["MAX_DEPTH"]) -> str:
+    """프레임을 "모듈.함수:라인" 을 ;로 연결한 문자열(바깥 → 안쪽)로 변환"""
+    names = []
+    while frame is not None and len(names) < max_depth:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}.{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """요청 스레드의 스택을 주기적으로 수집하는 백그라운드 스레드
+
+    track() 한 요청은 바로, watch() 한 요청은 delay 초가 지난 뒤부터 수집한다.
+    watch() / unwatch() 는 lock 없이 dict 에 등록/삭제만 하므로
+    선택되지 않은 요청의 비용은 dict 연산 2회이다.
+    수집할 요청이 없으면 sys._current_frames() 를 호출하지 않는다.
+    """
+
+    idle_timeout = 1.0
+
+    def __init__(self, interval: float, max_depth: int, delay: float = 0):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.delay = delay
+        # 수집 시작 전 요청(watch) 확인 간격. delay 의 1/10 오차로 수집을 시작한다
+        self.check_interval = max(interval, delay / 10)
+        self._active = {}  # thread ident: Counter
+        self._pending = {}  # thread ident: (수집 시작 시각, Counter)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sampling-profiler", daemon=True
+                )
+                self._thread.start()
+
+    def track(self, ident: int) -> Counter:
+        counter = Counter()
+        with self._lock:
+            self._active[ident] = counter
+        if self._thread is None:
+            self._start()
+        return counter
+
+    def untrack(self, ident: int) -> None:
+        with self._lock:
+            self._active.pop(ident, None)
+
+    def watch(self, ident: int) -> Counter:
+        counter = Counter()
+        self._pending[ident] = (time.monotonic() + self.delay, counter)
+        if self._thread is None:
+            self._start()
+        return counter
+
+    def unwatch(self, ident: int) -> None:
+        # 이미 수집을 시작한 요청이면 수집 중단
+        if self._pending.pop(ident, None) is None:
+            self.untrack(ident)
+
+    def _promote(self, now: float) -> None:
+        """수집 시작 시각이 지난 요청을 수집 대상으로 옮긴다"""
+        for ident, (start_at, _) in tuple(self._pending.items()):
+            if start_at <= now:
+                with self._lock:
+                    entry = self._pending.pop(ident, None)
+                    if entry is not None:
+                        self._active[ident] = entry[1]
+
+    def _run(self) -> None:
+        idle_since = time.monotonic()
+        while True:
+            time.sleep(self.interval if self._active else self.check_interval)
+            now = time.monotonic()
+            if self._pending:
+                self._promote(now)
+                idle_since = now
+
+            if not self._active:
+                if now - idle_since > self.idle_timeout:
+                    # 요청이 없는 상태가 계속되면 종료(다음 요청에서 다시 시작)
+                    with self._lock:
+                        self._thread = None
+                    # 종료하는 사이에 등록된 요청이 있으면 다시 시작
+                    if self._pending or self._active:
+                        self._start()
+                    return
+                continue
+
+            idle_since = now
+            frames = sys._current_frames()
+            # untrack 이후에는 카운터가 변경되지 않도록 lock 안에서 기록
+            with self._lock:
+                for ident, counter in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        counter[collapse_stack(frame, self.max_depth)] += 1
+            del frames
+
+
+class SamplingProfilerMiddleware:
+    """요청 일부 + 느린 요청의 스택 샘플을 ring buffer에 기록하는 미들웨어
+
+    가장 바깥쪽(MIDDLEWARE 첫번째)에 두어야 전체 처리시간이 측정된다.
+    RATE 로 선택된 요청은 처음부터, 그 외 요청은 SLOW_MS 가 지난 뒤부터 스택을 수집한다.
+    """
+
+    def __init__(self, get_response):
+        global _profiles
+
+        self.get_response = get_response
+        self.options = {**DEFAULTS, **getattr(settings, "SAMPLING_PROFILER", {})}
+
+        if _profiles.maxlen != self.options["BUFFER_SIZE"]:
+            _profiles = deque(_profiles, maxlen=self.options["BUFFER_SIZE"])
+        self.sampler = StackSampler(
+            self.options["INTERVAL"],
+            self.options["MAX_DEPTH"],
+            delay=self.options["SLOW_MS"] / 1000,
+        )
+
+    def __call__(self, request):
+        sampled = random.random() < self.options["RATE"]
+        ident = threading.get_ident()
+        if sampled:
+            counter = self.sampler.track(ident)
+        else:
+            counter = self.sampler.watch(ident)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            if sampled:
+                self.sampler.untrack(ident)
+            else:
+                self.sampler.unwatch(ident)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        slow = duration_ms >= self.options["SLOW_MS"]
+        if sampled or slow:
+            self.record(request, response, duration_ms, counter, slow)
+        return response
+
+    def record(self, request, response, duration_ms, counter, slow) -> None:
+        profile = {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "status": response.status_code,
+            "duration_ms": round(duration_ms, 2),
+            "reason": "slow" if slow else "sample",
+            "created_at": timezone.now().isoformat(),
+            "samples": sum(counter.values()),
+            "stacks": counter.most_common(self.options["TOP"]),
+        }
+        _profiles.append(profile)
+
+        if slow:
+            logger.warning(
+                f"느린 요청 {profile['method']} {profile['path']} "
+                f"{profile['duration_ms']}ms (샘플 {profile['samples']}개)"
+            )
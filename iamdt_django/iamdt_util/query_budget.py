@@ -0,0 +1,214 @@
+"""
+N+1 쿼리 탐지/뷰별 쿼리 예산 모듈
+
+요청 하나에서 실행된 SQL을 정규화한 템플릿(값, IN 목록 제거)으로 묶어
+같은 템플릿이 REPEAT_THRESHOLD 번 이상 실행되면 N+1로 보고 실행 위치(프로젝트 코드)를 남긴다.
+뷰 클래스에 query_budget 을 지정하면 요청의 쿼리 수가 예산을 넘는지 확인한다.
+
+    class MedicalServiceList(...):
+        query_budget = 4  # 모든 메소드
+        query_budget = {"GET": 4, "POST": 12}  # 메소드별(지정 안한 메소드는 확인 안함)
+
+    QUERY_BUDGET = {
+        "REPEAT_THRESHOLD": 3,  # 같은 템플릿 쿼리가 이 횟수 이상이면 N+1
+        "RAISE": False,  # 위반시 예외. False면 WARNING 로그
+    }
+
+- QueryBudgetMiddleware는 silk 보다 안쪽(마지막)에 둔다.
+  세션/유저 조회처럼 뷰에서 처음 평가되는 쿼리는 포함된다. silk 분석/기록 쿼리는 제외한다.
+- 테스트는 QueryBudgetTestRunner(TEST_RUNNER)가 RAISE를 켜므로 위반하면 실패한다.
+- 테스트 코드에서는 QueryBudgetTestMixin.assertQueryBudget 으로 직접 확인한다.
+"""
+
+__all__ = [
+    "QueryBudgetExceeded",
+    "QueryBudgetMiddleware",
+    "QueryBudgetTestMixin",
+    "QueryBudgetTestRunner",
+    "QueryInspector",
+    "normalize_sql",
+]
+
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.test.runner import DiscoverRunner
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {"REPEAT_THRESHOLD": 3, "RAISE": False}
+
+# 위치를 기록할 쿼리 수(템플릿별)
+MAX_LOCATIONS = 3
+
+
+def get_options() -> dict:
+    return {**DEFAULTS, **getattr(settings, "QUERY_BUDGET", {})}
+
+
+class QueryBudgetExceeded(AssertionError):
+    """N+1 쿼리 혹은 쿼리 예산 초과(RAISE 설정시)"""
+
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """값을 ?로 바꾸고 IN (?, ?, ...) 목록을 (...)로 묶은 템플릿"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _IN_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+_PROJECT_DIR = str(Path(settings.BASE_DIR).resolve())
+
+# 쿼리를 실행하지 않고 요청을 감싸기만 하는 모듈
+_SKIP_MODULES = {__name__, "iamdt_util.metrics", "iamdt_util.profiling"}
+
+
+def _location(frame) -> str:
+    """쿼리를 실행한 가장 안쪽 프로젝트 코드 "모듈.함수:라인"
+
+    execute_wrapper(다른 wrapper 포함) 프레임과 미들웨어는 건너뛴다.
+    프로젝트 코드가 없으면(admin 등) django.db 밖의 가장 안쪽 프레임.
+    """
+    while frame is not None and frame.f_code.co_name != "_execute_with_wrappers":
+        frame = frame.f_back
+    caller = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        if caller is None and not module.startswith("django.db"):
+            caller = frame
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(_PROJECT_DIR)
+            and "site-packages" not in filename
+            and module not in _SKIP_MODULES
+        ):
+            caller = frame
+            break
+        frame = frame.f_back
+    if caller is None:
+        return "?"
+    module = caller.f_globals.get("__name__", "?")
+    return f"{module}.{caller.f_code.co_name}:{caller.f_lineno}"
+
+
+class QueryInspector:
+    """connection.execute_wrapper 로 쿼리를 템플릿별로 모은다
+
+    with QueryInspector() as inspector:
+        ...
+    inspector.count, inspector.repeated()
+    """
+
+    def __init__(self, using: str = "default"):
+        self.using = using
+        self.templates = Counter()
+        self.locations = {}
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.startswith("EXPLAIN") or '"silk_' in sql:  # silk 분석/기록 쿼리
+            return execute(sql, params, many, context)
+        template = normalize_sql(sql)
+        self.templates[template] += 1
+        locations = self.locations.setdefault(template, Counter())
+        if len(locations) < MAX_LOCATIONS:
+            locations[_location(sys._getframe(1))] += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._wrapper = connections[self.using].execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+
+    @property
+    def count(self) -> int:
+        return sum(self.templates.values())
+
+    def repeated(self, threshold: int = None) -> list:
+        """N+1 의심 쿼리 [(템플릿, 횟수, [위치, ...]), ...] 많은 순"""
+        if threshold is None:
+            threshold = get_options()["REPEAT_THRESHOLD"]
+        return [
+            (template, count, list(self.locations[template]))
+            for template, count in self.templates.most_common()
+            if count >= threshold
+        ]
+
+    def problems(self, budget: int = None, threshold: int = None) -> list:
+        """위반 내용 메시지 목록"""
+        problems = [
+            f"N+1 쿼리 {count}회: {template} (위치: {', '.join(locations)})"
+            for template, count, locations in self.repeated(threshold)
+        ]
+        if budget is not None and self.count > budget:
+            problems.append(f"쿼리 예산 초과: {self.count}회 (예산 {budget}회)")
+        return problems
+
+
+def view_budget(view_class, method: str):
+    """뷰 클래스의 query_budget (없으면 None)"""
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method)
+    return budget
+
+
+class QueryBudgetMiddleware:
+    """요청별 N+1 쿼리 탐지, 뷰 쿼리 예산 확인 미들웨어"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryInspector() as inspector:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        view_class = getattr(match.func, "view_class", None) if match else None
+        budget = view_budget(view_class, request.method)
+        problems = inspector.problems(budget)
+        if problems:
+            message = f"{request.method} {request.path} ({match and match.view_name})"
+            message = "\n  ".join([message, *problems])
+            if get_options()["RAISE"]:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+class QueryBudgetTestMixin:
+    """테스트 케이스용 쿼리 예산 확인"""
+
+    @contextmanager
+    def assertQueryBudget(self, budget: int = None, threshold: int = None):
+        """블록 안의 쿼리가 N+1 없이 예산 안에서 실행되는지 확인"""
+        with QueryInspector() as inspector:
+            yield inspector
+        problems = inspector.problems(budget, threshold)
+        if problems:
+            self.fail("\n  ".join(problems))
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    """테스트 중에는 위반시 예외를 발생시켜 테스트를 실패시킨다"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.QUERY_BUDGET = {**get_options(), "RAISE": True}
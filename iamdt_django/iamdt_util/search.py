@@ -0,0 +1,173 @@
+"""
+검색 인덱스 모듈
+
+SQLite FTS5 가상 테이블을 검색 인덱스로 사용한다.
+한글 이름도 부분 검색이 되도록 문자열을 1글자/2글자(n-gram) 토큰으로 나눠서 저장하고
+모델 저장/삭제 시그널에서 인덱스를 갱신한다.
+
+settings.SEARCH_BACKEND 가 "icontains" 이거나 DB가 SQLite가 아니면
+검색 인덱스를 사용하지 않는다(기존 icontains 검색).
+"""
+
+__all__ = [
+    "SEARCH_INDEXES",
+    "search_enabled",
+    "search_sql",
+    "update_search_index",
+    "delete_search_index",
+    "rebuild_search_index",
+    "bulk_add_search_index",
+]
+
+import re
+
+from django.conf import settings
+from django.db import connections
+
+# 모델 라벨: (인덱스 테이블, 검색 필드)
+# 테이블은 iamdt 0003 마이그레이션에서 생성된다.
+SEARCH_INDEXES = {
+    "iamdt.customer": ("iamdt_customer_search", ["name", "phone"]),
+    "iamdt.patient": ("iamdt_patient_search", ["name"]),
+    "iamdt.user": ("iamdt_user_search", ["username", "phone"]),
+}
+
+_NOT_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(value) -> str:
+    """공백/특수문자(전화번호의 - 등)를 제거하고 소문자로 변환"""
+    return _NOT_WORD.sub("", str(value)).lower()
+
+
+def unigrams(text: str) -> str:
+    """1글자 토큰"""
+    return " ".join(text)
+
+
+def bigrams(text: str) -> str:
+    """2글자 토큰"""
+    return " ".join(text[i : i + 2] for i in range(len(text) - 1))
+
+
+def search_enabled(using="default") -> bool:
+    """검색 인덱스 사용 여부"""
+    backend = getattr(settings, "SEARCH_BACKEND", "fts5")
+    return backend == "fts5" and connections[using].vendor == "sqlite"
+
+
+def search_sql(model, field: str, value, using="default"):
+    """검색 인덱스에서 pk를 찾는 (sql, params) 반환
+
+    인덱스를 사용할 수 없는 경우 None을 반환한다.
+    2글자 이상은 연속된 2글자 토큰을 phrase로 찾고 1글자는 1글자 토큰으로 찾는다.
+    """
+    index = SEARCH_INDEXES.get(model._meta.label_lower)
+    if not index or field not in index[1] or not search_enabled(using):
+        return None
+
+    text = normalize(value)
+    if not text:
+        return None
+
+    if len(text) == 1:
+        query = f'{field}_chars : "{text}"'
+    else:
+        query = f'{field}_grams : "{bigrams(text)}"'
+
+    table = index[0]
+    return f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [query]
+
+
+def _columns(fields) -> list:
+    columns = []
+    for field in fields:
+        columns += [f"{field}_grams", f"{field}_chars"]
+    return columns
+
+
+def _values(instance, fields) -> list:
+    values = []
+    for field in fields:
+        text = normalize(getattr(instance, field))
+        values += [bigrams(text), unigrams(text)]
+    return values
+
+
+def update_search_index(instance, using="default", update_fields=None) -> None:
+    """post_save 시그널에서 호출. 인스턴스의 검색 인덱스를 갱신한다"""
+    index = SEARCH_INDEXES.get(instance._meta.label_lower)
+    if not index or not search_enabled(using):
+        return
+
+    table, fields = index
+    # 검색 필드가 바뀌지 않은 저장(로그인시 last_login 등)은 무시
+    if update_fields is not None and not set(update_fields) & set(fields):
+        return
+
+    columns = ", ".join(_columns(fields))
+    marks = ", ".join(["%s"] * len(fields) * 2)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+        cursor.execute(
+            f"INSERT INTO {table}(rowid, {columns}) VALUES (%s, {marks})",
+            [instance.pk] + _values(instance, fields),
+        )
+
+
+def delete_search_index(instance, using="default") -> None:
+    """post_delete 시그널에서 호출. 인스턴스의 검색 인덱스를 삭제한다"""
+    index = SEARCH_INDEXES.get(instance._meta.label_lower)
+    if not index or not search_enabled(using):
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {index[0]} WHERE rowid = %s", [instance.pk])
+
+
+def rebuild_search_index(model, using="default", batch_size=1000) -> int:
+    """모델 전체의 검색 인덱스를 다시 만든다"""
+    index = SEARCH_INDEXES.get(model._meta.label_lower)
+    if not index or not search_enabled(using):
+        return 0
+
+    table, fields = index
+    columns = ", ".join(_columns(fields))
+    marks = ", ".join(["%s"] * len(fields) * 2)
+    sql = f"INSERT INTO {table}(rowid, {columns}) VALUES (%s, {marks})"
+
+    count = 0
+    rows = []
+    queryset = model._default_manager.using(using).only("pk", *fields)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table}")
+        for obj in queryset.iterator(chunk_size=batch_size):
+            rows.append([obj.pk] + _values(obj, fields))
+            if len(rows) >= batch_size:
+                cursor.executemany(sql, rows)
+                count += len(rows)
+                rows = []
+        if rows:
+            cursor.executemany(sql, rows)
+            count += len(rows)
+    return count
+
+
+def bulk_add_search_index(objs, using="default") -> int:
+    """bulk_create 로 등록한(시그널 없음) 객체들의 검색 인덱스 추가"""
+    objs = list(objs)
+    if not objs:
+        return 0
+    index = SEARCH_INDEXES.get(objs[0]._meta.label_lower)
+    if not index or not search_enabled(using):
+        return 0
+
+    table, fields = index
+    columns = ", ".join(_columns(fields))
+    marks = ", ".join(["%s"] * len(fields) * 2)
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table}(rowid, {columns}) VALUES (%s, {marks})",
+            [[obj.pk] + _values(obj, fields) for obj in objs],
+        )
+    return len(objs)
@@ -0,0 +1,40 @@
+"""
+캐시 세션 엔진 모듈
+
+    SESSION_ENGINE = "iamdt_util.session"
+
+django.contrib.sessions.backends.cached_db 와 같이 저장시 캐시와 DB(django_session)에 함께 쓰고(write-through)
+읽을 때는 캐시를 먼저 조회한다. 캐시에 없을 때만 DB를 읽어 캐시를 채운다.
+캐시 조회 hit/miss를 session_stats()로 확인할 수 있다.
+
+SESSION_CACHE_ALIAS 캐시가 프로세스 메모리(LocMemCache)이면 여러 프로세스로 실행시
+로그아웃한 세션이 다른 프로세스 캐시에 남는다. 여러 프로세스로 실행하는 경우 공유 캐시를 지정해야 한다.
+"""
+
+__all__ = ["SessionStore", "session_stats"]
+
+from django.contrib.sessions.backends import cached_db
+
+from iamdt_util.cache import HitCounter
+
+_counter = HitCounter("session")
+
+
+class SessionStore(cached_db.SessionStore):
+    """hit/miss를 세는 cached_db 세션"""
+
+    def load(self):
+        try:
+            data = self._cache.get(self.cache_key)
+        except Exception:
+            data = None  # 잘못된 캐시 키(cached_db와 같이 DB 조회)
+
+        _counter.count(data is not None)
+        if data is not None:
+            return data
+        return super().load()
+
+
+def session_stats() -> dict:
+    """현재 프로세스의 세션 캐시 hit/miss 카운터"""
+    return _counter.stats()
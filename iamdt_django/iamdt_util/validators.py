@@ -6,3 +6,8 @@ from django.core.validators import RegexValidator
 phone_validator = RegexValidator(
     regex=r"^01([0|1|6|7|8|9]?)-?([0-9]{3,4})-?([0-9]{4})$"
 )
+
+
+def normalize_phone(value) -> str:
+    """연락처에서 숫자만 남긴다(010-1234-5678 -> 01012345678)"""
+    return "".join(char for char in str(value or "") if char.isdigit())